@@ -0,0 +1,38 @@
+import {
+  LitElement,
+  html,
+} from 'https://cdn.jsdelivr.net/gh/lit/dist@3/core/lit-core.min.js';
+
+class EventStream extends LitElement {
+  static properties = {
+    updateEvent: {type: String},
+    url: {type: String},
+  };
+
+  render() {
+    return html`<div></div>`;
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    // EventSource reconnects on its own and resumes from the last event id.
+    this.source = new EventSource(this.url);
+    this.source.onmessage = (e) => {
+      this.dispatchEvent(
+        new MesopEvent(this.updateEvent, {
+          update: e.data,
+        }),
+      );
+    };
+  }
+
+  disconnectedCallback() {
+    if (this.source) {
+      this.source.close();
+      this.source = null;
+    }
+    super.disconnectedCallback();
+  }
+}
+
+customElements.define('event-stream-component', EventStream);
@@ -0,0 +1,33 @@
+from collections.abc import Callable
+from typing import Any
+
+import mesop.labs as mel
+
+
+@mel.web_component(path='./event_stream.js')
+def event_stream(
+    *,
+    update_event: Callable[[mel.WebEvent], Any],
+    cursor: str = '',
+    key: str | None = None,
+):
+    """Creates an invisible component that subscribes to server pushed updates.
+
+    The component opens an EventSource on the ConversationServer push channel
+    and fires `update_event` with the raw update payload for every change, so
+    the app state is refreshed as soon as something happens instead of on a
+    polling interval.
+
+    Returns:
+      The web component that was created.
+    """
+    return mel.insert_web_component(
+        name='event-stream-component',
+        key=key,
+        events={
+            'updateEvent': update_event,
+        },
+        properties={
+            'url': f'/events/stream?cursor={cursor}',
+        },
+    )
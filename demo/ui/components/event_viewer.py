@@ -1,9 +1,7 @@
-import asyncio
-
 import mesop as me
 import pandas as pd
 
-from state.host_agent_service import GetEvents, convert_event_to_state
+from state.state import AppState
 
 
 def flatten_content(content: list[tuple[str, str]]) -> str:
@@ -27,9 +25,8 @@ def event_list():
         'Id': [],
         'Content': [],
     }
-    events = asyncio.run(GetEvents())
-    for e in events:
-        event = convert_event_to_state(e)
+    # Events are merged incrementally into the app state by UpdateAppState.
+    for event in me.state(AppState).events:
         df_data['Conversation ID'].append(event.context_id)
         df_data['Role'].append(event.role)
         df_data['Id'].append(event.id)
@@ -1,7 +1,11 @@
 import mesop as me
 import mesop.labs as mel
 
-from state.host_agent_service import UpdateAppState
+from state.host_agent_service import (
+    ApplyStreamUpdate,
+    UpdateAppState,
+    UpdateConversationMessages,
+)
 from state.state import AppState
 from styles.styles import (
     MAIN_COLUMN_STYLE,
@@ -12,6 +16,7 @@ from styles.styles import (
 )
 
 from .async_poller import AsyncAction, async_poller
+from .event_stream import event_stream
 from .side_nav import sidenav
 
 
@@ -23,18 +28,35 @@ async def refresh_app_state(e: mel.WebEvent):  # pylint: disable=unused-argument
     yield
 
 
+async def apply_stream_update(e: mel.WebEvent):
+    """Pushed app state update event handler"""
+    app_state = me.state(AppState)
+    conversation_id = app_state.current_conversation_id
+    if conversation_id and app_state.synced_conversation_id != conversation_id:
+        # Pushed messages are deltas, load the full history once first.
+        await UpdateConversationMessages(app_state, conversation_id)
+    ApplyStreamUpdate(app_state, e.value['update'])
+    yield
+
+
 @me.content_component
 def page_scaffold():
     """Page scaffold component"""
     app_state = me.state(AppState)
-    action = (
-        AsyncAction(
-            value=app_state, duration_seconds=app_state.polling_interval
+    if app_state.live_updates:
+        event_stream(
+            update_event=apply_stream_update,
+            cursor=app_state.stream_cursor,
+        )
+    else:
+        action = (
+            AsyncAction(
+                value=app_state, duration_seconds=app_state.polling_interval
+            )
+            if app_state
+            else None
         )
-        if app_state
-        else None
-    )
-    async_poller(action=action, trigger_event=refresh_app_state)
+        async_poller(action=action, trigger_event=refresh_app_state)
 
     sidenav('')
 
@@ -21,9 +21,11 @@ from pages.event_list import event_list_page
 from pages.home import home_page_content
 from pages.settings import settings_page_content
 from pages.task_list import task_list_page
+from service.client.client import shared_client_pool
 from service.server.server import ConversationServer
 from state import host_agent_service
 from state.state import AppState
+from utils.agent_card import agent_card_resolver
 
 
 load_dotenv()
@@ -165,8 +167,10 @@ agent_server = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global agent_server
     httpx_client_wrapper.start()
-    ConversationServer(app, httpx_client_wrapper())
+    shared_client_pool.start()
+    agent_server = ConversationServer(app, httpx_client_wrapper())
     app.openapi_schema = None
     app.mount(
         '/',
@@ -178,6 +182,9 @@ async def lifespan(app: FastAPI):
     )
     app.setup()
     yield
+    await agent_server.shutdown()
+    await agent_card_resolver.stop()
+    await shared_client_pool.stop()
     await httpx_client_wrapper.stop()
 
 
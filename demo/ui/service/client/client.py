@@ -1,4 +1,7 @@
+import asyncio
 import json
+import os
+import threading
 
 from typing import Any
 
@@ -29,9 +32,105 @@ from service.types import (
 )
 
 
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30
+)
+
+
+class HTTPClientPool:
+    """Runs requests on one long-lived, connection pooled client.
+
+    httpx clients are bound to the event loop they are used on, and Mesop
+    runs every event handler on a new loop. The client therefore lives on a
+    dedicated loop in a background thread, and requests made from any loop
+    are run there, so they all share its keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.limits = limits
+        self.timeout = timeout
+        # Requires the `h2` package, e.g. `pip install httpx[http2]`.
+        self.http2 = http2
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='http-client-pool',
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Sends a request with the pooled client and returns the response.
+
+        The response body is read before it is returned.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(method, url, **kwargs), self._get_loop()
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                transport=self.transport,
+            )
+        return await self._client.request(method, url, **kwargs)
+
+    async def _close_client(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def start(self):
+        """Starts the loop of the client. Call on startup."""
+        self._get_loop()
+
+    async def stop(self):
+        """Closes the client and stops its loop. Call on shutdown."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._close_client(), loop)
+        )
+        loop.call_soon_threadsafe(loop.stop)
+        await asyncio.to_thread(thread.join)
+        loop.close()
+
+
+shared_client_pool = HTTPClientPool(
+    http2=os.environ.get('A2A_UI_HTTP2', '').lower() == 'true'
+)
+
+
 class ConversationClient:
-    def __init__(self, base_url):
+    def __init__(
+        self, base_url, http_client_pool: HTTPClientPool = shared_client_pool
+    ):
         self.base_url = base_url.rstrip('/')
+        self.http_client_pool = http_client_pool
 
     async def send_message(
         self, payload: SendMessageRequest
@@ -39,22 +138,20 @@ class ConversationClient:
         return SendMessageResponse(**await self._send_request(payload))
 
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.base_url + '/' + request.method,
-                    json=request.model_dump(mode='json', exclude_none=True),
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                print('http error', e)
-                raise AgentClientHTTPError(
-                    e.response.status_code, str(e)
-                ) from e
-            except json.JSONDecodeError as e:
-                print('decode error', e)
-                raise AgentClientJSONError(str(e)) from e
+        try:
+            response = await self.http_client_pool.request(
+                'POST',
+                self.base_url + '/' + request.method,
+                json=request.model_dump(mode='json', exclude_none=True),
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            print('http error', e)
+            raise AgentClientHTTPError(e.response.status_code, str(e)) from e
+        except json.JSONDecodeError as e:
+            print('decode error', e)
+            raise AgentClientJSONError(str(e)) from e
 
     async def create_conversation(
         self, payload: CreateConversationRequest
@@ -33,9 +33,15 @@ from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 from host_agent import HostAgent
 from remote_agent_connection import TaskCallbackArg
-from utils.agent_card import get_agent_card
+from utils.agent_card import (
+    agent_card_resolver,
+    get_agent_card,
+    normalize_address,
+)
 
 from service.server.application_manager import ApplicationManager
+from service.server.artifact_buffer import ArtifactAssemblyBuffer
+from service.server.store import ApplicationStore
 from service.types import Conversation, Event
 
 
@@ -53,17 +59,18 @@ class ADKHostManager(ApplicationManager):
         api_key: str = '',
         uses_vertex_ai: bool = False,
     ):
-        self._conversations: list[Conversation] = []
-        self._messages: list[Message] = []
-        self._tasks: list[Task] = []
-        self._events: dict[str, Event] = {}
+        self._store = ApplicationStore()
         self._pending_message_ids: list[str] = []
         self._agents: list[AgentCard] = []
-        self._artifact_chunks: dict[str, list[Artifact]] = {}
+        # Registered address -> index of its card in _agents
+        self._agent_urls: dict[str, int] = {}
+        self._artifact_buffer = ArtifactAssemblyBuffer()
+        self._artifact_sweep: asyncio.Task | None = None
         self._session_service = InMemorySessionService()
         self._artifact_service = InMemoryArtifactService()
         self._memory_service = InMemoryMemoryService()
         self._host_agent = HostAgent([], http_client, self.task_callback)
+        agent_card_resolver.add_listener(self._update_agent_card)
         self._context_to_conversation: dict[str, str] = {}
         self.user_id = 'test_user'
         self.app_name = 'A2A'
@@ -92,6 +99,9 @@ class ADKHostManager(ApplicationManager):
         ] = {}  # dict[str, str]: previous message to next message
 
     def _initialize_host(self):
+        # The host agent renders its instruction and agent list on every
+        # model call, so the Runner only needs rebuilding when the model
+        # configuration changes, not when agents are registered.
         agent = self._host_agent.create_agent()
         self._host_runner = Runner(
             app_name=self.app_name,
@@ -107,7 +117,7 @@ class ADKHostManager(ApplicationManager):
         )
         conversation_id = session.id
         c = Conversation(conversation_id=conversation_id, is_active=True)
-        self._conversations.append(c)
+        self._store.add_conversation(c)
         return c
 
     def update_api_key(self, api_key: str):
@@ -125,20 +135,12 @@ class ADKHostManager(ApplicationManager):
                 self._task_map = {}
 
     def sanitize_message(self, message: Message) -> Message:
-        if message.context_id:
-            conversation = self.get_conversation(message.context_id)
-            if not conversation:
-                return message
-            # Check if the last event in the conversation was tied to a task.
-            if conversation.messages:
-                task_id = conversation.messages[-1].task_id
-                if task_id and task_still_open(
-                    next(
-                        filter(lambda x: x and x.id == task_id, self._tasks),
-                        None,
-                    )
-                ):
-                    message.task_id = task_id
+        # Check if the last event in the conversation was tied to a task.
+        last_message = self._store.last_message(message.context_id)
+        if last_message:
+            task_id = last_message.task_id
+            if task_id and task_still_open(self._store.get_task(task_id)):
+                message.task_id = task_id
         return message
 
     async def process_message(self, message: Message):
@@ -146,10 +148,7 @@ class ADKHostManager(ApplicationManager):
         if message_id:
             self._pending_message_ids.append(message_id)
         context_id = message.context_id
-        conversation = self.get_conversation(context_id)
-        self._messages.append(message)
-        if conversation:
-            conversation.messages.append(message)
+        self._store.add_message(message)
         self.add_event(
             Event(
                 id=str(uuid.uuid4()),
@@ -212,20 +211,14 @@ class ADKHostManager(ApplicationManager):
             response = await self.adk_content_to_message(
                 final_event.content, context_id, task_id
             )
-            self._messages.append(response)
-
-        if conversation and response:
-            conversation.messages.append(response)
+            self._store.add_message(response)
         self._pending_message_ids.remove(message_id)
 
     def add_task(self, task: Task):
-        self._tasks.append(task)
+        self._store.add_task(task)
 
     def update_task(self, task: Task):
-        for i, t in enumerate(self._tasks):
-            if t.id == task.id:
-                self._tasks[i] = task
-                return
+        self._store.update_task(task)
 
     def task_callback(self, task: TaskCallbackArg, agent_card: AgentCard):
         self.emit_event(task, agent_card)
@@ -234,6 +227,7 @@ class ADKHostManager(ApplicationManager):
             current_task.status = task.status
             self.attach_message_to_task(task.status.message, current_task.id)
             self.insert_message_history(current_task, task.status.message)
+            self.finish_artifacts(current_task)
             self.update_task(current_task)
             return current_task
         if isinstance(task, TaskArtifactUpdateEvent):
@@ -242,11 +236,12 @@ class ADKHostManager(ApplicationManager):
             self.update_task(current_task)
             return current_task
         # Otherwise this is a Task, either new or updated
-        if not any(filter(lambda x: x and x.id == task.id, self._tasks)):
+        if not self._store.has_task(task.id):
             self.attach_message_to_task(task.status.message, task.id)
             self.add_task(task)
             return task
         self.attach_message_to_task(task.status.message, task.id)
+        self.finish_artifacts(task)
         self.update_task(task)
         return task
 
@@ -340,9 +335,7 @@ class ADKHostManager(ApplicationManager):
             task_id = event.task_id
         if not task_id:
             task_id = str(uuid.uuid4())
-        current_task = next(
-            filter(lambda x: x.id == task_id, self._tasks), None
-        )
+        current_task = self._store.get_task(task_id)
         if not current_task:
             context_id = event.context_id
             current_task = Task(
@@ -360,61 +353,60 @@ class ADKHostManager(ApplicationManager):
     def process_artifact_event(
         self, current_task: Task, task_update_event: TaskArtifactUpdateEvent
     ):
-        artifact = task_update_event.artifact
-        if not task_update_event.append:
-            # received the first chunk or entire payload for an artifact
-            if (
-                task_update_event.last_chunk is None
-                or task_update_event.last_chunk
-            ):
-                # last_chunk bit is missing or is set to true, so this is the entire payload
-                # add this to artifacts
-                if not current_task.artifacts:
-                    current_task.artifacts = []
-                current_task.artifacts.append(artifact)
-            else:
-                # this is a chunk of an artifact, stash it in temp store for assembling
-                if artifact.artifact_id not in self._artifact_chunks:
-                    self._artifact_chunks[artifact.artifact_id] = []
-                self._artifact_chunks[artifact.artifact_id].append(artifact)
-        else:
-            # we received an append chunk, add to the existing temp artifact
-            current_temp_artifact = self._artifact_chunks[artifact.artifact_id][
-                -1
-            ]
-            # TODO handle if current_temp_artifact is missing
-            current_temp_artifact.parts.extend(artifact.parts)
-            if task_update_event.last_chunk:
-                if current_task.artifacts:
-                    current_task.artifacts.append(current_temp_artifact)
-                else:
-                    current_task.artifacts = [current_temp_artifact]
-                del self._artifact_chunks[artifact.artifact_id][-1]
+        # Chunks are assembled in the buffer, which hands back the complete
+        # artifact on the last chunk and periodic partial snapshots before.
+        artifact = self._artifact_buffer.add(current_task.id, task_update_event)
+        self._start_artifact_sweep()
+        if artifact:
+            self.publish_artifact(current_task, artifact)
+
+    def publish_artifact(self, task: Task, artifact: Artifact):
+        if not task.artifacts:
+            task.artifacts = []
+        for i, existing in enumerate(task.artifacts):
+            if existing.artifact_id == artifact.artifact_id:
+                # Replace the snapshot published while streaming, or an
+                # earlier version of the artifact.
+                task.artifacts[i] = artifact
+                return
+        task.artifacts.append(artifact)
+
+    def finish_artifacts(self, task: Task):
+        """Releases the buffered artifacts of a task that has ended."""
+        if task_still_open(task):
+            return
+        for artifact in self._artifact_buffer.finish_task(task.id):
+            self.publish_artifact(task, artifact)
+
+    def _start_artifact_sweep(self):
+        if self._artifact_sweep is None or self._artifact_sweep.done():
+            self._artifact_sweep = asyncio.create_task(self._sweep_artifacts())
+
+    async def _sweep_artifacts(self):
+        # Runs while anything is buffered, so that streams which stop
+        # sending are expired without waiting for another chunk.
+        while not self._artifact_buffer.empty():
+            await asyncio.sleep(self._artifact_buffer.sweep_interval)
+            for task_id, artifact in self._artifact_buffer.sweep():
+                task = self._store.get_task(task_id)
+                if task:
+                    self.publish_artifact(task, artifact)
+                    self.update_task(task)
 
     def add_event(self, event: Event):
-        self._events[event.id] = event
+        self._store.add_event(event)
 
     def get_conversation(
         self, conversation_id: str | None
     ) -> Conversation | None:
-        if not conversation_id:
-            return None
-        return next(
-            filter(
-                lambda c: c and c.conversation_id == conversation_id,
-                self._conversations,
-            ),
-            None,
-        )
+        return self._store.get_conversation(conversation_id)
 
     def get_pending_messages(self) -> list[tuple[str, str]]:
         rval = []
         for message_id in self._pending_message_ids:
             if message_id in self._task_map:
                 task_id = self._task_map[message_id]
-                task = next(
-                    filter(lambda x: x.id == task_id, self._tasks), None
-                )
+                task = self._store.get_task(task_id)
                 if not task:
                     rval.append((message_id, ''))
                 elif task.history and task.history[-1].parts:
@@ -434,14 +426,40 @@ class ADKHostManager(ApplicationManager):
                 rval.append((message_id, ''))
         return rval
 
-    def register_agent(self, url):
-        agent_data = get_agent_card(url)
+    async def register_agent(self, url):
+        agent_data = await get_agent_card(url)
         if not agent_data.url:
-            agent_data.url = url
+            # The resolver's card is shared, update a copy.
+            agent_data = agent_data.model_copy(update={'url': url})
+        self._agent_urls[url] = len(self._agents)
         self._agents.append(agent_data)
         self._host_agent.register_agent_card(agent_data)
-        # Now update the host agent definition
-        self._initialize_host()
+        agent_card_resolver.watch(url)
+        agent_card_resolver.start_refresh()
+
+    def _update_agent_card(self, url: str, agent_data: AgentCard):
+        """Replaces the card of a registered agent after it changed."""
+        for registered_url, index in self._agent_urls.items():
+            if normalize_address(registered_url) != url:
+                continue
+            if not agent_data.url:
+                agent_data = agent_data.model_copy(
+                    update={'url': registered_url}
+                )
+            old_name = self._agents[index].name
+            self._agents[index] = agent_data
+            if old_name != agent_data.name and all(
+                agent.name != old_name for agent in self._agents
+            ):
+                self._host_agent.unregister_agent_card(old_name)
+            self._host_agent.register_agent_card(agent_data)
+
+    def close(self):
+        """Releases what the manager registered globally. Call on shutdown."""
+        agent_card_resolver.remove_listener(self._update_agent_card)
+        if self._artifact_sweep:
+            self._artifact_sweep.cancel()
+            self._artifact_sweep = None
 
     @property
     def agents(self) -> list[AgentCard]:
@@ -449,15 +467,35 @@ class ADKHostManager(ApplicationManager):
 
     @property
     def conversations(self) -> list[Conversation]:
-        return self._conversations
+        return self._store.conversations
 
     @property
     def tasks(self) -> list[Task]:
-        return self._tasks
+        return self._store.tasks
 
     @property
     def events(self) -> list[Event]:
-        return sorted(self._events.values(), key=lambda x: x.timestamp)
+        return self._store.events
+
+    def events_since(self, cursor: int = 0) -> tuple[list[Event], int]:
+        return self._store.events_since(cursor)
+
+    def tasks_since(self, cursor: int = 0) -> tuple[list[Task], int]:
+        return self._store.tasks_since(cursor)
+
+    def conversations_since(
+        self, cursor: int = 0
+    ) -> tuple[list[Conversation], int]:
+        return self._store.conversations_since(cursor)
+
+    def messages_since(self, cursor: int = 0) -> tuple[list[Message], int]:
+        return self._store.messages_since(cursor)
+
+    def subscribe(self) -> asyncio.Event:
+        return self._store.changes.subscribe()
+
+    def unsubscribe(self, changed: asyncio.Event):
+        self._store.changes.unsubscribe(changed)
 
     def adk_content_from_message(self, message: Message) -> types.Content:
         parts: list[types.Part] = []
@@ -609,17 +647,6 @@ class ADKHostManager(ApplicationManager):
             )
         return parts
 
-    def process_message_threadsafe(
-        self, message: Message, loop: asyncio.AbstractEventLoop
-    ):
-        """Safely run process_message from a thread using the given event loop."""
-        future = asyncio.run_coroutine_threadsafe(
-            self.process_message(message), loop
-        )
-        return (
-            future  # You can call future.result() to get the result if needed
-        )
-
 
 def get_message_id(m: Message | None) -> str | None:
     if not m or not m.metadata or 'message_id' not in m.metadata:
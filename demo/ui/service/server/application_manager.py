@@ -1,3 +1,5 @@
+import asyncio
+
 from abc import ABC, abstractmethod
 
 from a2a.types import AgentCard, Message, Task
@@ -19,9 +21,13 @@ class ApplicationManager(ABC):
         pass
 
     @abstractmethod
-    def register_agent(self, url: str):
+    async def register_agent(self, url: str):
         pass
 
+    async def register_agents(self, urls: list[str]):
+        """Registers many agents, fetching their cards concurrently."""
+        await asyncio.gather(*(self.register_agent(url) for url in urls))
+
     @abstractmethod
     def get_pending_messages(self) -> list[tuple[str, str]]:
         pass
@@ -51,3 +57,29 @@ class ApplicationManager(ABC):
     @abstractmethod
     def events(self) -> list[Event]:
         pass
+
+    @abstractmethod
+    def events_since(self, cursor: int = 0) -> tuple[list[Event], int]:
+        pass
+
+    @abstractmethod
+    def tasks_since(self, cursor: int = 0) -> tuple[list[Task], int]:
+        pass
+
+    @abstractmethod
+    def conversations_since(
+        self, cursor: int = 0
+    ) -> tuple[list[Conversation], int]:
+        pass
+
+    @abstractmethod
+    def messages_since(self, cursor: int = 0) -> tuple[list[Message], int]:
+        pass
+
+    @abstractmethod
+    def subscribe(self) -> asyncio.Event:
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, changed: asyncio.Event):
+        pass
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import time
+
+from a2a.types import Artifact, Part, TaskArtifactUpdateEvent, TextPart
+
+
+class _PartialArtifact:
+    """An artifact being reassembled from streamed chunks.
+
+    Parts are appended in O(1). Consecutive plain TextParts are collected in
+    a run of strings that is joined only when a different kind of part
+    follows or when a snapshot is taken, so long text streams are not copied
+    on every chunk.
+    """
+
+    def __init__(self, artifact: Artifact, now: float):
+        self.artifact = artifact
+        self.parts: list[Part] = []
+        self.text_run: list[str] = []
+        self.size = 0
+        self.updated_at = now
+        # Publish the first chunk right away.
+        self.published_at = float('-inf')
+
+    @property
+    def published(self) -> bool:
+        return self.published_at > float('-inf')
+
+    def extend(self, parts: list[Part], now: float) -> int:
+        """Appends parts and returns the number of bytes they added."""
+        added = 0
+        for part in parts:
+            root = part.root
+            if root.kind == 'text' and not root.metadata:
+                self.text_run.append(root.text)
+                added += len(root.text)
+                continue
+            self._flush_text()
+            self.parts.append(part)
+            if root.kind == 'file':
+                added += len(getattr(root.file, 'bytes', '') or '')
+            elif root.kind == 'data':
+                added += len(json.dumps(root.data))
+            else:
+                added += len(root.text)
+        self.size += added
+        self.updated_at = now
+        return added
+
+    def _flush_text(self):
+        if self.text_run:
+            self.parts.append(Part(root=TextPart(text=''.join(self.text_run))))
+            self.text_run = []
+
+    def snapshot(self, partial: bool, incomplete: bool = False) -> Artifact:
+        parts = list(self.parts)
+        if self.text_run:
+            parts.append(Part(root=TextPart(text=''.join(self.text_run))))
+        metadata = dict(self.artifact.metadata or {})
+        if partial:
+            metadata['partial'] = True
+        else:
+            metadata.pop('partial', None)
+        if incomplete:
+            metadata['incomplete'] = True
+        return self.artifact.model_copy(
+            update={'parts': parts, 'metadata': metadata or None}
+        )
+
+
+class ArtifactAssemblyBuffer:
+    """Reassembles artifacts streamed in chunks, keyed by task and artifact id.
+
+    Each task may buffer at most `max_task_bytes` of partial artifacts; an
+    artifact that would exceed it is dropped until its last chunk arrives.
+    Partial artifacts that receive no chunk for `ttl_seconds` are expired.
+    While an artifact is streaming, a snapshot is published at most every
+    `publish_interval` seconds so the UI can show progress without
+    materializing the artifact on every chunk. A completed artifact whose
+    content hash matches the one published in the last `ttl_seconds`, e.g.
+    a redelivered event, is not published again.
+
+    A snapshot published for an artifact that is then dropped, expired or
+    left unfinished by its task is replaced by what was received, flagged
+    with `incomplete` metadata. Expiry happens lazily in `add` and in
+    `sweep`, which should be called every `sweep_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        max_task_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 300,
+        publish_interval: float = 0.5,
+    ):
+        self.max_task_bytes = max_task_bytes
+        self.ttl_seconds = ttl_seconds
+        self.publish_interval = publish_interval
+        self._partials: dict[tuple[str, str], _PartialArtifact] = {}
+        self._task_bytes: dict[str, int] = {}
+        # Artifacts dropped for exceeding the limit -> time of their last chunk
+        self._dropped: dict[tuple[str, str], float] = {}
+        # Content hash and time of the last completed artifact per key
+        self._digests: dict[tuple[str, str], tuple[str, float]] = {}
+        # Incomplete artifacts replacing expired snapshots, for `sweep`
+        self._expired: dict[tuple[str, str], Artifact] = {}
+        self.sweep_interval = min(ttl_seconds, 10)
+        self._last_sweep = time.monotonic()
+
+    def add(
+        self, task_id: str, event: TaskArtifactUpdateEvent
+    ) -> Artifact | None:
+        """Adds a chunk and returns the artifact to publish on the task, if any.
+
+        The returned artifact is the complete artifact after its last chunk,
+        or a snapshot flagged with `partial` metadata while it is streaming.
+        """
+        now = time.monotonic()
+        self._expire(now)
+        artifact = event.artifact
+        key = (task_id, artifact.artifact_id)
+        self._expired.pop(key, None)
+        if not event.append:
+            # A first chunk or an entire artifact replaces anything buffered.
+            previous = self._discard(key)
+            self._dropped.pop(key, None)
+            if event.last_chunk is None or event.last_chunk:
+                return self._complete(
+                    key, artifact, now, bool(previous and previous.published)
+                )
+            self._partials[key] = _PartialArtifact(
+                artifact.model_copy(update={'parts': []}), now
+            )
+        elif key in self._dropped:
+            if event.last_chunk:
+                del self._dropped[key]
+            else:
+                self._dropped[key] = now
+            return None
+        elif key not in self._partials:
+            # The first chunk was missed or has expired, start from here.
+            self._partials[key] = _PartialArtifact(
+                artifact.model_copy(update={'parts': []}), now
+            )
+        partial = self._partials[key]
+        added = partial.extend(artifact.parts, now)
+        task_bytes = self._task_bytes.get(task_id, 0) + added
+        self._task_bytes[task_id] = task_bytes
+        if task_bytes > self.max_task_bytes:
+            print(
+                'Dropping artifact',
+                artifact.artifact_id,
+                'of task',
+                task_id,
+                f': exceeds {self.max_task_bytes} buffered bytes',
+            )
+            self._discard(key)
+            if not (event.append and event.last_chunk):
+                self._dropped[key] = now
+            if partial.published:
+                # Replace the snapshot the UI shows as still streaming.
+                return partial.snapshot(partial=False, incomplete=True)
+            return None
+        if event.append and event.last_chunk:
+            self._discard(key)
+            return self._complete(
+                key, partial.snapshot(partial=False), now, partial.published
+            )
+        if now - partial.published_at >= self.publish_interval:
+            partial.published_at = now
+            return partial.snapshot(partial=True)
+        return None
+
+    def _complete(
+        self,
+        key: tuple[str, str],
+        artifact: Artifact,
+        now: float,
+        replaces_snapshot: bool,
+    ) -> Artifact | None:
+        digest = hashlib.sha256(
+            artifact.model_dump_json(include={'parts'}).encode('utf-8')
+        ).hexdigest()
+        previous = self._digests.get(key)
+        self._digests[key] = (digest, now)
+        # A duplicate is still published if it replaces a partial snapshot.
+        if previous and previous[0] == digest and not replaces_snapshot:
+            return None
+        return artifact
+
+    def finish_task(self, task_id: str) -> list[Artifact]:
+        """Forgets a task that ended and returns the artifacts to publish.
+
+        These are the artifacts it left streaming whose snapshot was
+        published, flagged `incomplete`.
+        """
+        artifacts = []
+        for key in [key for key in self._partials if key[0] == task_id]:
+            partial = self._discard(key)
+            if partial.published:
+                artifacts.append(
+                    partial.snapshot(partial=False, incomplete=True)
+                )
+        for key in [key for key in self._expired if key[0] == task_id]:
+            artifacts.append(self._expired.pop(key))
+        for entries in (self._dropped, self._digests):
+            for key in [key for key in entries if key[0] == task_id]:
+                del entries[key]
+        return artifacts
+
+    def sweep(self) -> list[tuple[str, Artifact]]:
+        """Expires stale entries and returns the artifacts to publish.
+
+        These are (task id, artifact) pairs of the artifacts that expired
+        after a snapshot was published, flagged `incomplete`.
+        """
+        self._expire(time.monotonic(), force=True)
+        expired = [
+            (key[0], artifact) for key, artifact in self._expired.items()
+        ]
+        self._expired.clear()
+        return expired
+
+    def empty(self) -> bool:
+        """Returns whether nothing is buffered and there is nothing to sweep."""
+        return not (
+            self._partials or self._dropped or self._digests or self._expired
+        )
+
+    def partial_artifacts(self, task_id: str) -> list[Artifact]:
+        """Returns snapshots of the artifacts still streaming for a task."""
+        return [
+            partial.snapshot(partial=True)
+            for (partial_task_id, _), partial in self._partials.items()
+            if partial_task_id == task_id
+        ]
+
+    def __len__(self) -> int:
+        return len(self._partials)
+
+    def _discard(self, key: tuple[str, str]) -> _PartialArtifact | None:
+        partial = self._partials.pop(key, None)
+        if not partial:
+            return None
+        task_id = key[0]
+        remaining = self._task_bytes.get(task_id, 0) - partial.size
+        if remaining > 0:
+            self._task_bytes[task_id] = remaining
+        else:
+            self._task_bytes.pop(task_id, None)
+        return partial
+
+    def _expire(self, now: float, force: bool = False):
+        # Sweeping is cheap but there is no need to do it on every chunk.
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        stale = [
+            key
+            for key, partial in self._partials.items()
+            if now - partial.updated_at > self.ttl_seconds
+        ]
+        for key in stale:
+            partial = self._discard(key)
+            if partial.published:
+                self._expired[key] = partial.snapshot(
+                    partial=False, incomplete=True
+                )
+        self._dropped = {
+            key: updated_at
+            for key, updated_at in self._dropped.items()
+            if now - updated_at <= self.ttl_seconds
+        }
+        self._digests = {
+            key: entry
+            for key, entry in self._digests.items()
+            if now - entry[1] <= self.ttl_seconds
+        }
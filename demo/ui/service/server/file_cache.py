@@ -0,0 +1,317 @@
+import base64
+import hashlib
+import os
+import re
+import secrets
+import tempfile
+import threading
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from a2a.types import FilePart, FileWithUri
+from pydantic import BaseModel
+
+
+# Files are read from disk in chunks of this size when streamed.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Names of the files written to the spill directory, content or temporary.
+_SPILLED_NAME = re.compile(r'[0-9a-f]{64}(\.tmp)?')
+
+
+class CachedFile(BaseModel):
+    """Metadata for a file served from /message/file/{file_id}."""
+
+    mime_type: str = 'application/octet-stream'
+    # Remote files are not cached, the client is redirected to them instead.
+    uri: str | None = None
+    # SHA-256 of the decoded content, also used as the ETag.
+    digest: str = ''
+    size: int = 0
+
+
+class FileCache:
+    """Size-bounded cache for the file parts served to the UI.
+
+    File parts are decoded once when cached and stored by the SHA-256 of their
+    content, so the same file referenced by many messages is kept only once.
+    At most `max_files` file ids are remembered, the least recently used are
+    forgotten first, along with their content once no other id refers to it.
+    When the in-memory size limit is exceeded, the least recently used
+    contents are spilled to a directory on disk, if one is configured, or
+    dropped otherwise; the directory is bounded by `max_disk_bytes` in the
+    same way. Files spilled by an earlier process are removed on startup.
+
+    The cache is used from the event loop and from the threads serving the
+    files, so every method takes a lock.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 256 * 1024 * 1024,
+        spill_dir: str | Path | None = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+        max_files: int = 10000,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_files = max_files
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._remove_spilled_files()
+        # Keys the file ids, so they cannot be guessed from message ids.
+        self._id_key = secrets.token_bytes(16)
+        self._lock = threading.Lock()
+        # file id -> metadata, least recently used first
+        self._files: OrderedDict[str, CachedFile] = OrderedDict()
+        # digest -> number of file ids with that content
+        self._refs: dict[str, int] = {}
+        # digest -> content, least recently used first
+        self._blobs: OrderedDict[str, bytes] = OrderedDict()
+        # digest -> size of the spilled file, least recently used first
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spills = 0
+
+    def __contains__(self, file_id: str) -> bool:
+        with self._lock:
+            return file_id in self._files
+
+    def file_id(self, message_part_id: str) -> str:
+        """Returns the id under which a message part is served."""
+        return hashlib.blake2b(
+            message_part_id.encode('utf-8'), key=self._id_key, digest_size=16
+        ).hexdigest()
+
+    def put(self, file_id: str, part: FilePart):
+        mime_type = part.file.mime_type or 'application/octet-stream'
+        with self._lock:
+            if file_id in self._files:
+                self._files.move_to_end(file_id)
+                return
+        if isinstance(part.file, FileWithUri):
+            info = CachedFile(mime_type=mime_type, uri=part.file.uri)
+            data = None
+        else:
+            data = decode_file_bytes(part.file.bytes, mime_type)
+            info = CachedFile(
+                mime_type=mime_type,
+                digest=hashlib.sha256(data).hexdigest(),
+                size=len(data),
+            )
+        with self._lock:
+            if file_id in self._files:
+                return
+            self._files[file_id] = info
+            if data is not None:
+                self._add_ref(info.digest, data)
+            while len(self._files) > self.max_files:
+                _, forgotten = self._files.popitem(last=False)
+                self._remove_ref(forgotten)
+
+    def get(self, file_id: str) -> tuple[CachedFile, bytes | BinaryIO | None]:
+        """Returns the file metadata and its content, bytes or an open file.
+
+        Spilled files are opened before the lock is released, so they stay
+        readable if they are evicted meanwhile; the caller must close them.
+        Raises KeyError if the file is unknown or was evicted.
+        """
+        with self._lock:
+            info = self._files.get(file_id)
+            if info is None:
+                self.misses += 1
+                raise KeyError(file_id)
+            self._files.move_to_end(file_id)
+            if info.uri:
+                self.hits += 1
+                return info, None
+            if info.digest in self._blobs:
+                self.hits += 1
+                self._blobs.move_to_end(info.digest)
+                return info, self._blobs[info.digest]
+            if info.digest in self._disk:
+                self.disk_hits += 1
+                self._disk.move_to_end(info.digest)
+                return info, (self.spill_dir / info.digest).open('rb')
+            self.misses += 1
+            del self._files[file_id]
+            self._remove_ref(info)
+            raise KeyError(file_id)
+
+    def close(self):
+        """Removes the spilled files. Call on shutdown."""
+        with self._lock:
+            self._files.clear()
+            self._refs.clear()
+            self._blobs.clear()
+            self._disk.clear()
+            self._memory_bytes = self._disk_bytes = 0
+            if self.spill_dir:
+                self._remove_spilled_files()
+
+    def _add_ref(self, digest: str, data: bytes):
+        self._refs[digest] = self._refs.get(digest, 0) + 1
+        if digest in self._blobs:
+            self._blobs.move_to_end(digest)
+        elif digest in self._disk:
+            self._disk.move_to_end(digest)
+        else:
+            self._blobs[digest] = data
+            self._memory_bytes += len(data)
+            self._evict()
+
+    def _remove_ref(self, info: CachedFile):
+        if info.uri:
+            return
+        refs = self._refs.pop(info.digest, 1) - 1
+        if refs > 0:
+            self._refs[info.digest] = refs
+            return
+        data = self._blobs.pop(info.digest, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+        if info.digest in self._disk:
+            self._unspill(info.digest)
+
+    def _evict(self):
+        while self._memory_bytes > self.max_memory_bytes and self._blobs:
+            digest, data = self._blobs.popitem(last=False)
+            self._memory_bytes -= len(data)
+            self.evictions += 1
+            if self.spill_dir and len(data) <= self.max_disk_bytes:
+                # Write then rename so readers never see a partial file.
+                path = self.spill_dir / digest
+                tmp = path.with_suffix('.tmp')
+                tmp.write_bytes(data)
+                tmp.replace(path)
+                self._disk[digest] = len(data)
+                self._disk_bytes += len(data)
+                self.spills += 1
+        while self._disk_bytes > self.max_disk_bytes:
+            self._unspill(next(iter(self._disk)))
+
+    def _unspill(self, digest: str):
+        self._disk_bytes -= self._disk.pop(digest)
+        # Files opened by get stay readable until they are closed.
+        (self.spill_dir / digest).unlink(missing_ok=True)
+
+    def _remove_spilled_files(self):
+        for path in self.spill_dir.iterdir():
+            if _SPILLED_NAME.fullmatch(path.name):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'files': len(self._files),
+                'max_files': self.max_files,
+                'memory_files': len(self._blobs),
+                'memory_bytes': self._memory_bytes,
+                'max_memory_bytes': self.max_memory_bytes,
+                'disk_files': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'spills': self.spills,
+            }
+
+
+def file_cache_from_env() -> FileCache:
+    """Builds the FileCache configured by the A2A_UI_FILE_CACHE_* variables.
+
+    Spilling to disk is on by default, to a directory of this process under
+    the temporary directory; set A2A_UI_FILE_CACHE_DIR to use another one, or
+    to an empty string to keep files in memory only.
+    """
+    spill_dir = os.environ.get(
+        'A2A_UI_FILE_CACHE_DIR',
+        str(Path(tempfile.gettempdir()) / f'a2a_ui_file_cache_{os.getpid()}'),
+    )
+    return FileCache(
+        max_memory_bytes=int(
+            os.environ.get('A2A_UI_FILE_CACHE_BYTES', str(256 * 1024 * 1024))
+        ),
+        spill_dir=spill_dir or None,
+        max_disk_bytes=int(
+            os.environ.get(
+                'A2A_UI_FILE_CACHE_DISK_BYTES', str(1024 * 1024 * 1024)
+            )
+        ),
+        max_files=int(os.environ.get('A2A_UI_FILE_CACHE_MAX_FILES', '10000')),
+    )
+
+
+def decode_file_bytes(value: str, mime_type: str) -> bytes:
+    """Returns the content of a file part as served to the UI.
+
+    Images are sent base64 encoded and served decoded, other files are
+    served as they were sent.
+    """
+    if 'image' in mime_type:
+        return base64.b64decode(value)
+    return value.encode('utf-8')
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Returns whether an If-None-Match header lists the strong `etag`."""
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def parse_range(header: str, size: int) -> tuple[int, int]:
+    """Parses a single `bytes=` Range header into an inclusive (start, end).
+
+    Raises ValueError if the range is malformed or cannot be satisfied.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        raise ValueError(f'Unsupported range: {header}')
+    start_text, _, end_text = spec.strip().partition('-')
+    if not start_text:
+        # Suffix range, the last N bytes.
+        length = int(end_text)
+        if length <= 0:
+            raise ValueError(f'Unsatisfiable range: {header}')
+        return max(size - length, 0), size - 1
+    start = int(start_text)
+    end = int(end_text) if end_text else size - 1
+    if start >= size or end < start:
+        raise ValueError(f'Unsatisfiable range: {header}')
+    return start, min(end, size - 1)
+
+
+def close_file(content: bytes | BinaryIO | None):
+    """Closes the content returned by FileCache.get if it is an open file."""
+    if content is not None and not isinstance(content, bytes):
+        content.close()
+
+
+def iter_file(f: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """Yields the inclusive byte range [start, end] of a file in chunks.
+
+    The file is closed once it has been read, or the iterator is closed.
+    """
+    with f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(STREAM_CHUNK_BYTES, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
@@ -18,6 +18,7 @@ from utils.agent_card import get_agent_card
 
 from service.server import test_image
 from service.server.application_manager import ApplicationManager
+from service.server.store import ApplicationStore
 from service.types import Conversation, Event
 
 
@@ -29,19 +30,13 @@ class InMemoryFakeAgentManager(ApplicationManager):
     uses to send messages to the agent and provide information for the frontend.
     """
 
-    _conversations: list[Conversation]
-    _messages: list[Message]
-    _tasks: list[Task]
-    _events: list[Event]
+    _store: ApplicationStore
     _pending_message_ids: list[str]
     _next_message_idx: int
     _agents: list[AgentCard]
 
     def __init__(self):
-        self._conversations = []
-        self._messages = []
-        self._tasks = []
-        self._events = []
+        self._store = ApplicationStore()
         self._pending_message_ids = []
         self._next_message_idx = 0
         self._agents = []
@@ -50,39 +45,29 @@ class InMemoryFakeAgentManager(ApplicationManager):
     def create_conversation(self) -> Conversation:
         conversation_id = str(uuid.uuid4())
         c = Conversation(conversation_id=conversation_id, is_active=True)
-        self._conversations.append(c)
+        self._store.add_conversation(c)
         return c
 
     def sanitize_message(self, message: Message) -> Message:
-        conversation = self.get_conversation(message.context_id)
-        if not conversation:
-            return message
         # Check if the last event in the conversation was tied to a task.
-        if conversation.messages:
-            if conversation.messages[-1].task_id and task_still_open(
-                next(
-                    filter(
-                        lambda x: x.id == conversation.messages[-1].task_id,
-                        self._tasks,
-                    ),
-                    None,
-                )
-            ):
-                message.task_id = conversation.messages[-1].task_id
+        last_message = self._store.last_message(message.context_id)
+        if (
+            last_message
+            and last_message.task_id
+            and task_still_open(self._store.get_task(last_message.task_id))
+        ):
+            message.task_id = last_message.task_id
 
         return message
 
     async def process_message(self, message: Message):
-        self._messages.append(message)
         message_id = message.message_id
         context_id = message.context_id or ''
         task_id = message.task_id or ''
         if message_id:
             self._pending_message_ids.append(message_id)
-        conversation = self.get_conversation(context_id)
-        if conversation:
-            conversation.messages.append(message)
-        self._events.append(
+        self._store.add_message(message, context_id)
+        self.add_event(
             Event(
                 id=str(uuid.uuid4()),
                 actor='host',
@@ -106,9 +91,8 @@ class InMemoryFakeAgentManager(ApplicationManager):
             self.add_task(task)
         await asyncio.sleep(self._next_message_idx)
         response = self.next_message()
-        if conversation:
-            conversation.messages.append(response)
-        self._events.append(
+        self._store.add_message(response, context_id)
+        self.add_event(
             Event(
                 id=str(uuid.uuid4()),
                 actor='host',
@@ -134,16 +118,13 @@ class InMemoryFakeAgentManager(ApplicationManager):
             self.update_task(task)
 
     def add_task(self, task: Task):
-        self._tasks.append(task)
+        self._store.add_task(task)
 
     def update_task(self, task: Task):
-        for i, t in enumerate(self._tasks):
-            if t.id == task.id:
-                self._tasks[i] = task
-                return
+        self._store.update_task(task)
 
     def add_event(self, event: Event):
-        self._events.append(event)
+        self._store.add_event(event)
 
     def next_message(self) -> Message:
         message = _message_queue[self._next_message_idx]
@@ -155,24 +136,14 @@ class InMemoryFakeAgentManager(ApplicationManager):
     def get_conversation(
         self, conversation_id: str | None
     ) -> Conversation | None:
-        if not conversation_id:
-            return None
-        return next(
-            filter(
-                lambda c: c and c.conversation_id == conversation_id,
-                self._conversations,
-            ),
-            None,
-        )
+        return self._store.get_conversation(conversation_id)
 
     def get_pending_messages(self) -> list[tuple[str, str]]:
         rval: list[tuple[str, str]] = []
         for message_id in self._pending_message_ids:
             if message_id in self._task_map:
                 task_id = self._task_map[message_id]
-                task = next(
-                    filter(lambda x: x.id == task_id, self._tasks), None
-                )
+                task = self._store.get_task(task_id)
                 if not task:
                     rval.append((message_id, ''))
                 elif task.history and task.history[-1].parts:
@@ -193,10 +164,11 @@ class InMemoryFakeAgentManager(ApplicationManager):
             return rval
         return [(x, '') for x in self._pending_message_ids]
 
-    def register_agent(self, url):
-        agent_data = get_agent_card(url)
+    async def register_agent(self, url):
+        agent_data = await get_agent_card(url)
         if not agent_data.url:
-            agent_data.url = url
+            # The resolver's card is shared, update a copy.
+            agent_data = agent_data.model_copy(update={'url': url})
         self._agents.append(agent_data)
 
     @property
@@ -205,15 +177,35 @@ class InMemoryFakeAgentManager(ApplicationManager):
 
     @property
     def conversations(self) -> list[Conversation]:
-        return self._conversations
+        return self._store.conversations
 
     @property
     def tasks(self) -> list[Task]:
-        return self._tasks
+        return self._store.tasks
 
     @property
     def events(self) -> list[Event]:
-        return []
+        return self._store.events
+
+    def events_since(self, cursor: int = 0) -> tuple[list[Event], int]:
+        return self._store.events_since(cursor)
+
+    def tasks_since(self, cursor: int = 0) -> tuple[list[Task], int]:
+        return self._store.tasks_since(cursor)
+
+    def conversations_since(
+        self, cursor: int = 0
+    ) -> tuple[list[Conversation], int]:
+        return self._store.conversations_since(cursor)
+
+    def messages_since(self, cursor: int = 0) -> tuple[list[Message], int]:
+        return self._store.messages_since(cursor)
+
+    def subscribe(self) -> asyncio.Event:
+        return self._store.changes.subscribe()
+
+    def unsubscribe(self, changed: asyncio.Event):
+        self._store.changes.unsubscribe(changed)
 
 
 _contextId = str(uuid.uuid4())
@@ -0,0 +1,127 @@
+import asyncio
+import time
+import traceback
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from a2a.types import Message
+
+
+class SchedulerFullError(Exception):
+    """Raised when a message is submitted while the queue is full."""
+
+
+class SchedulerClosedError(Exception):
+    """Raised when a message is submitted after draining has started."""
+
+
+class MessageScheduler:
+    """Bounded scheduler that processes incoming messages on the server loop.
+
+    At most `max_concurrency` messages are processed at once and at most
+    `max_pending` may be queued or running; further submissions are rejected
+    so the server can apply backpressure. Messages of the same conversation
+    are processed one after another, in the order they were submitted.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Message], Awaitable[Any]],
+        max_concurrency: int = 8,
+        max_pending: int = 64,
+    ):
+        self._process = process
+        self._max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        # conversation id -> most recently submitted task of that conversation
+        self._conversation_tails: dict[str, asyncio.Task] = {}
+        self._closed = False
+        self._pending = 0
+        self._running = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def submit(self, message: Message):
+        """Queues a message for processing without waiting for it."""
+        if self._closed:
+            raise SchedulerClosedError('The server is shutting down')
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise SchedulerFullError(
+                f'Too many pending messages ({self._pending})'
+            )
+        self._pending += 1
+        key = message.context_id or message.message_id
+        previous = self._conversation_tails.get(key)
+        task = asyncio.create_task(
+            self._run(message, previous, time.monotonic())
+        )
+        self._tasks.add(task)
+        self._conversation_tails[key] = task
+        task.add_done_callback(lambda t: self._task_done(key, t))
+
+    async def _run(
+        self,
+        message: Message,
+        previous: asyncio.Task | None,
+        enqueued_at: float,
+    ):
+        try:
+            if previous:
+                # Keep per-conversation ordering; the previous message's
+                # outcome does not matter.
+                await asyncio.wait({previous})
+            async with self._semaphore:
+                wait = time.monotonic() - enqueued_at
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+                self._running += 1
+                try:
+                    await self._process(message)
+                    self._processed += 1
+                except Exception:
+                    self._failed += 1
+                    print('Failed to process message', message.message_id)
+                    traceback.print_exc()
+                finally:
+                    self._running -= 1
+        finally:
+            self._pending -= 1
+
+    def _task_done(self, key: str, task: asyncio.Task):
+        self._tasks.discard(task)
+        if self._conversation_tails.get(key) is task:
+            del self._conversation_tails[key]
+
+    async def drain(self, timeout: float | None = None):
+        """Stops accepting messages and waits for the queued ones to finish.
+
+        Messages still unfinished after `timeout` seconds are cancelled.
+        """
+        self._closed = True
+        if not self._tasks:
+            return
+        _, unfinished = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.wait(unfinished)
+
+    def metrics(self) -> dict[str, Any]:
+        started = self._processed + self._failed + self._running
+        return {
+            'queue_depth': self._pending - self._running,
+            'running': self._running,
+            'processed': self._processed,
+            'failed': self._failed,
+            'rejected': self._rejected,
+            'average_wait_seconds': self._total_wait / started
+            if started
+            else 0.0,
+            'max_wait_seconds': self._max_wait,
+        }
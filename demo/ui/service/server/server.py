@@ -1,19 +1,23 @@
 import asyncio
-import base64
+import json
 import os
-import threading
 import uuid
 
-from typing import cast
-
 import httpx
 
 from a2a.types import FilePart, FileWithUri, Message, Part
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import (
+    JSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 
 from service.types import (
     CreateConversationResponse,
+    CursorParams,
     GetEventResponse,
+    JSONRPCError,
     ListAgentResponse,
     ListConversationResponse,
     ListMessageResponse,
@@ -22,11 +26,30 @@ from service.types import (
     PendingMessageResponse,
     RegisterAgentResponse,
     SendMessageResponse,
+    StreamCursor,
+    StreamUpdate,
 )
 
 from .adk_host_manager import ADKHostManager, get_message_id
 from .application_manager import ApplicationManager
+from .file_cache import (
+    close_file,
+    etag_matches,
+    file_cache_from_env,
+    iter_file,
+    parse_range,
+)
 from .in_memory_manager import InMemoryFakeAgentManager
+from .scheduler import (
+    MessageScheduler,
+    SchedulerClosedError,
+    SchedulerFullError,
+)
+
+
+# Seconds of inactivity after which a comment is sent on the push stream, so
+# that proxies and the browser keep the connection open.
+STREAM_KEEPALIVE_SECONDS = 15
 
 
 class ConversationServer:
@@ -54,8 +77,19 @@ class ConversationServer:
             )
         else:
             self.manager = InMemoryFakeAgentManager()
-        self._file_cache = {}  # dict[str, FilePart] maps file id to message data
-        self._message_to_cache = {}  # dict[str, str] maps message id to cache id
+        self._scheduler = MessageScheduler(
+            self.manager.process_message,
+            max_concurrency=int(
+                os.environ.get('A2A_UI_MAX_CONCURRENT_MESSAGES', '8')
+            ),
+            max_pending=int(
+                os.environ.get('A2A_UI_MAX_PENDING_MESSAGES', '64')
+            ),
+        )
+        self._file_cache = file_cache_from_env()
+        # Identifies this server in the delta cursors, so that a cursor from
+        # before a restart is reset even when the new history is longer.
+        self._epoch = uuid.uuid4().hex[:12]
 
         app.add_api_route(
             '/conversation/create', self._create_conversation, methods=['POST']
@@ -65,12 +99,18 @@ class ConversationServer:
         )
         app.add_api_route('/message/send', self._send_message, methods=['POST'])
         app.add_api_route('/events/get', self._get_events, methods=['POST'])
+        app.add_api_route(
+            '/events/stream', self._stream_updates, methods=['GET']
+        )
         app.add_api_route(
             '/message/list', self._list_messages, methods=['POST']
         )
         app.add_api_route(
             '/message/pending', self._pending_messages, methods=['POST']
         )
+        app.add_api_route(
+            '/message/queue', self._message_queue_metrics, methods=['GET']
+        )
         app.add_api_route('/task/list', self._list_tasks, methods=['POST'])
         app.add_api_route(
             '/agent/register', self._register_agent, methods=['POST']
@@ -79,10 +119,20 @@ class ConversationServer:
         app.add_api_route(
             '/message/file/{file_id}', self._files, methods=['GET']
         )
+        app.add_api_route(
+            '/message/file_cache', self._file_cache_stats, methods=['GET']
+        )
         app.add_api_route(
             '/api_key/update', self._update_api_key, methods=['POST']
         )
 
+    async def shutdown(self, timeout: float | None = 10):
+        """Stops accepting messages and drains the ones still queued."""
+        await self._scheduler.drain(timeout)
+        self._file_cache.close()
+        if isinstance(self.manager, ADKHostManager):
+            self.manager.close()
+
     # Update API key in manager
     def update_api_key(self, api_key: str):
         if isinstance(self.manager, ADKHostManager):
@@ -96,20 +146,16 @@ class ConversationServer:
         message_data = await request.json()
         message = Message(**message_data['params'])
         message = self.manager.sanitize_message(message)
-        loop = asyncio.get_event_loop()
-        if isinstance(self.manager, ADKHostManager):
-            t = threading.Thread(
-                target=lambda: cast(
-                    'ADKHostManager', self.manager
-                ).process_message_threadsafe(message, loop)
-            )
-        else:
-            t = threading.Thread(
-                target=lambda: asyncio.run(
-                    self.manager.process_message(message)
-                )
+        try:
+            self._scheduler.submit(message)
+        except (SchedulerFullError, SchedulerClosedError) as e:
+            return JSONResponse(
+                status_code=429 if isinstance(e, SchedulerFullError) else 503,
+                content=SendMessageResponse(
+                    id=message_data.get('id'),
+                    error=JSONRPCError(code=-32000, message=str(e)),
+                ).model_dump(mode='json', exclude_none=True),
             )
-        t.start()
         return SendMessageResponse(
             result=MessageInfo(
                 message_id=message.message_id,
@@ -122,8 +168,11 @@ class ConversationServer:
         conversation_id = message_data['params']
         conversation = self.manager.get_conversation(conversation_id)
         if conversation:
+            # Decoding and spilling files would block the event loop.
             return ListMessageResponse(
-                result=self.cache_content(conversation.messages)
+                result=await asyncio.to_thread(
+                    self.cache_content, conversation.messages
+                )
             )
         return ListMessageResponse(result=[])
 
@@ -140,12 +189,7 @@ class ConversationServer:
                 if part.kind != 'file':
                     new_parts.append(p)
                     continue
-                message_part_id = f'{message_id}:{i}'
-                if message_part_id in self._message_to_cache:
-                    cache_id = self._message_to_cache[message_part_id]
-                else:
-                    cache_id = str(uuid.uuid4())
-                    self._message_to_cache[message_part_id] = cache_id
+                cache_id = self._file_cache.file_id(f'{message_id}:{i}')
                 # Replace the part data with a url reference
                 new_parts.append(
                     Part(
@@ -157,12 +201,14 @@ class ConversationServer:
                         )
                     )
                 )
-                if cache_id not in self._file_cache:
-                    self._file_cache[cache_id] = part
+                self._file_cache.put(cache_id, part)
             m.parts = new_parts
             rval.append(m)
         return rval
 
+    def _message_queue_metrics(self):
+        return self._scheduler.metrics()
+
     async def _pending_messages(self):
         return PendingMessageResponse(
             result=self.manager.get_pending_messages()
@@ -171,31 +217,162 @@ class ConversationServer:
     def _list_conversation(self):
         return ListConversationResponse(result=self.manager.conversations)
 
-    def _get_events(self):
-        return GetEventResponse(result=self.manager.events)
+    async def _get_events(self, request: Request):
+        cursor = await self._read_cursor(request)
+        events, next_cursor = self.manager.events_since(cursor)
+        return GetEventResponse(
+            result=events, cursor=next_cursor, epoch=self._epoch
+        )
+
+    async def _list_tasks(self, request: Request):
+        cursor = await self._read_cursor(request)
+        tasks, next_cursor = self.manager.tasks_since(cursor)
+        return ListTaskResponse(
+            result=tasks, cursor=next_cursor, epoch=self._epoch
+        )
 
-    def _list_tasks(self):
-        return ListTaskResponse(result=self.manager.tasks)
+    async def _stream_updates(self, request: Request):
+        """Pushes conversation, message, task and event deltas over SSE.
+
+        The stream resumes from the `Last-Event-ID` header sent by reconnecting
+        EventSource clients, or from the `cursor` query parameter.
+        """
+        cursor = StreamCursor.decode(
+            request.headers.get('last-event-id')
+            or request.query_params.get('cursor')
+        )
+        if cursor.epoch != self._epoch:
+            cursor = StreamCursor(epoch=self._epoch)
+        return StreamingResponse(
+            self._update_stream(request, cursor),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache'},
+        )
+
+    async def _update_stream(self, request: Request, cursor: StreamCursor):
+        changed = self.manager.subscribe()
+        first = True
+        try:
+            while not await request.is_disconnected():
+                changed.clear()
+                update = await self._collect_update(cursor)
+                if first or (
+                    update.conversations
+                    or update.messages
+                    or update.tasks
+                    or update.events
+                ):
+                    first = False
+                    yield (
+                        f'id: {update.cursor}\n'
+                        f'data: {update.model_dump_json(exclude_none=True)}\n\n'
+                    )
+                try:
+                    await asyncio.wait_for(
+                        changed.wait(), STREAM_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    yield ': keepalive\n\n'
+        finally:
+            self.manager.unsubscribe(changed)
+
+    async def _collect_update(self, cursor: StreamCursor) -> StreamUpdate:
+        """Gathers the changes after `cursor` and advances it in place."""
+        conversations, cursor.conversation = self.manager.conversations_since(
+            cursor.conversation
+        )
+        messages, cursor.message = self.manager.messages_since(cursor.message)
+        tasks, cursor.task = self.manager.tasks_since(cursor.task)
+        events, cursor.event = self.manager.events_since(cursor.event)
+        # Decoding and spilling files would block the event loop, the first
+        # update of a stream holds the whole history.
+        messages = await asyncio.to_thread(self.cache_content, messages)
+        return StreamUpdate(
+            cursor=cursor.encode(),
+            conversations=conversations,
+            messages=messages,
+            tasks=tasks,
+            events=events,
+            pending=self.manager.get_pending_messages(),
+        )
+
+    async def _read_cursor(self, request: Request) -> int:
+        """Reads the optional delta cursor, defaulting to the full history.
+
+        A malformed body, or a cursor issued by another server instance,
+        also reads as the full history.
+        """
+        body = await request.body()
+        if not body:
+            return 0
+        try:
+            params = json.loads(body).get('params')
+            params = CursorParams(**params) if params else CursorParams()
+        except (ValueError, TypeError, AttributeError):
+            return 0
+        return params.cursor if params.epoch == self._epoch else 0
 
     async def _register_agent(self, request: Request):
         message_data = await request.json()
-        url = message_data['params']
-        self.manager.register_agent(url)
+        params = message_data['params']
+        if isinstance(params, list):
+            await self.manager.register_agents(params)
+        else:
+            await self.manager.register_agent(params)
         return RegisterAgentResponse()
 
     async def _list_agents(self):
         return ListAgentResponse(result=self.manager.agents)
 
-    def _files(self, file_id):
-        if file_id not in self._file_cache:
-            raise Exception('file not found')
-        part = self._file_cache[file_id]
-        if 'image' in part.file.mime_type:
+    def _files(self, file_id: str, request: Request):
+        try:
+            info, content = self._file_cache.get(file_id)
+        except KeyError:
+            return Response(status_code=404)
+        if info.uri:
+            return RedirectResponse(info.uri)
+        etag = f'"{info.digest}"'
+        headers = {
+            'ETag': etag,
+            'Accept-Ranges': 'bytes',
+            # Files are content addressed, a given id never changes.
+            'Cache-Control': 'private, max-age=31536000, immutable',
+        }
+        if etag_matches(request.headers.get('if-none-match', ''), etag):
+            close_file(content)
+            return Response(status_code=304, headers=headers)
+        start, end = 0, info.size - 1
+        status_code = 200
+        range_header = request.headers.get('range')
+        if range_header and info.size:
+            try:
+                start, end = parse_range(range_header, info.size)
+            except ValueError:
+                close_file(content)
+                return Response(
+                    status_code=416,
+                    headers={'Content-Range': f'bytes */{info.size}'},
+                )
+            status_code = 206
+            headers['Content-Range'] = f'bytes {start}-{end}/{info.size}'
+        headers['Content-Length'] = str(max(end - start + 1, 0))
+        if isinstance(content, bytes):
             return Response(
-                content=base64.b64decode(part.file.bytes),
-                media_type=part.file.mime_type,
+                content=content[start : end + 1],
+                status_code=status_code,
+                media_type=info.mime_type,
+                headers=headers,
             )
-        return Response(content=part.file.bytes, media_type=part.file.mime_type)
+        # Spilled files are streamed from disk instead of read into memory.
+        return StreamingResponse(
+            iter_file(content, start, end),
+            status_code=status_code,
+            media_type=info.mime_type,
+            headers=headers,
+        )
+
+    def _file_cache_stats(self):
+        return self._file_cache.stats()
 
     async def _update_api_key(self, request: Request):
         """Update the API key"""
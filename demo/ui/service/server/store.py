@@ -0,0 +1,224 @@
+import asyncio
+
+from collections import OrderedDict
+from typing import TypeVar
+
+from a2a.types import Message, Task
+
+from service.types import Conversation, Event
+
+
+T = TypeVar('T')
+
+
+class ChangeNotifier:
+    """Wakes up subscribers, e.g. push streams, whenever the store changes.
+
+    Changes may be made from threads other than the one running the
+    subscriber's event loop, so wake-ups are scheduled thread-safely.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[asyncio.Event, asyncio.AbstractEventLoop] = {}
+
+    def subscribe(self) -> asyncio.Event:
+        """Returns an event that is set after every change to the store."""
+        changed = asyncio.Event()
+        self._subscribers[changed] = asyncio.get_running_loop()
+        return changed
+
+    def unsubscribe(self, changed: asyncio.Event):
+        self._subscribers.pop(changed, None)
+
+    def notify(self):
+        for changed, loop in list(self._subscribers.items()):
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                # The subscriber's loop is closed.
+                self.unsubscribe(changed)
+
+
+class ApplicationStore:
+    """Indexed in-memory storage shared by the ApplicationManager implementations.
+
+    Conversations, tasks and messages are kept in dicts keyed by their ids so
+    that the lookups done on every streamed task update are O(1) instead of a
+    linear scan over everything seen so far. Dicts preserve insertion order, so
+    the list views handed to the frontend keep their original ordering.
+
+    Events and task changes are also assigned monotonic sequence numbers so
+    that clients can poll with a cursor and only receive what changed since
+    their last request. New conversations and messages are logged the same
+    way so push subscribers, woken up by `changes`, can stream deltas.
+    """
+
+    def __init__(self):
+        self._conversations: dict[str, Conversation] = {}
+        self._tasks: dict[str, Task] = {}
+        # context id -> ordered set of task ids created in that context
+        self._context_tasks: dict[str, dict[str, None]] = {}
+        self._messages: dict[str, Message] = {}
+        # conversation id -> message id -> index in conversation.messages
+        self._conversation_messages: dict[str, dict[str, int]] = {}
+        # task id -> sequence number of its last change, oldest change first
+        self._task_sequence: OrderedDict[str, int] = OrderedDict()
+        self._next_task_sequence = 0
+        # Append-only; the sequence number of an entry is its index + 1.
+        self._events: list[Event] = []
+        self._conversation_log: list[Conversation] = []
+        self._message_log: list[Message] = []
+        self.changes = ChangeNotifier()
+
+    def add_conversation(self, conversation: Conversation):
+        self._conversations[conversation.conversation_id] = conversation
+        self._conversation_messages[conversation.conversation_id] = {
+            m.message_id: i for i, m in enumerate(conversation.messages)
+        }
+        self._conversation_log.append(conversation)
+        self.changes.notify()
+
+    def get_conversation(
+        self, conversation_id: str | None
+    ) -> Conversation | None:
+        if not conversation_id:
+            return None
+        return self._conversations.get(conversation_id)
+
+    @property
+    def conversations(self) -> list[Conversation]:
+        return list(self._conversations.values())
+
+    def conversations_since(
+        self, cursor: int = 0
+    ) -> tuple[list[Conversation], int]:
+        """Returns the conversations created after `cursor` and the new cursor."""
+        return _since(self._conversation_log, cursor)
+
+    def add_message(
+        self, message: Message, conversation_id: str | None = None
+    ) -> Conversation | None:
+        """Stores a message and appends it to its conversation, if known.
+
+        The conversation defaults to the message context id. Returns the
+        conversation the message was appended to.
+        """
+        self._messages[message.message_id] = message
+        self._message_log.append(message)
+        self.changes.notify()
+        conversation = self.get_conversation(
+            conversation_id or message.context_id
+        )
+        if not conversation:
+            return None
+        index = self._conversation_messages.setdefault(
+            conversation.conversation_id, {}
+        )
+        index[message.message_id] = len(conversation.messages)
+        conversation.messages.append(message)
+        return conversation
+
+    def get_message(self, message_id: str) -> Message | None:
+        return self._messages.get(message_id)
+
+    def get_conversation_message(
+        self, conversation_id: str, message_id: str
+    ) -> Message | None:
+        conversation = self.get_conversation(conversation_id)
+        index = self._conversation_messages.get(conversation_id, {})
+        if not conversation or message_id not in index:
+            return None
+        return conversation.messages[index[message_id]]
+
+    def last_message(self, conversation_id: str | None) -> Message | None:
+        conversation = self.get_conversation(conversation_id)
+        if not conversation or not conversation.messages:
+            return None
+        return conversation.messages[-1]
+
+    @property
+    def messages(self) -> list[Message]:
+        return list(self._messages.values())
+
+    def messages_since(self, cursor: int = 0) -> tuple[list[Message], int]:
+        """Returns the messages added after `cursor` and the new cursor."""
+        return _since(self._message_log, cursor)
+
+    def add_task(self, task: Task) -> int:
+        """Stores a task and returns the sequence number of the change."""
+        self._tasks[task.id] = task
+        if task.context_id:
+            self._context_tasks.setdefault(task.context_id, {})[task.id] = None
+        return self._mark_task_changed(task.id)
+
+    def update_task(self, task: Task) -> bool:
+        """Replaces a stored task in place. Returns False if it is unknown."""
+        if task.id not in self._tasks:
+            return False
+        self._tasks[task.id] = task
+        if task.context_id:
+            self._context_tasks.setdefault(task.context_id, {})[task.id] = None
+        self._mark_task_changed(task.id)
+        return True
+
+    def _mark_task_changed(self, task_id: str) -> int:
+        self._next_task_sequence += 1
+        self._task_sequence[task_id] = self._next_task_sequence
+        self._task_sequence.move_to_end(task_id)
+        self.changes.notify()
+        return self._next_task_sequence
+
+    def get_task(self, task_id: str | None) -> Task | None:
+        if not task_id:
+            return None
+        return self._tasks.get(task_id)
+
+    def has_task(self, task_id: str | None) -> bool:
+        return bool(task_id) and task_id in self._tasks
+
+    def tasks_for_context(self, context_id: str) -> list[Task]:
+        return [
+            self._tasks[task_id]
+            for task_id in self._context_tasks.get(context_id, {})
+        ]
+
+    @property
+    def tasks(self) -> list[Task]:
+        return list(self._tasks.values())
+
+    def tasks_since(self, cursor: int = 0) -> tuple[list[Task], int]:
+        """Returns the tasks changed after `cursor` and the new cursor.
+
+        Tasks are returned oldest change first. A cursor ahead of the store,
+        e.g. from before a server restart, is treated as a full resync.
+        """
+        if cursor > self._next_task_sequence:
+            cursor = 0
+        changed: list[Task] = []
+        for task_id, sequence in reversed(self._task_sequence.items()):
+            if sequence <= cursor:
+                break
+            changed.append(self._tasks[task_id])
+        changed.reverse()
+        return changed, self._next_task_sequence
+
+    def add_event(self, event: Event) -> int:
+        """Appends an event and returns its sequence number."""
+        self._events.append(event)
+        self.changes.notify()
+        return len(self._events)
+
+    @property
+    def events(self) -> list[Event]:
+        return list(self._events)
+
+    def events_since(self, cursor: int = 0) -> tuple[list[Event], int]:
+        """Returns the events added after `cursor` and the new cursor."""
+        return _since(self._events, cursor)
+
+
+def _since(log: list[T], cursor: int) -> tuple[list[T], int]:
+    # A cursor ahead of the log, e.g. from before a server restart, resyncs.
+    if cursor > len(log):
+        cursor = 0
+    return log[cursor:], len(log)
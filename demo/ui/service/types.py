@@ -70,12 +70,67 @@ class SendMessageResponse(JSONRPCResponse):
     result: Message | MessageInfo | None = None
 
 
+class CursorParams(BaseModel):
+    # Only return items that changed after this sequence number.
+    cursor: int = 0
+    # Server instance that issued the cursor, which is reset if it differs.
+    epoch: str = ''
+
+
 class GetEventRequest(JSONRPCRequest):
     method: Literal['events/get'] = 'events/get'
+    params: CursorParams | None = None
 
 
 class GetEventResponse(JSONRPCResponse):
     result: list[Event] | None = None
+    # Sequence number to pass as the cursor of the next request.
+    cursor: int = 0
+    epoch: str = ''
+
+
+class StreamCursor(BaseModel):
+    """Position of a push subscriber in each of the server side logs."""
+
+    # Server instance the positions refer to, see CursorParams.
+    epoch: str = ''
+    conversation: int = 0
+    message: int = 0
+    task: int = 0
+    event: int = 0
+
+    def encode(self) -> str:
+        return (
+            f'{self.epoch}.{self.conversation}.{self.message}.'
+            f'{self.task}.{self.event}'
+        )
+
+    @classmethod
+    def decode(cls, value: str | None) -> 'StreamCursor':
+        try:
+            epoch, *positions = (value or '').split('.')
+            conversation, message, task, event = (int(x) for x in positions)
+        except ValueError:
+            return cls()
+        return cls(
+            epoch=epoch,
+            conversation=conversation,
+            message=message,
+            task=task,
+            event=event,
+        )
+
+
+class StreamUpdate(BaseModel):
+    """A batch of changes pushed over the /events/stream channel."""
+
+    # Cursor to resume the stream from, also sent as the SSE event id.
+    cursor: str
+    conversations: list[Conversation] = Field(default_factory=list)
+    messages: list[Message] = Field(default_factory=list)
+    tasks: list[Task] = Field(default_factory=list)
+    events: list[Event] = Field(default_factory=list)
+    pending: list[tuple[str, str]] = Field(default_factory=list)
 
 
 class ListConversationRequest(JSONRPCRequest):
@@ -104,16 +159,20 @@ class CreateConversationResponse(JSONRPCResponse):
 
 class ListTaskRequest(JSONRPCRequest):
     method: Literal['task/list'] = 'task/list'
+    params: CursorParams | None = None
 
 
 class ListTaskResponse(JSONRPCResponse):
     result: list[Task] | None = None
+    # Sequence number to pass as the cursor of the next request.
+    cursor: int = 0
+    epoch: str = ''
 
 
 class RegisterAgentRequest(JSONRPCRequest):
     method: Literal['agent/register'] = 'agent/register'
-    # This is the base url of the agent card
-    params: str | None = None
+    # The base url of the agent card, or a list of them to register in bulk
+    params: str | list[str] | None = None
 
 
 class RegisterAgentResponse(JSONRPCResponse):
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import sys
@@ -7,10 +8,11 @@ import uuid
 from typing import Any
 
 from a2a.types import FileWithBytes, Message, Part, Role, Task, TaskState
-from service.client.client import ConversationClient
+from service.client.client import ConversationClient, shared_client_pool
 from service.types import (
     Conversation,
     CreateConversationRequest,
+    CursorParams,
     Event,
     GetEventRequest,
     ListAgentRequest,
@@ -21,6 +23,8 @@ from service.types import (
     PendingMessageRequest,
     RegisterAgentRequest,
     SendMessageRequest,
+    StreamCursor,
+    StreamUpdate,
 )
 
 from .state import (
@@ -35,6 +39,9 @@ from .state import (
 
 server_url = 'http://localhost:12000'
 
+# Events kept in the Mesop state for the event viewer, the oldest go first.
+MAX_STATE_EVENTS = 1000
+
 
 async def ListConversations() -> list[Conversation]:
     client = ConversationClient(server_url)
@@ -88,14 +95,23 @@ async def AddRemoteAgent(path: str):
         print('Failed to register the agent', e)
 
 
-async def GetEvents() -> list[Event]:
+async def GetEvents(
+    cursor: int = 0, epoch: str = ''
+) -> tuple[list[Event], int, str]:
+    """Returns the events added after `cursor`, the next cursor and epoch."""
     client = ConversationClient(server_url)
     try:
-        response = await client.get_events(GetEventRequest())
-        return response.result if response.result else []
+        response = await client.get_events(
+            GetEventRequest(params=CursorParams(cursor=cursor, epoch=epoch))
+        )
+        return (
+            response.result if response.result else [],
+            response.cursor,
+            response.epoch,
+        )
     except Exception as e:
         print('Failed to get events', e)
-    return []
+    return [], cursor, epoch
 
 
 async def GetProcessingMessages():
@@ -111,14 +127,23 @@ def GetMessageAliases():
     return {}
 
 
-async def GetTasks():
+async def GetTasks(
+    cursor: int = 0, epoch: str = ''
+) -> tuple[list[Task], int, str]:
+    """Returns the tasks changed after `cursor`, the next cursor and epoch."""
     client = ConversationClient(server_url)
     try:
-        response = await client.list_tasks(ListTaskRequest())
-        return response.result
+        response = await client.list_tasks(
+            ListTaskRequest(params=CursorParams(cursor=cursor, epoch=epoch))
+        )
+        return (
+            response.result if response.result else [],
+            response.cursor,
+            response.epoch,
+        )
     except Exception as e:
         print('Failed to list tasks ', e)
-        return []
+        return [], cursor, epoch
 
 
 async def ListMessages(conversation_id: str) -> list[Message]:
@@ -133,17 +158,38 @@ async def ListMessages(conversation_id: str) -> list[Message]:
     return []
 
 
+async def UpdateConversationMessages(state: AppState, conversation_id: str):
+    """Load the full message history of a conversation into the app state."""
+    state.current_conversation_id = conversation_id
+    messages = await ListMessages(conversation_id)
+    state.messages = [convert_message_to_state(x) for x in messages]
+    state.synced_conversation_id = conversation_id
+
+
 async def UpdateAppState(state: AppState, conversation_id: str):
     """Update the app state."""
     try:
+        # The list requests are independent, issue them concurrently over
+        # the pooled connection.
+        requests = [
+            ListConversations(),
+            GetTasks(state.task_cursor, state.server_epoch),
+            GetEvents(state.event_cursor, state.server_epoch),
+            GetProcessingMessages(),
+        ]
+        if conversation_id:
+            requests.append(ListMessages(conversation_id))
+        (
+            conversations,
+            (tasks, task_cursor, task_epoch),
+            (events, event_cursor, event_epoch),
+            background_tasks,
+            *messages,
+        ) = await asyncio.gather(*requests)
         if conversation_id:
             state.current_conversation_id = conversation_id
-            messages = await ListMessages(conversation_id)
-            if not messages:
-                state.messages = []
-            else:
-                state.messages = [convert_message_to_state(x) for x in messages]
-        conversations = await ListConversations()
+            state.messages = [convert_message_to_state(x) for x in messages[0]]
+            state.synced_conversation_id = conversation_id
         if not conversations:
             state.conversations = []
         else:
@@ -151,35 +197,110 @@ async def UpdateAppState(state: AppState, conversation_id: str):
                 convert_conversation_to_state(x) for x in conversations
             ]
 
-        state.task_list = []
-        for task in await GetTasks():
-            state.task_list.append(
-                SessionTask(
-                    context_id=extract_conversation_id(task),
-                    task=convert_task_to_state(task),
-                )
-            )
-        state.background_tasks = await GetProcessingMessages()
+        # A new server sent its full history, start over.
+        if task_epoch != state.server_epoch:
+            state.task_list = []
+        state.task_cursor = task_cursor
+        merge_tasks(state, tasks)
+        if event_epoch != state.server_epoch:
+            state.events = []
+        state.event_cursor = event_cursor
+        state.events.extend(convert_event_to_state(e) for e in events)
+        trim_events(state)
+        state.server_epoch = event_epoch
+        state.background_tasks = background_tasks
         state.message_aliases = GetMessageAliases()
     except Exception as e:
         print('Failed to update state: ', e)
         traceback.print_exc(file=sys.stdout)
 
 
+def ApplyStreamUpdate(state: AppState, payload: str):
+    """Apply an update pushed over the server event stream to the app state."""
+    update = StreamUpdate.model_validate_json(payload)
+    cursor = StreamCursor.decode(update.cursor)
+    state.stream_cursor = update.cursor
+    if cursor.epoch != state.server_epoch:
+        # A new server streams its full history, start over.
+        state.server_epoch = cursor.epoch
+        state.conversations = []
+        state.messages = []
+        state.task_list = []
+        state.task_cursor = 0
+        state.events = []
+        state.event_cursor = 0
+
+    known_conversations = {c.conversation_id: c for c in state.conversations}
+    for conversation in update.conversations:
+        if conversation.conversation_id not in known_conversations:
+            state_conversation = convert_conversation_to_state(conversation)
+            known_conversations[conversation.conversation_id] = (
+                state_conversation
+            )
+            state.conversations.append(state_conversation)
+
+    known_messages = {m.message_id for m in state.messages}
+    for message in update.messages:
+        state_conversation = known_conversations.get(message.context_id or '')
+        if (
+            state_conversation
+            and message.message_id not in state_conversation.message_ids
+        ):
+            state_conversation.message_ids.append(message.message_id)
+        if (
+            message.context_id == state.current_conversation_id
+            and message.message_id not in known_messages
+        ):
+            known_messages.add(message.message_id)
+            state.messages.append(convert_message_to_state(message))
+
+    merge_tasks(state, update.tasks)
+    state.task_cursor = max(state.task_cursor, cursor.task)
+
+    # Events are a log, skip the ones already merged by UpdateAppState.
+    first_sequence = cursor.event - len(update.events) + 1
+    for sequence, event in enumerate(update.events, first_sequence):
+        if sequence > state.event_cursor:
+            state.events.append(convert_event_to_state(event))
+    state.event_cursor = max(state.event_cursor, cursor.event)
+    trim_events(state)
+
+    state.background_tasks = dict(update.pending)
+    state.message_aliases = GetMessageAliases()
+
+
+def trim_events(state: AppState):
+    """Keeps the most recent MAX_STATE_EVENTS events in the app state."""
+    if len(state.events) > MAX_STATE_EVENTS:
+        state.events = state.events[-MAX_STATE_EVENTS:]
+
+
+def merge_tasks(state: AppState, tasks: list[Task]):
+    """Merges changed tasks into the state, replacing ones already known."""
+    index = {t.task.task_id: i for i, t in enumerate(state.task_list)}
+    for task in tasks:
+        session_task = SessionTask(
+            context_id=extract_conversation_id(task),
+            task=convert_task_to_state(task),
+        )
+        if task.id in index:
+            state.task_list[index[task.id]] = session_task
+        else:
+            index[task.id] = len(state.task_list)
+            state.task_list.append(session_task)
+
+
 async def UpdateApiKey(api_key: str):
     """Update the API key"""
-    import httpx
-
     try:
         # Set the environment variable
         os.environ['GOOGLE_API_KEY'] = api_key
 
         # Call the update API endpoint
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f'{server_url}/api_key/update', json={'api_key': api_key}
-            )
-            response.raise_for_status()
+        response = await shared_client_pool.request(
+            'POST', f'{server_url}/api_key/update', json={'api_key': api_key}
+        )
+        response.raise_for_status()
         return True
     except Exception as e:
         print('Failed to update API key: ', e)
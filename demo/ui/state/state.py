@@ -80,6 +80,12 @@ class AppState:
     conversations: list[StateConversation]
     messages: list[StateMessage]
     task_list: list[SessionTask] = dataclasses.field(default_factory=list)
+    # Delta cursors for the task list and event log, see GetTasks/GetEvents.
+    task_cursor: int = 0
+    events: list[StateEvent] = dataclasses.field(default_factory=list)
+    event_cursor: int = 0
+    # Server instance the cursors refer to, see CursorParams.
+    server_epoch: str = ''
     background_tasks: dict[str, str] = dataclasses.field(default_factory=dict)
     message_aliases: dict[str, str] = dataclasses.field(default_factory=dict)
     # This is used to track the data entered in a form
@@ -89,6 +95,11 @@ class AppState:
     # This is used to track the message sent to agent with form data
     form_responses: dict[str, str] = dataclasses.field(default_factory=dict)
     polling_interval: int = 1
+    # When set, updates are pushed by the server instead of polled.
+    live_updates: bool = True
+    stream_cursor: str = ''
+    # Conversation whose full message history is loaded in `messages`.
+    synced_conversation_id: str = ''
 
     # Added for API key management
     api_key: str = ''
@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+
+from unittest import mock
+
+import httpx
+
+from service.client.client import HTTPClientPool
+from utils.agent_card import AgentCardResolver
+
+
+def card_json(name: str = 'agent') -> dict:
+    return {
+        'name': name,
+        'description': 'An agent',
+        'url': 'http://agent',
+        'version': '1.0',
+        'capabilities': {},
+        'default_input_modes': ['text'],
+        'default_output_modes': ['text'],
+        'skills': [],
+    }
+
+
+class FakeAgent:
+    """Serves an agent card and counts the requests made for it."""
+
+    def __init__(self):
+        self.name = 'agent'
+        self.etag = '"v1"'
+        self.requests: list[httpx.Request] = []
+        self.delay = 0.0
+        self.error_status: int | None = None
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        if self.error_status:
+            return httpx.Response(self.error_status)
+        if request.headers.get('if-none-match') == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json=card_json(self.name), headers={'ETag': self.etag}
+        )
+
+
+class AgentCardResolverTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AgentCardResolver."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up test fixtures."""
+        self.agent = FakeAgent()
+        transport = httpx.MockTransport(self.agent.handler)
+        pool = HTTPClientPool(transport=transport)
+        self.resolver = AgentCardResolver(pool, ttl_seconds=60)
+
+    async def asyncTearDown(self) -> None:
+        """Tear down test fixtures."""
+        await self.resolver.http_client_pool.stop()
+
+    async def test_cards_are_cached_within_ttl(self) -> None:
+        """Test a fresh card is served without a request."""
+        card = await self.resolver.get('agent:1234')
+        again = await self.resolver.get('http://agent:1234/')
+        self.assertEqual(card.name, 'agent')
+        self.assertIs(card, again)
+        self.assertEqual(len(self.agent.requests), 1)
+        self.assertEqual(
+            str(self.agent.requests[0].url),
+            'http://agent:1234/.well-known/agent-card.json',
+        )
+
+    async def test_stale_cards_are_revalidated(self) -> None:
+        """Test an expired card is revalidated with its ETag."""
+        with mock.patch('time.monotonic', return_value=0.0):
+            card = await self.resolver.get('agent')
+        with mock.patch('time.monotonic', return_value=100.0):
+            again = await self.resolver.get('agent')
+        self.assertIs(card, again)
+        self.assertEqual(
+            self.agent.requests[1].headers['if-none-match'], '"v1"'
+        )
+
+    async def test_concurrent_fetches_are_coalesced(self) -> None:
+        """Test concurrent requests for one agent share a single fetch."""
+        self.agent.delay = 0.01
+        cards = await self.resolver.get_many(['agent', 'agent', 'agent'])
+        self.assertEqual([c.name for c in cards], ['agent'] * 3)
+        self.assertEqual(len(self.agent.requests), 1)
+
+    async def test_refresh_notifies_changed_cards(self) -> None:
+        """Test a background refresh reports cards that changed."""
+        changed = []
+        self.resolver.add_listener(lambda url, card: changed.append(card))
+        self.resolver.watch('agent')
+        await self.resolver.get('agent')
+        await self.resolver.refresh()
+        self.assertEqual(changed, [])
+        self.agent.name = 'renamed'
+        self.agent.etag = '"v2"'
+        await self.resolver.refresh()
+        self.assertEqual([c.name for c in changed], ['renamed'])
+
+    async def test_listeners_are_registered_once(self) -> None:
+        """Test a listener added twice is called once and can be removed."""
+        changed = []
+
+        def listener(url, card):
+            changed.append(card)
+
+        self.resolver.add_listener(listener)
+        self.resolver.add_listener(listener)
+        self.resolver.watch('agent')
+        await self.resolver.get('agent')
+        self.agent.etag = '"v2"'
+        self.agent.name = 'renamed'
+        await self.resolver.refresh()
+        self.assertEqual(len(changed), 1)
+        self.resolver.remove_listener(listener)
+        self.agent.etag = '"v3"'
+        self.agent.name = 'again'
+        await self.resolver.refresh()
+        self.assertEqual(len(changed), 1)
+
+    async def test_unreachable_agent_serves_last_card(self) -> None:
+        """Test the cached card is kept when revalidation fails."""
+        await self.resolver.get('agent')
+
+        def fail(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError('down', request=request)
+
+        await self.resolver.http_client_pool.stop()
+        self.resolver.http_client_pool = HTTPClientPool(
+            transport=httpx.MockTransport(fail)
+        )
+        card = await self.resolver.get('agent', force=True)
+        self.assertEqual(card.name, 'agent')
+        with self.assertRaises(httpx.ConnectError):
+            await self.resolver.get('other')
+
+    async def test_failing_agent_serves_last_card(self) -> None:
+        """Test the cached card is kept when revalidation gets an error."""
+        await self.resolver.get('agent')
+        self.agent.error_status = 503
+        card = await self.resolver.get('agent', force=True)
+        self.assertEqual(card.name, 'agent')
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.resolver.get('other')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+
+from unittest import mock
+
+from a2a.types import (
+    Artifact,
+    DataPart,
+    Part,
+    TaskArtifactUpdateEvent,
+    TextPart,
+)
+from service.server.artifact_buffer import ArtifactAssemblyBuffer
+
+
+def make_event(
+    parts: list[Part],
+    append: bool | None = None,
+    last_chunk: bool | None = None,
+    artifact_id: str = 'a1',
+) -> TaskArtifactUpdateEvent:
+    return TaskArtifactUpdateEvent(
+        task_id='t1',
+        context_id='c1',
+        artifact=Artifact(artifact_id=artifact_id, parts=parts),
+        append=append,
+        last_chunk=last_chunk,
+    )
+
+
+def text(value: str) -> Part:
+    return Part(root=TextPart(text=value))
+
+
+class ArtifactAssemblyBufferTest(unittest.TestCase):
+    """Tests for the ArtifactAssemblyBuffer."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.buffer = ArtifactAssemblyBuffer(publish_interval=3600)
+
+    def test_whole_artifact_passes_through(self) -> None:
+        """Test an artifact sent in one event is returned as is."""
+        artifact = self.buffer.add('t1', make_event([text('hi')]))
+        self.assertEqual(artifact.parts[0].root.text, 'hi')
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_chunks_are_reassembled_and_coalesced(self) -> None:
+        """Test text chunks are joined and other parts keep their order."""
+        first = self.buffer.add(
+            't1', make_event([text('a')], append=False, last_chunk=False)
+        )
+        # The first chunk is published right away as a partial artifact.
+        self.assertTrue(first.metadata['partial'])
+        self.assertIsNone(
+            self.buffer.add('t1', make_event([text('b')], append=True))
+        )
+        self.buffer.add(
+            't1', make_event([Part(root=DataPart(data={'k': 1}))], append=True)
+        )
+        artifact = self.buffer.add(
+            't1',
+            make_event([text('c'), text('d')], append=True, last_chunk=True),
+        )
+        self.assertEqual(
+            [p.root.kind for p in artifact.parts], ['text', 'data', 'text']
+        )
+        self.assertEqual(artifact.parts[0].root.text, 'ab')
+        self.assertEqual(artifact.parts[2].root.text, 'cd')
+        self.assertIsNone(artifact.metadata)
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_redelivered_artifact_is_not_published_again(self) -> None:
+        """Test identical complete artifacts are deduplicated by content."""
+        self.assertIsNotNone(self.buffer.add('t1', make_event([text('hi')])))
+        self.assertIsNone(self.buffer.add('t1', make_event([text('hi')])))
+        self.assertIsNotNone(self.buffer.add('t1', make_event([text('ho')])))
+
+    def test_append_without_first_chunk(self) -> None:
+        """Test an append for an unknown artifact starts a new one."""
+        self.buffer.add('t1', make_event([text('x')], append=True))
+        artifact = self.buffer.add(
+            't1', make_event([text('y')], append=True, last_chunk=True)
+        )
+        self.assertEqual(artifact.parts[0].root.text, 'xy')
+
+    def test_task_byte_limit_drops_artifact(self) -> None:
+        """Test an artifact over the per task limit is dropped."""
+        buffer = ArtifactAssemblyBuffer(max_task_bytes=4)
+        buffer.add(
+            't1', make_event([text('abc')], append=False, last_chunk=False)
+        )
+        # The partial snapshot already published is replaced.
+        artifact = buffer.add('t1', make_event([text('def')], append=True))
+        self.assertEqual(artifact.metadata, {'incomplete': True})
+        self.assertEqual(artifact.parts[0].root.text, 'abcdef')
+        self.assertEqual(len(buffer), 0)
+        # Later chunks of the dropped artifact are ignored.
+        self.assertIsNone(
+            buffer.add(
+                't1', make_event([text('g')], append=True, last_chunk=True)
+            )
+        )
+        self.assertEqual(len(buffer), 0)
+
+    def test_stale_partials_expire(self) -> None:
+        """Test partial artifacts without new chunks are expired."""
+        with mock.patch('time.monotonic', return_value=100.0):
+            buffer = ArtifactAssemblyBuffer(ttl_seconds=1)
+            buffer.add(
+                't1', make_event([text('a')], append=False, last_chunk=False)
+            )
+        self.assertEqual(len(buffer), 1)
+        with mock.patch('time.monotonic', return_value=200.0):
+            buffer.add('t1', make_event([text('b')], artifact_id='a2'))
+        self.assertEqual(len(buffer), 0)
+
+    def test_duplicate_completion_replaces_snapshot(self) -> None:
+        """Test a redelivered artifact still replaces a partial snapshot."""
+        self.assertIsNotNone(self.buffer.add('t1', make_event([text('ab')])))
+        snapshot = self.buffer.add(
+            't1', make_event([text('a')], append=False, last_chunk=False)
+        )
+        self.assertTrue(snapshot.metadata['partial'])
+        artifact = self.buffer.add(
+            't1', make_event([text('b')], append=True, last_chunk=True)
+        )
+        self.assertEqual(artifact.parts[0].root.text, 'ab')
+        self.assertIsNone(artifact.metadata)
+
+    def test_finish_task_releases_everything(self) -> None:
+        """Test a finished task leaves nothing behind."""
+        self.buffer.add('t1', make_event([text('hi')], artifact_id='a2'))
+        self.buffer.add(
+            't1', make_event([text('a')], append=False, last_chunk=False)
+        )
+        self.assertFalse(self.buffer.empty())
+        artifacts = self.buffer.finish_task('t1')
+        self.assertEqual([a.artifact_id for a in artifacts], ['a1'])
+        self.assertEqual(artifacts[0].metadata, {'incomplete': True})
+        self.assertTrue(self.buffer.empty())
+
+    def test_sweep_expires_silent_streams(self) -> None:
+        """Test a sweep expires partials without waiting for a chunk."""
+        with mock.patch('time.monotonic', return_value=100.0):
+            buffer = ArtifactAssemblyBuffer(ttl_seconds=1)
+            buffer.add('t1', make_event([text('hi')], artifact_id='a2'))
+            buffer.add(
+                't1', make_event([text('a')], append=False, last_chunk=False)
+            )
+        with mock.patch('time.monotonic', return_value=200.0):
+            expired = buffer.sweep()
+        self.assertEqual(len(expired), 1)
+        task_id, artifact = expired[0]
+        self.assertEqual((task_id, artifact.artifact_id), ('t1', 'a1'))
+        self.assertEqual(artifact.metadata, {'incomplete': True})
+        self.assertTrue(buffer.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
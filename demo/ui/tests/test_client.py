@@ -0,0 +1,57 @@
+import asyncio
+import threading
+import unittest
+
+import httpx
+
+from service.client.client import HTTPClientPool
+
+
+class HTTPClientPoolTest(unittest.TestCase):
+    """Tests for the HTTPClientPool."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.threads: list[threading.Thread] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.threads.append(threading.current_thread())
+            return httpx.Response(200, json={'path': request.url.path})
+
+        self.pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+
+    def tearDown(self) -> None:
+        """Tear down test fixtures."""
+        asyncio.run(self.pool.stop())
+
+    def test_loops_share_one_client(self) -> None:
+        """Test requests from successive event loops reuse one client."""
+        clients = []
+
+        async def send(path: str) -> dict:
+            response = await self.pool.request('GET', f'http://ui{path}')
+            clients.append(self.pool._client)
+            return response.json()
+
+        # Like Mesop, which runs each event handler on a new loop.
+        results = [asyncio.run(send(f'/{i}')) for i in range(3)]
+        self.assertEqual([r['path'] for r in results], ['/0', '/1', '/2'])
+        self.assertEqual(len({id(c) for c in clients}), 1)
+        self.assertEqual(len(set(self.threads)), 1)
+        self.assertIsNot(self.threads[0], threading.current_thread())
+
+    def test_stop_closes_the_client(self) -> None:
+        """Test stop closes the client and its loop."""
+        asyncio.run(self.pool.request('GET', 'http://ui/'))
+        client = self.pool._client
+        thread = self.threads[0]
+        asyncio.run(self.pool.stop())
+        self.assertTrue(client.is_closed)
+        self.assertFalse(thread.is_alive())
+        # The pool starts again on the next request.
+        response = asyncio.run(self.pool.request('GET', 'http://ui/again'))
+        self.assertEqual(response.json(), {'path': '/again'})
+
+
+if __name__ == '__main__':
+    unittest.main()
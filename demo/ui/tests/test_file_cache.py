@@ -0,0 +1,160 @@
+import base64
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from a2a.types import FilePart, FileWithBytes, FileWithUri
+from service.server.file_cache import (
+    FileCache,
+    etag_matches,
+    iter_file,
+    parse_range,
+)
+
+
+def make_part(data: bytes, mime_type: str = 'image/png') -> FilePart:
+    return FilePart(
+        file=FileWithBytes(
+            bytes=base64.b64encode(data).decode('utf-8'), mime_type=mime_type
+        )
+    )
+
+
+class FileCacheTest(unittest.TestCase):
+    """Tests for the bounded FileCache."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_put_decodes_and_dedups(self) -> None:
+        """Test identical content is decoded once and stored once."""
+        cache = FileCache()
+        cache.put('a', make_part(b'hello'))
+        cache.put('b', make_part(b'hello'))
+        info_a, content = cache.get('a')
+        info_b, _ = cache.get('b')
+        self.assertEqual(content, b'hello')
+        self.assertEqual(info_a.digest, info_b.digest)
+        self.assertEqual(cache.stats()['memory_files'], 1)
+
+    def test_eviction_without_spill_drops_files(self) -> None:
+        """Test least recently used files are dropped over the size limit."""
+        cache = FileCache(max_memory_bytes=8)
+        cache.put('a', make_part(b'12345'))
+        cache.put('b', make_part(b'67890'))
+        with self.assertRaises(KeyError):
+            cache.get('a')
+        self.assertEqual(cache.get('b')[1], b'67890')
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_eviction_spills_to_disk(self) -> None:
+        """Test evicted files are served from the spill directory."""
+        cache = FileCache(max_memory_bytes=8, spill_dir=self.tmp.name)
+        cache.put('a', make_part(b'12345'))
+        cache.put('b', make_part(b'67890'))
+        info, content = cache.get('a')
+        with content:
+            self.assertEqual(content.read(), b'12345')
+        self.assertEqual(Path(content.name).name, info.digest)
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+
+    def test_spilled_file_stays_readable_after_eviction(self) -> None:
+        """Test a spilled file being served survives its eviction."""
+        cache = FileCache(
+            max_memory_bytes=0, spill_dir=self.tmp.name, max_disk_bytes=8
+        )
+        cache.put('a', make_part(b'12345'))
+        _, content = cache.get('a')
+        cache.put('b', make_part(b'67890'))
+        with self.assertRaises(KeyError):
+            cache.get('a')
+        self.assertEqual(b''.join(iter_file(content, 1, 3)), b'234')
+        self.assertTrue(content.closed)
+
+    def test_uri_files_are_not_cached(self) -> None:
+        """Test remote files only keep their uri."""
+        cache = FileCache()
+        cache.put(
+            'a',
+            FilePart(
+                file=FileWithUri(
+                    uri='https://example.com/a.png', mime_type='image/png'
+                )
+            ),
+        )
+        info, content = cache.get('a')
+        self.assertEqual(info.uri, 'https://example.com/a.png')
+        self.assertIsNone(content)
+
+    def test_non_image_files_are_served_as_sent(self) -> None:
+        """Test only images are base64 decoded."""
+        cache = FileCache()
+        cache.put(
+            'a',
+            FilePart(file=FileWithBytes(bytes='aGk=', mime_type='text/plain')),
+        )
+        cache.put('b', make_part(b'hi'))
+        self.assertEqual(cache.get('a')[1], b'aGk=')
+        self.assertEqual(cache.get('b')[1], b'hi')
+
+    def test_file_ids_are_bounded(self) -> None:
+        """Test the least recently used file ids and their content go."""
+        cache = FileCache(max_files=2)
+        cache.put('a', make_part(b'1'))
+        cache.put('b', make_part(b'2'))
+        cache.get('a')
+        cache.put('c', make_part(b'3'))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.stats()['memory_files'], 2)
+
+    def test_spill_dir_is_bounded_and_cleaned(self) -> None:
+        """Test the spill directory is bounded and emptied on restart."""
+        cache = FileCache(
+            max_memory_bytes=0, spill_dir=self.tmp.name, max_disk_bytes=8
+        )
+        cache.put('a', make_part(b'12345'))
+        cache.put('b', make_part(b'67890'))
+        with self.assertRaises(KeyError):
+            cache.get('a')
+        with cache.get('b')[1] as content:
+            self.assertEqual(content.read(), b'67890')
+        self.assertEqual(len(list(Path(self.tmp.name).iterdir())), 1)
+        unrelated = Path(self.tmp.name) / 'notes.txt'
+        unrelated.write_text('kept')
+        FileCache(spill_dir=self.tmp.name)
+        self.assertEqual(list(Path(self.tmp.name).iterdir()), [unrelated])
+
+    def test_file_ids_are_stable(self) -> None:
+        """Test a message part is always served under the same id."""
+        cache = FileCache()
+        self.assertEqual(cache.file_id('m1:0'), cache.file_id('m1:0'))
+        self.assertNotEqual(cache.file_id('m1:0'), cache.file_id('m1:1'))
+        self.assertNotEqual(cache.file_id('m1:0'), FileCache().file_id('m1:0'))
+
+    def test_etag_matches(self) -> None:
+        """Test If-None-Match lists are compared tag by tag."""
+        self.assertTrue(etag_matches('"abc"', '"abc"'))
+        self.assertTrue(etag_matches('"x", W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches('*', '"abc"'))
+        self.assertFalse(etag_matches('"abcd"', '"abc"'))
+        self.assertFalse(etag_matches('"xabc", "abc2"', '"abc"'))
+        self.assertFalse(etag_matches('', '"abc"'))
+
+    def test_parse_range(self) -> None:
+        """Test byte range parsing."""
+        self.assertEqual(parse_range('bytes=0-4', 10), (0, 4))
+        self.assertEqual(parse_range('bytes=5-', 10), (5, 9))
+        self.assertEqual(parse_range('bytes=-3', 10), (7, 9))
+        self.assertEqual(parse_range('bytes=8-20', 10), (8, 9))
+        with self.assertRaises(ValueError):
+            parse_range('bytes=10-', 10)
+        with self.assertRaises(ValueError):
+            parse_range('bytes=0-1,3-4', 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from a2a.types import Message, Part, Role, TextPart
+from service.server.scheduler import (
+    MessageScheduler,
+    SchedulerClosedError,
+    SchedulerFullError,
+)
+
+
+def make_message(message_id: str, context_id: str) -> Message:
+    return Message(
+        message_id=message_id,
+        context_id=context_id,
+        role=Role.user,
+        parts=[Part(root=TextPart(text=message_id))],
+    )
+
+
+class MessageSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the bounded MessageScheduler."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up test fixtures."""
+        self.processed: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def process(self, message: Message) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.processed.append(message.message_id)
+        self.running -= 1
+
+    async def test_conversation_order_is_preserved(self) -> None:
+        """Test messages of one conversation are processed in order."""
+        scheduler = MessageScheduler(self.process, max_concurrency=4)
+        for i in range(5):
+            scheduler.submit(make_message(f'm{i}', 'c1'))
+        await scheduler.drain()
+        self.assertEqual(self.processed, [f'm{i}' for i in range(5)])
+        self.assertEqual(self.max_running, 1)
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test no more than max_concurrency messages run at once."""
+        scheduler = MessageScheduler(self.process, max_concurrency=2)
+        for i in range(6):
+            scheduler.submit(make_message(f'm{i}', f'c{i}'))
+        await scheduler.drain()
+        self.assertEqual(len(self.processed), 6)
+        self.assertEqual(self.max_running, 2)
+        self.assertEqual(scheduler.metrics()['processed'], 6)
+
+    async def test_full_queue_rejects(self) -> None:
+        """Test submissions beyond max_pending are rejected."""
+        scheduler = MessageScheduler(self.process, max_pending=2)
+        scheduler.submit(make_message('m1', 'c1'))
+        scheduler.submit(make_message('m2', 'c2'))
+        with self.assertRaises(SchedulerFullError):
+            scheduler.submit(make_message('m3', 'c3'))
+        self.assertEqual(scheduler.metrics()['rejected'], 1)
+        await scheduler.drain()
+
+    async def test_drain_rejects_new_messages(self) -> None:
+        """Test messages submitted after draining are rejected."""
+        scheduler = MessageScheduler(self.process)
+        await scheduler.drain()
+        with self.assertRaises(SchedulerClosedError):
+            scheduler.submit(make_message('m1', 'c1'))
+
+    async def test_failures_do_not_block_conversation(self) -> None:
+        """Test a failing message does not stop the next one."""
+
+        async def process(message: Message) -> None:
+            if message.message_id == 'm1':
+                raise ValueError('boom')
+            self.processed.append(message.message_id)
+
+        scheduler = MessageScheduler(process)
+        scheduler.submit(make_message('m1', 'c1'))
+        scheduler.submit(make_message('m2', 'c1'))
+        await scheduler.drain()
+        self.assertEqual(self.processed, ['m2'])
+        self.assertEqual(scheduler.metrics()['failed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
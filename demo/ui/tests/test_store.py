@@ -0,0 +1,162 @@
+import asyncio
+import unittest
+
+from a2a.types import Message, Part, Role, Task, TaskState, TaskStatus, TextPart
+from service.server.store import ApplicationStore
+from service.types import Conversation, Event
+
+
+def make_message(message_id: str, context_id: str, task_id: str | None = None):
+    return Message(
+        message_id=message_id,
+        context_id=context_id,
+        task_id=task_id,
+        role=Role.user,
+        parts=[Part(root=TextPart(text=message_id))],
+    )
+
+
+def make_task(task_id: str, context_id: str) -> Task:
+    return Task(
+        id=task_id,
+        context_id=context_id,
+        status=TaskStatus(state=TaskState.submitted),
+    )
+
+
+class ApplicationStoreTest(unittest.TestCase):
+    """Tests for the indexed ApplicationStore."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.store = ApplicationStore()
+        self.store.add_conversation(
+            Conversation(conversation_id='c1', is_active=True)
+        )
+
+    def test_get_conversation(self) -> None:
+        """Test conversations are looked up by id."""
+        self.assertEqual(
+            self.store.get_conversation('c1').conversation_id, 'c1'
+        )
+        self.assertIsNone(self.store.get_conversation('missing'))
+        self.assertIsNone(self.store.get_conversation(None))
+
+    def test_add_message_appends_to_conversation(self) -> None:
+        """Test messages are appended in order to their conversation."""
+        self.store.add_message(make_message('m1', 'c1'))
+        self.store.add_message(make_message('m2', 'c1'))
+        conversation = self.store.get_conversation('c1')
+        self.assertEqual(
+            [m.message_id for m in conversation.messages], ['m1', 'm2']
+        )
+        self.assertEqual(self.store.last_message('c1').message_id, 'm2')
+        self.assertEqual(
+            self.store.get_conversation_message('c1', 'm1').message_id, 'm1'
+        )
+
+    def test_add_message_with_explicit_conversation(self) -> None:
+        """Test a message can be routed to a conversation other than its context."""
+        conversation = self.store.add_message(make_message('m1', 'other'), 'c1')
+        self.assertIsNotNone(conversation)
+        self.assertEqual(self.store.last_message('c1').message_id, 'm1')
+
+    def test_add_message_unknown_conversation(self) -> None:
+        """Test messages for unknown conversations are still stored."""
+        self.assertIsNone(self.store.add_message(make_message('m1', 'nope')))
+        self.assertIsNotNone(self.store.get_message('m1'))
+
+    def test_update_task_keeps_order(self) -> None:
+        """Test updating a task replaces it without reordering."""
+        self.store.add_task(make_task('t1', 'c1'))
+        self.store.add_task(make_task('t2', 'c1'))
+        updated = make_task('t1', 'c1')
+        updated.status.state = TaskState.completed
+        self.assertTrue(self.store.update_task(updated))
+        self.assertEqual([t.id for t in self.store.tasks], ['t1', 't2'])
+        self.assertEqual(
+            self.store.get_task('t1').status.state, TaskState.completed
+        )
+
+    def test_update_unknown_task(self) -> None:
+        """Test updating an unknown task is a no-op."""
+        self.assertFalse(self.store.update_task(make_task('t1', 'c1')))
+        self.assertFalse(self.store.has_task('t1'))
+
+    def test_tasks_for_context(self) -> None:
+        """Test tasks are indexed by context id."""
+        self.store.add_task(make_task('t1', 'c1'))
+        self.store.add_task(make_task('t2', 'c2'))
+        self.store.add_task(make_task('t3', 'c1'))
+        self.assertEqual(
+            [t.id for t in self.store.tasks_for_context('c1')], ['t1', 't3']
+        )
+        self.assertEqual(self.store.tasks_for_context('c3'), [])
+
+    def test_tasks_since_returns_changes_only(self) -> None:
+        """Test the task cursor only yields tasks changed after it."""
+        self.store.add_task(make_task('t1', 'c1'))
+        self.store.add_task(make_task('t2', 'c1'))
+        tasks, cursor = self.store.tasks_since(0)
+        self.assertEqual([t.id for t in tasks], ['t1', 't2'])
+
+        self.store.update_task(make_task('t1', 'c1'))
+        tasks, next_cursor = self.store.tasks_since(cursor)
+        self.assertEqual([t.id for t in tasks], ['t1'])
+        self.assertGreater(next_cursor, cursor)
+        self.assertEqual(self.store.tasks_since(next_cursor)[0], [])
+
+    def test_tasks_since_stale_cursor_resyncs(self) -> None:
+        """Test a cursor ahead of the store returns the full task list."""
+        self.store.add_task(make_task('t1', 'c1'))
+        tasks, cursor = self.store.tasks_since(100)
+        self.assertEqual([t.id for t in tasks], ['t1'])
+        self.assertEqual(cursor, 1)
+
+    def test_events_since(self) -> None:
+        """Test events are returned in insertion order after the cursor."""
+        for i in range(3):
+            self.store.add_event(
+                Event(
+                    id=f'e{i}',
+                    content=make_message(f'm{i}', 'c1'),
+                    timestamp=3 - i,
+                )
+            )
+        events, cursor = self.store.events_since(1)
+        self.assertEqual([e.id for e in events], ['e1', 'e2'])
+        self.assertEqual(cursor, 3)
+        self.assertEqual(self.store.events_since(cursor), ([], 3))
+
+    def test_messages_and_conversations_since(self) -> None:
+        """Test new conversations and messages are logged for push clients."""
+        self.store.add_message(make_message('m1', 'c1'))
+        conversations, conversation_cursor = self.store.conversations_since(0)
+        self.assertEqual([c.conversation_id for c in conversations], ['c1'])
+        self.assertEqual(
+            self.store.conversations_since(conversation_cursor)[0], []
+        )
+        self.store.add_message(make_message('m2', 'c1'))
+        messages, cursor = self.store.messages_since(1)
+        self.assertEqual([m.message_id for m in messages], ['m2'])
+        self.assertEqual(cursor, 2)
+
+    def test_changes_wake_subscribers(self) -> None:
+        """Test subscribers are woken up when the store changes."""
+
+        async def run() -> None:
+            changed = self.store.changes.subscribe()
+            self.assertFalse(changed.is_set())
+            self.store.add_task(make_task('t1', 'c1'))
+            await asyncio.wait_for(changed.wait(), 1)
+            self.store.changes.unsubscribe(changed)
+            changed.clear()
+            self.store.add_task(make_task('t2', 'c1'))
+            await asyncio.sleep(0)
+            self.assertFalse(changed.is_set())
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,173 @@
-import requests
+import asyncio
+import os
+import time
+import traceback
+
+from collections.abc import Callable
+
+import httpx
 
 from a2a.types import AgentCard
 from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
+from pydantic import BaseModel
+from service.client.client import HTTPClientPool, shared_client_pool
 
 
-def get_agent_card(remote_agent_address: str) -> AgentCard:
-    """Get the agent card."""
+AgentCardListener = Callable[[str, AgentCard], None]
+
+
+class CachedAgentCard(BaseModel):
+    card: AgentCard
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+
+class AgentCardResolver:
+    """Fetches agent cards asynchronously and caches them with a TTL.
+
+    Cards older than `ttl_seconds` are revalidated with If-None-Match /
+    If-Modified-Since, so unchanged cards cost a 304. Concurrent requests for
+    the same address on the same event loop share a single fetch. Watched
+    addresses can be refreshed in parallel in the background, and listeners
+    are told about cards that changed.
+    """
+
+    def __init__(
+        self,
+        http_client_pool: HTTPClientPool = shared_client_pool,
+        ttl_seconds: float = 300,
+    ):
+        self.http_client_pool = http_client_pool
+        self.ttl_seconds = ttl_seconds
+        self._cache: dict[str, CachedAgentCard] = {}
+        self._inflight: dict[
+            tuple[asyncio.AbstractEventLoop, str], asyncio.Future
+        ] = {}
+        self._watched: set[str] = set()
+        self._listeners: list[AgentCardListener] = []
+        self._refresh_task: asyncio.Task | None = None
+
+    async def get(self, address: str, force: bool = False) -> AgentCard:
+        """Returns the card of the agent at `address`."""
+        url = normalize_address(address)
+        cached = self._cache.get(url)
+        if (
+            cached
+            and not force
+            and time.monotonic() - cached.fetched_at < self.ttl_seconds
+        ):
+            return cached.card
+        key = (asyncio.get_running_loop(), url)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(url))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _fetch(self, url: str) -> AgentCard:
+        cached = self._cache.get(url)
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        try:
+            response = await self.http_client_pool.request(
+                'GET', f'{url}{AGENT_CARD_WELL_KNOWN_PATH}', headers=headers
+            )
+        except httpx.HTTPError as e:
+            if not cached:
+                raise
+            # Keep serving the last known card while the agent is unreachable.
+            print('Failed to revalidate agent card', url, e)
+            return cached.card
+        if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+            cached.fetched_at = time.monotonic()
+            return cached.card
+        if cached and not response.is_success:
+            print(
+                'Failed to revalidate agent card',
+                url,
+                response.status_code,
+            )
+            return cached.card
+        response.raise_for_status()
+        card = AgentCard(**response.json())
+        self._cache[url] = CachedAgentCard(
+            card=card,
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified'),
+            fetched_at=time.monotonic(),
+        )
+        if cached and cached.card != card:
+            for listener in self._listeners:
+                listener(url, card)
+        return card
+
+    async def get_many(self, addresses: list[str]) -> list[AgentCard]:
+        """Fetches the cards of many agents concurrently."""
+        return await asyncio.gather(*(self.get(a) for a in addresses))
+
+    def add_listener(self, listener: AgentCardListener):
+        """Registers a callback invoked with (url, card) when a card changes."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: AgentCardListener):
+        """Unregisters a callback added with `add_listener`."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def watch(self, address: str):
+        """Keeps the card of `address` fresh with the background refresh."""
+        self._watched.add(normalize_address(address))
+
+    async def refresh(self):
+        """Revalidates every watched card in parallel."""
+        urls = list(self._watched)
+        results = await asyncio.gather(
+            *(self.get(url, force=True) for url in urls),
+            return_exceptions=True,
+        )
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, Exception):
+                print('Failed to refresh agent card', url, result)
+
+    def start_refresh(self):
+        """Starts refreshing watched cards every TTL on the running loop."""
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl_seconds)
+            try:
+                await self.refresh()
+            except Exception:
+                traceback.print_exc()
+
+    async def stop(self):
+        """Stops the background refresh. Call on shutdown."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+
+def normalize_address(remote_agent_address: str) -> str:
     if not remote_agent_address.startswith(('http://', 'https://')):
         remote_agent_address = 'http://' + remote_agent_address
-    agent_card = requests.get(
-        f'{remote_agent_address}{AGENT_CARD_WELL_KNOWN_PATH}'
-    )
-    return AgentCard(**agent_card.json())
+    return remote_agent_address.rstrip('/')
+
+
+agent_card_resolver = AgentCardResolver(
+    ttl_seconds=float(os.environ.get('A2A_UI_AGENT_CARD_TTL', '300'))
+)
+
+
+async def get_agent_card(remote_agent_address: str) -> AgentCard:
+    """Get the agent card."""
+    return await agent_card_resolver.get(remote_agent_address)
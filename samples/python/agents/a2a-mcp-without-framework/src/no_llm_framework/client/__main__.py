@@ -12,11 +12,18 @@ from no_llm_framework.client.agent import Agent
 @click.option('--port', 'port', default=9999)
 @click.option('--mode', 'mode', default='streaming')
 @click.option('--question', 'question', required=True)
+@click.option(
+    '--dispatch',
+    'dispatch',
+    type=click.Choice(['sequential', 'buffered', 'interleaved']),
+    default='sequential',
+)
 async def a_main(
     host: str,
     port: int,
     mode: Literal['completion', 'streaming'],
     question: str,
+    dispatch: Literal['sequential', 'buffered', 'interleaved'],
 ):
     """Main function to run the A2A Repo Agent client.
 
@@ -25,19 +32,23 @@ async def a_main(
         port (int): The port number to run the server on.
         mode (Literal['completion', 'streaming']): The mode to run the server on.
         question (str): The question to ask the Agent.
+        dispatch (str): How to call the agents chosen in one step.
     """  # noqa: E501
     agent = Agent(
-        mode='stream',
         token_stream_callback=None,
         agent_urls=[f'http://{host}:{port}/'],
+        dispatch=dispatch,
     )
-    async for chunk in agent.stream(question):
-        if chunk.startswith('<Agent name="'):
-            print(colorama.Fore.CYAN + chunk, end='', flush=True)
-        elif chunk.startswith('</Agent>'):
-            print(colorama.Fore.RESET + chunk, end='', flush=True)
-        else:
-            print(chunk, end='', flush=True)
+    try:
+        async for chunk in agent.stream(question):
+            if chunk.startswith('<Agent name="'):
+                print(colorama.Fore.CYAN + chunk, end='', flush=True)
+            elif chunk.startswith('</Agent>'):
+                print(colorama.Fore.RESET + chunk, end='', flush=True)
+            else:
+                print(chunk, end='', flush=True)
+    finally:
+        await agent.close()
 
 
 def main() -> None:
@@ -1,15 +1,16 @@
 import asyncio
 import json
 import re
+import time
 
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable
 from pathlib import Path
 from typing import Literal
 from uuid import uuid4
 
 import httpx
 
-from a2a.client import A2ACardResolver, A2AClient
+from a2a.client import A2ACardResolver, A2AClient, A2AClientError
 from a2a.types import (
     AgentCard,
     Message,
@@ -21,10 +22,10 @@ from a2a.types import (
     TaskStatusUpdateEvent,
     TextPart,
 )
-from google import genai
 from jinja2 import Template
 
 from no_llm_framework.client.constant import GOOGLE_API_KEY
+from no_llm_framework.llm import LLMBackend, get_llm_backend
 
 
 dir_path = Path(__file__).parent
@@ -39,83 +40,96 @@ with Path(dir_path / 'agent_answer.jinja').open('r') as f:
     agent_answer_template = Template(f.read())
 
 
-def stream_llm(prompt: str) -> Generator[str]:
-    """Stream LLM response.
-
-    Args:
-        prompt (str): The prompt to send to the LLM.
-
-    Returns:
-        Generator[str, None, None]: A generator of the LLM response.
-    """
-    client = genai.Client(vertexai=False, api_key=GOOGLE_API_KEY)
-    for chunk in client.models.generate_content_stream(
-        model='gemini-2.5-flash-lite',
-        contents=prompt,
-    ):
-        yield chunk.text
-
-
 class Agent:
-    """Agent for interacting with the Google Gemini LLM in different modes."""
+    """Agent for interacting with the Google Gemini LLM."""
 
     def __init__(
         self,
-        mode: Literal['complete', 'stream'] = 'stream',
         token_stream_callback: Callable[[str], None] | None = None,
         agent_urls: list[str] | None = None,
         agent_prompt: str | None = None,
+        llm: LLMBackend | None = None,
+        dispatch: Literal['sequential', 'buffered', 'interleaved'] = (
+            'sequential'
+        ),
+        registry_ttl: float = 300,
     ):
-        self.mode = mode
+        self.llm = llm or get_llm_backend(GOOGLE_API_KEY)
         self.token_stream_callback = token_stream_callback
         self.agent_urls = agent_urls
         self.agents_registry: dict[str, AgentCard] = {}
+        # How the agents chosen in one step are called, see `call_agents`.
+        self.dispatch = dispatch
+        self.registry_ttl = registry_ttl
+        self._agent_prompt = ''
+        self._registry_expires_at = 0.0
+        self._httpx_client: httpx.AsyncClient | None = None
+
+    @property
+    def httpx_client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client shared by all calls to the agents."""
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(timeout=httpx.Timeout(60))
+        return self._httpx_client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
 
     async def get_agents(self) -> tuple[dict[str, AgentCard], str]:
         """Retrieve agent cards from all agent URLs and render the agent prompt.
 
+        The agent cards are cached for `registry_ttl` seconds. If they cannot
+        be fetched again once expired, the cached ones are kept.
+
         Returns:
             tuple[dict[str, AgentCard], str]: A dictionary mapping agent names to AgentCard objects, and the rendered agent prompt string.
         """
-        async with httpx.AsyncClient() as httpx_client:
-            card_resolvers = [
-                A2ACardResolver(httpx_client, url) for url in self.agent_urls
-            ]
+        if (
+            self.agents_registry
+            and time.monotonic() < self._registry_expires_at
+        ):
+            return self.agents_registry, self._agent_prompt
+        card_resolvers = [
+            A2ACardResolver(self.httpx_client, url) for url in self.agent_urls
+        ]
+        try:
             agent_cards = await asyncio.gather(
                 *[
                     card_resolver.get_agent_card()
                     for card_resolver in card_resolvers
                 ]
             )
-            agents_registry = {
-                agent_card.name: agent_card for agent_card in agent_cards
-            }
-            agent_prompt = agents_template.render(agent_cards=agent_cards)
-            return agents_registry, agent_prompt
-
-    def call_llm(self, prompt: str) -> str:
-        """Call the LLM with the given prompt and return the response as a string or generator.
+        except A2AClientError:
+            if not self.agents_registry:
+                raise
+            return self.agents_registry, self._agent_prompt
+        self.agents_registry = {
+            agent_card.name: agent_card for agent_card in agent_cards
+        }
+        self._agent_prompt = agents_template.render(agent_cards=agent_cards)
+        self._registry_expires_at = time.monotonic() + self.registry_ttl
+        return self.agents_registry, self._agent_prompt
+
+    def call_llm(self, prompt: str) -> AsyncGenerator[str]:
+        """Call the LLM with the given prompt and return a generator of responses.
 
         Args:
             prompt (str): The prompt to send to the LLM.
 
         Returns:
-            str or Generator[str]: The LLM response as a string or generator, depending on mode.
+            AsyncGenerator[str]: An async generator yielding the LLM's response.
         """
-        if self.mode == 'complete':
-            return stream_llm(prompt)
-
-        result = ''
-        for chunk in stream_llm(prompt):
-            result += chunk
-        return result
+        return self.llm.stream(prompt)
 
     async def decide(
         self,
         question: str,
         agents_prompt: str,
         called_agents: list[dict] | None = None,
-    ) -> Generator[str, None]:
+    ) -> AsyncGenerator[str]:
         """Decide which agent(s) to use to answer the question.
 
         Args:
@@ -124,7 +138,7 @@ class Agent:
             called_agents (list[dict] | None): Previously called agents and their answers.
 
         Returns:
-            Generator[str, None]: The LLM's response as a generator of strings.
+            AsyncGenerator[str]: The LLM's response as an async generator of strings.
         """
         if called_agents:
             call_agent_prompt = agent_answer_template.render(
@@ -163,27 +177,113 @@ class Agent:
         Yields:
             str: The streaming response from the agent.
         """
-        async with httpx.AsyncClient() as httpx_client:
-            client = A2AClient(httpx_client, agent_card=agent_card)
-            message = MessageSendParams(
-                message=Message(
-                    role=Role.user,
-                    parts=[Part(TextPart(text=message))],
-                    message_id=uuid4().hex,
-                    task_id=uuid4().hex,
-                )
+        client = A2AClient(self.httpx_client, agent_card=agent_card)
+        message = MessageSendParams(
+            message=Message(
+                role=Role.user,
+                parts=[Part(TextPart(text=message))],
+                message_id=uuid4().hex,
+                task_id=uuid4().hex,
             )
+        )
 
-            streaming_request = SendStreamingMessageRequest(
-                id=str(uuid4().hex), params=message
-            )
-            async for chunk in client.send_message_streaming(streaming_request):
-                if isinstance(
-                    chunk.root, SendStreamingMessageSuccessResponse
-                ) and isinstance(chunk.root.result, TaskStatusUpdateEvent):
-                    message = chunk.root.result.status.message
-                    if message:
-                        yield message.parts[0].root.text
+        streaming_request = SendStreamingMessageRequest(
+            id=str(uuid4().hex), params=message
+        )
+        async for chunk in client.send_message_streaming(streaming_request):
+            if isinstance(
+                chunk.root, SendStreamingMessageSuccessResponse
+            ) and isinstance(chunk.root.result, TaskStatusUpdateEvent):
+                message = chunk.root.result.status.message
+                if message:
+                    yield message.parts[0].root.text
+
+    def _on_token(self, chunk: str) -> None:
+        if self.token_stream_callback:
+            self.token_stream_callback(chunk)
+
+    async def call_agents(
+        self,
+        agents: list[dict],
+        agents_registry: dict[str, AgentCard],
+        answers: dict[int, str],
+    ) -> AsyncGenerator[str]:
+        """Call the agents chosen in one step and stream their responses.
+
+        With the 'sequential' dispatch the agents are called one after
+        another. Otherwise they are called concurrently: 'buffered' streams
+        the first agent live and buffers the others until their turn, so the
+        output is the same as 'sequential', while 'interleaved' streams the
+        chunks as they arrive, each wrapped in the tags of its agent.
+
+        Args:
+            agents (list[dict]): The agents to call, with their prompts.
+            agents_registry (dict[str, AgentCard]): The known agents.
+            answers (dict[int, str]): Filled with the full response of each
+                agent, by index in `agents`.
+
+        Yields:
+            str: The responses, tagged with the name of their agent.
+        """
+        if self.dispatch == 'sequential':
+            for i, agent in enumerate(agents):
+                answers[i] = ''
+                yield f'<Agent name="{agent["name"]}">\n'
+                async for chunk in self.send_message_to_an_agent(
+                    agents_registry[agent['name']], agent['prompt']
+                ):
+                    answers[i] += chunk
+                    self._on_token(chunk)
+                    yield chunk
+                yield '</Agent>\n'
+            return
+
+        interleaved = self.dispatch == 'interleaved'
+        shared_queue: asyncio.Queue = asyncio.Queue()
+        queues = [
+            shared_queue if interleaved else asyncio.Queue() for _ in agents
+        ]
+
+        async def produce(i: int, agent: dict) -> None:
+            answers[i] = ''
+            try:
+                async for chunk in self.send_message_to_an_agent(
+                    agents_registry[agent['name']], agent['prompt']
+                ):
+                    answers[i] += chunk
+                    await queues[i].put((i, chunk))
+            finally:
+                await queues[i].put((i, None))
+
+        tasks = [
+            asyncio.create_task(produce(i, agent))
+            for i, agent in enumerate(agents)
+        ]
+        try:
+            if interleaved:
+                remaining = len(agents)
+                while remaining:
+                    i, chunk = await shared_queue.get()
+                    if chunk is None:
+                        remaining -= 1
+                        # Raises the error of the agent, if it failed.
+                        await tasks[i]
+                        continue
+                    yield f'<Agent name="{agents[i]["name"]}">\n'
+                    self._on_token(chunk)
+                    yield chunk
+                    yield '</Agent>\n'
+            else:
+                for i, agent in enumerate(agents):
+                    yield f'<Agent name="{agent["name"]}">\n'
+                    while (item := await queues[i].get())[1] is not None:
+                        self._on_token(item[1])
+                        yield item[1]
+                    await tasks[i]
+                    yield '</Agent>\n'
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def stream(self, question: str):
         """Stream the process of answering a question, possibly involving multiple agents.
@@ -198,7 +298,7 @@ class Agent:
         for _ in range(3):
             agents_registry, agent_prompt = await self.get_agents()
             response = ''
-            for chunk in await self.decide(
+            async for chunk in await self.decide(
                 question, agent_prompt, agent_answers
             ):
                 response += chunk
@@ -208,22 +308,16 @@ class Agent:
 
             agents = self.extract_agents(response)
             if agents:
-                for agent in agents:
-                    agent_response = ''
-                    agent_card = agents_registry[agent['name']]
-                    yield f'<Agent name="{agent["name"]}">\n'
-                    async for chunk in self.send_message_to_an_agent(
-                        agent_card, agent['prompt']
-                    ):
-                        agent_response += chunk
-                        if self.token_stream_callback:
-                            self.token_stream_callback(chunk)
-                        yield chunk
-                    yield '</Agent>\n'
+                answers: dict[int, str] = {}
+                async for chunk in self.call_agents(
+                    agents, agents_registry, answers
+                ):
+                    yield chunk
+                for i, agent in enumerate(agents):
                     match = re.search(
-                        r'<Answer>(.*?)</Answer>', agent_response, re.DOTALL
+                        r'<Answer>(.*?)</Answer>', answers[i], re.DOTALL
                     )
-                    answer = match.group(1).strip() if match else agent_response
+                    answer = match.group(1).strip() if match else answers[i]
                     agent_answers.append(
                         {
                             'name': agent['name'],
@@ -243,7 +337,6 @@ if __name__ == '__main__':
     async def main():
         """Main function to run the A2A Repo Agent client."""
         agent = Agent(
-            mode='stream',
             token_stream_callback=None,
             agent_urls=['http://localhost:9999/'],
         )
@@ -0,0 +1,81 @@
+import asyncio
+import os
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
+from functools import cache
+
+from google import genai
+
+
+class LLMBackend(ABC):
+    """Streams LLM responses without blocking the event loop."""
+
+    @abstractmethod
+    def stream(self, prompt: str) -> AsyncGenerator[str]:
+        """Stream the response to a prompt.
+
+        Args:
+            prompt (str): The prompt to send to the LLM.
+
+        Returns:
+            AsyncGenerator[str]: An async generator of the response chunks.
+        """
+
+
+class GeminiLLMBackend(LLMBackend):
+    """Streams responses from Gemini with the native async API."""
+
+    def __init__(
+        self, api_key: str | None, model: str = 'gemini-2.5-flash-lite'
+    ):
+        self.client = genai.Client(vertexai=False, api_key=api_key)
+        self.model = model
+
+    async def stream(self, prompt: str) -> AsyncGenerator[str]:
+        async for chunk in await self.client.aio.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+        ):
+            if chunk.text:
+                yield chunk.text
+
+
+class FakeLLMBackend(LLMBackend):
+    """Streams a canned response, to run the agents without an LLM.
+
+    Each chunk is delayed by `delay` seconds to mimic token streaming, so
+    the concurrency of the agents can be measured locally.
+    """
+
+    def __init__(
+        self,
+        response: str = 'This is a fake answer. <Answer>Done</Answer>',
+        chunk_size: int = 8,
+        delay: float = 0.05,
+    ):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.delay = delay
+
+    async def stream(self, prompt: str) -> AsyncGenerator[str]:
+        for start in range(0, len(self.response), self.chunk_size):
+            await asyncio.sleep(self.delay)
+            yield self.response[start : start + self.chunk_size]
+
+
+@cache
+def get_llm_backend(api_key: str | None) -> LLMBackend:
+    """Get the LLM backend shared by the agents.
+
+    Set LLM_BACKEND=fake to use the FakeLLMBackend instead of Gemini.
+
+    Args:
+        api_key (str | None): The Google API key.
+
+    Returns:
+        LLMBackend: The backend, created once per API key.
+    """
+    if os.getenv('LLM_BACKEND', '').lower() == 'fake':
+        return FakeLLMBackend()
+    return GeminiLLMBackend(api_key)
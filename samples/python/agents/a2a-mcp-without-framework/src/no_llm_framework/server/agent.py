@@ -2,16 +2,15 @@ import asyncio
 import json
 import re
 
-from collections.abc import AsyncGenerator, Callable, Generator
+from collections.abc import AsyncGenerator, Callable
 from pathlib import Path
-from typing import Literal
 
-from google import genai
 from jinja2 import Template
 from mcp.types import CallToolResult
 
+from no_llm_framework.llm import LLMBackend, get_llm_backend
 from no_llm_framework.server.constant import GOOGLE_API_KEY
-from no_llm_framework.server.mcp import call_mcp_tool, get_mcp_tool_prompt
+from no_llm_framework.server.mcp import MCPConnection
 
 
 dir_path = Path(__file__).parent
@@ -26,50 +25,35 @@ with Path(dir_path / 'called_tools_history.jinja').open('r') as f:
     called_tools_history_template = Template(f.read())
 
 
-def stream_llm(prompt: str) -> Generator[str, None]:
-    """Stream LLM response.
-
-    Args:
-        prompt (str): The prompt to send to the LLM.
-
-    Returns:
-        Generator[str, None, None]: A generator of the LLM response.
-    """
-    client = genai.Client(vertexai=False, api_key=GOOGLE_API_KEY)
-    for chunk in client.models.generate_content_stream(
-        model='gemini-2.5-flash-lite',
-        contents=prompt,
-    ):
-        yield chunk.text
-
-
 class Agent:
-    """Agent for interacting with the Google Gemini LLM in different modes."""
+    """Agent for interacting with the Google Gemini LLM."""
 
     def __init__(
         self,
-        mode: Literal['complete', 'stream'] = 'stream',
         token_stream_callback: Callable[[str], None] | None = None,
         mcp_url: str | None = None,
+        llm: LLMBackend | None = None,
     ):
-        self.mode = mode
+        self.llm = llm or get_llm_backend(GOOGLE_API_KEY)
         self.token_stream_callback = token_stream_callback
         self.mcp_url = mcp_url
+        # Kept open for the lifetime of the agent.
+        self.mcp = MCPConnection(mcp_url) if mcp_url else None
 
-    def call_llm(self, prompt: str) -> Generator[str, None]:
+    def call_llm(self, prompt: str) -> AsyncGenerator[str]:
         """Call the LLM with the given prompt and return a generator of responses.
 
         Args:
             prompt (str): The prompt to send to the LLM.
 
         Returns:
-            Generator[str, None]: A generator yielding the LLM's response.
+            AsyncGenerator[str]: An async generator yielding the LLM's response.
         """
-        return stream_llm(prompt)
+        return self.llm.stream(prompt)
 
     async def decide(
         self, question: str, called_tools: list[dict] | None = None
-    ) -> Generator[str, None]:
+    ) -> AsyncGenerator[str]:
         """Decide which tool to use to answer the question.
 
         Args:
@@ -78,7 +62,7 @@ class Agent:
         """
         if self.mcp_url is None:
             return self.call_llm(question)
-        tool_prompt = await get_mcp_tool_prompt(self.mcp_url)
+        tool_prompt = await self.mcp.get_tool_prompt()
         if called_tools:
             called_tools_prompt = called_tools_history_template.render(
                 called_tools=called_tools
@@ -106,18 +90,23 @@ class Agent:
         return []
 
     async def call_tool(self, tools: list[dict]) -> list[CallToolResult]:
-        """Call the tool.
+        """Call the tools concurrently over the agent's MCP session.
 
         Args:
             tools (list[dict]): The tools to call.
         """
         return await asyncio.gather(
             *[
-                call_mcp_tool(self.mcp_url, tool['name'], tool['arguments'])
+                self.mcp.call_tool(tool['name'], tool['arguments'])
                 for tool in tools
             ]
         )
 
+    async def close(self) -> None:
+        """Close the MCP session."""
+        if self.mcp:
+            await self.mcp.close()
+
     async def stream(self, question: str) -> AsyncGenerator[str]:
         """Stream the process of answering a question, possibly involving tool calls.
 
@@ -136,7 +125,7 @@ class Agent:
             }
 
             response = ''
-            for chunk in await self.decide(question, called_tools):
+            async for chunk in await self.decide(question, called_tools):
                 response += chunk
                 yield {
                     'is_task_complete': False,
@@ -17,7 +17,6 @@ class HelloWorldAgentExecutor(AgentExecutor):
 
     def __init__(self):
         self.agent = Agent(
-            mode='stream',
             token_stream_callback=print,
             mcp_url='https://gitmcp.io/google/A2A',
         )
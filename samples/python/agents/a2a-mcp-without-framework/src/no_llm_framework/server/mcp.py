@@ -1,10 +1,19 @@
 import asyncio
+
 from pathlib import Path
 
+import anyio
+
 from jinja2 import Template
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
-from mcp.types import CallToolResult, TextContent
+from mcp.types import (
+    CallToolResult,
+    ServerNotification,
+    TextContent,
+    ToolListChangedNotification,
+)
+
 
 dir_path = Path(__file__).parent
 
@@ -12,6 +21,115 @@ with Path(dir_path / 'tool.jinja').open('r') as f:
     template = Template(f.read())
 
 
+class MCPConnection:
+    """A persistent connection to an MCP server for the lifetime of an agent.
+
+    The session is opened on first use and shared by every call, concurrent
+    tool calls are multiplexed over it. The rendered tool prompt is cached
+    until the server sends a `tools/list_changed` notification.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._session: ClientSession | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._tool_prompt: str | None = None
+
+    async def session(self) -> ClientSession:
+        """Returns the open session, connecting first if needed."""
+        async with self._lock:
+            if self._session is None:
+                self._closing = asyncio.Event()
+                ready = asyncio.get_running_loop().create_future()
+                # The transport must be entered and exited by the same task.
+                self._task = asyncio.create_task(self._run(ready))
+                await ready
+            return self._session
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            async with (
+                sse_client(self.url) as (read, write),
+                ClientSession(
+                    read, write, message_handler=self._handle_message
+                ) as session,
+            ):
+                await session.initialize()
+                self._session = session
+                ready.set_result(None)
+                await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            self._session = None
+            self._tool_prompt = None
+
+    async def _handle_message(self, message) -> None:
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ToolListChangedNotification
+        ):
+            self._tool_prompt = None
+
+    async def get_tool_prompt(self) -> str:
+        """Get the MCP tool prompt, listing the tools only when needed.
+
+        Returns:
+            str: The MCP tool prompt.
+        """
+        if self._tool_prompt is None:
+            session = await self.session()
+            resources = await session.list_tools()
+            self._tool_prompt = template.render(tools=resources.tools)
+        return self._tool_prompt
+
+    async def call_tool(
+        self, tool_name: str, arguments: dict | None = None
+    ) -> CallToolResult:
+        """Call an MCP tool, reconnecting once if the connection was lost.
+
+        Args:
+            tool_name (str): The name of the tool to call.
+            arguments (dict | None, optional): The arguments to pass to the tool. Defaults to None.
+
+        Returns:
+            CallToolResult: The result of the tool call.
+        """  # noqa: E501
+        session = await self.session()
+        try:
+            return await session.call_tool(tool_name, arguments=arguments)
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await self.close()
+            session = await self.session()
+            return await session.call_tool(tool_name, arguments=arguments)
+
+    async def close(self) -> None:
+        """Close the session."""
+        if self._task:
+            self._closing.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+_connections: dict[str, MCPConnection] = {}
+
+
+def get_mcp_connection(url: str) -> MCPConnection:
+    """Get the shared connection to the MCP server at a given URL.
+
+    Args:
+        url (str): The URL of the MCP server.
+
+    Returns:
+        MCPConnection: The connection.
+    """
+    if url not in _connections:
+        _connections[url] = MCPConnection(url)
+    return _connections[url]
+
+
 async def get_mcp_tool_prompt(url: str) -> str:
     """Get the MCP tool prompt for a given URL.
 
@@ -21,14 +139,7 @@ async def get_mcp_tool_prompt(url: str) -> str:
     Returns:
         str: The MCP tool prompt.
     """
-    async with (
-        sse_client(url) as (read, write),
-        ClientSession(read, write) as session,
-    ):
-        await session.initialize()
-
-        resources = await session.list_tools()
-        return template.render(tools=resources.tools)
+    return await get_mcp_connection(url).get_tool_prompt()
 
 
 async def call_mcp_tool(
@@ -44,22 +155,19 @@ async def call_mcp_tool(
     Returns:
         CallToolResult: The result of the tool call.
     """  # noqa: E501
-    async with (
-        sse_client(
-            url=url,
-        ) as (read, write),
-        ClientSession(read, write) as session,
-    ):
-        await session.initialize()
-
-        return await session.call_tool(tool_name, arguments=arguments)
+    return await get_mcp_connection(url).call_tool(tool_name, arguments)
 
 
 if __name__ == '__main__':
-    print(asyncio.run(get_mcp_tool_prompt('https://gitmcp.io/google/A2A')))
-    result = asyncio.run(
-        call_mcp_tool('https://gitmcp.io/google/A2A', 'fetch_A2A_documentation')
-    )
-    for content in result.content:
-        if isinstance(content, TextContent):
-            print(content.text)
+
+    async def main():
+        """Main function."""
+        connection = MCPConnection('https://gitmcp.io/google/A2A')
+        print(await connection.get_tool_prompt())
+        result = await connection.call_tool('fetch_A2A_documentation')
+        for content in result.content:
+            if isinstance(content, TextContent):
+                print(content.text)
+        await connection.close()
+
+    asyncio.run(main())
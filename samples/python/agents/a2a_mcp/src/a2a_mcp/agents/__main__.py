@@ -4,6 +4,7 @@ import json
 import logging
 import sys
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import click
@@ -20,6 +21,7 @@ from a2a.server.tasks import (
 from a2a.types import AgentCard
 from a2a_mcp.common import prompts
 from a2a_mcp.common.agent_executor import GenericAgentExecutor
+from a2a_mcp.common.workflow import close_shared_clients
 from adk_travel_agent import TravelAgent
 from langgraph_planner_agent import LangGraphPlannerAgent
 from orchestrator_agent import OrchestratorAgent
@@ -28,6 +30,13 @@ from orchestrator_agent import OrchestratorAgent
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Closes the connections shared by the workflow nodes on shutdown."""
+    yield
+    await close_shared_clients()
+
+
 def get_agent(agent_card: AgentCard):
     """Get the agent, given an agent card."""
     try:
@@ -90,7 +99,7 @@ def main(host, port, agent_card):
 
         logger.info(f'Starting server on {host}:{port}')
 
-        uvicorn.run(server.build(), host=host, port=port)
+        uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
     except FileNotFoundError:
         logger.error(f"Error: File '{agent_card}' not found.")
         sys.exit(1)
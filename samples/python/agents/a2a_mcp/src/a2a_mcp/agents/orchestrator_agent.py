@@ -149,7 +149,7 @@ class OrchestratorAgent(BaseAgent):
             )
             # Resume workflow, used when the workflow nodes are updated.
             should_resume_workflow = False
-            async for chunk in self.graph.run_workflow(
+            async for node_id, chunk in self.graph.run_workflow(
                 start_node_id=start_node_id
             ):
                 if isinstance(chunk.root, SendStreamingMessageSuccessResponse):
@@ -182,11 +182,18 @@ class OrchestratorAgent(BaseAgent):
                                     # Orchestrator can answer on behalf of the user set the query
                                     # Resume workflow from paused state.
                                     query = answer['answer']
-                                    start_node_id = self.graph.paused_node_id
+                                    start_node_id = node_id
                                     self.set_node_attributes(
                                         node_id=start_node_id, query=query
                                     )
+                                    # Run the node again with the answer,
+                                    # along with any other answered node.
+                                    self.graph.nodes[
+                                        node_id
+                                    ].state = Status.READY
                                     should_resume_workflow = True
+                                    # Answered here, the user is not asked.
+                                    continue
                             except Exception:
                                 logger.info('Cannot convert answer data')
 
@@ -203,34 +210,56 @@ class OrchestratorAgent(BaseAgent):
                             logger.info(
                                 f'Updating workflow with {len(artifact_data["tasks"])} task nodes'
                             )
-                            # Define the edges
+                            # Define the edges. Tasks that declare their
+                            # dependencies run once those complete, so
+                            # independent tasks run in parallel. Otherwise
+                            # the tasks are chained in order.
+                            tasks = artifact_data['tasks']
+                            declares_dependencies = any(
+                                task_data.get('depends_on') is not None
+                                for task_data in tasks
+                            )
+                            planner_node_id = start_node_id
                             current_node_id = start_node_id
-                            for idx, task_data in enumerate(
-                                artifact_data['tasks']
-                            ):
+                            task_nodes = {}
+                            for idx, task_data in enumerate(tasks):
+                                parent_ids = [current_node_id]
+                                if declares_dependencies:
+                                    parent_ids = [
+                                        task_nodes[dependency]
+                                        for dependency in task_data.get(
+                                            'depends_on'
+                                        )
+                                        or []
+                                        if dependency in task_nodes
+                                    ] or [planner_node_id]
                                 node = self.add_graph_node(
                                     task_id=task_id,
                                     context_id=context_id,
                                     query=task_data['description'],
-                                    node_id=current_node_id,
+                                    node_id=parent_ids[0],
                                 )
+                                for parent_id in parent_ids[1:]:
+                                    self.graph.add_edge(parent_id, node.id)
+                                task_nodes[task_data.get('id')] = node.id
                                 current_node_id = node.id
                                 # Restart graph from the newly inserted subgraph state
                                 # Start from the new node just created.
                                 if idx == 0:
                                     should_resume_workflow = True
                                     start_node_id = node.id
+                            if tasks:
+                                # The plan is run as the resumed workflow.
+                                continue
                         else:
                             # Not planner but artifacts from other tasks,
                             # continue to the next node in the workflow.
                             # client does not get the artifact,
                             # a summary is shown at the end of the workflow.
                             continue
-                # When the workflow needs to be resumed, do not yield partial.
-                if not should_resume_workflow:
-                    logger.info('No workflow resume detected, yielding chunk')
-                    # Yield partial execution
-                    yield chunk
+                # Yield partial execution, the chunks of the other nodes
+                # still stream while the workflow waits to be resumed.
+                yield chunk
             # The graph is complete and no updates, so okay to break from the loop.
             if not should_resume_workflow:
                 logger.info(
@@ -59,6 +59,13 @@ class GenericAgentExecutor(AgentExecutor):
                     event,
                     (TaskStatusUpdateEvent | TaskArtifactUpdateEvent),
                 ):
+                    # Each workflow node runs in its own remote task.
+                    event = event.model_copy(
+                        update={
+                            'task_id': task.id,
+                            'context_id': task.context_id,
+                        }
+                    )
                     await event_queue.enqueue_event(event)
                 continue
 
@@ -0,0 +1,72 @@
+import time
+
+from collections import OrderedDict
+from typing import Any
+
+
+class LRUCache:
+    """A bounded least recently used cache with an optional TTL.
+
+    Keeps at most `max_entries` entries, evicting the least recently used one
+    first, and treats entries older than `ttl_seconds` as missing. Hits,
+    misses and evictions are counted for monitoring.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttl_seconds: float | None = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, time stored)
+        self._entries: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key) -> Any | None:
+        """Returns the cached value for `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and (
+            self.ttl_seconds is None
+            or time.monotonic() - entry[1] < self.ttl_seconds
+        ):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value) -> None:
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key=None) -> None:
+        """Removes `key`, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+def normalize_text(text: str) -> str:
+    """Normalizes text used as a cache key: lower case, single spaces."""
+    return ' '.join(text.lower().split())
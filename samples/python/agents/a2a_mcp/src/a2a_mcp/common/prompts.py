@@ -261,6 +261,8 @@ You will include 3 tasks in your plan, based on the user request.
 1. Airfare Booking.
 2. Hotel Booking.
 3. Car Rental Booking.
+The bookings do not depend on each other, list no dependencies in 'depends_on'
+so they can be booked in parallel.
 
 Always use chain-of-thought reasoning before responding to track where you are 
 in the decision tree and determine the next appropriate question.
@@ -356,16 +358,19 @@ Your output should follow this example format. DO NOT add any thing else apart f
         {
             'id': 1,
             'description': 'Book round-trip economy class air tickets from San Francisco (SFO) to London (LHR) for the dates May 12, 2025 to May 20, 2025.',
+            'depends_on': [],
             'status': 'pending'
         }, 
         {
             'id': 2,
             'description': 'Book a suite room at a hotel in London for checkin date May 12, 2025 and checkout date May 20th 2025',
+            'depends_on': [],
             'status': 'pending'
         },
         {
             'id': 3,
             'description': 'Book an SUV rental car in London with a pickup on May 12, 2025 and return on May 20, 2025', 
+            'depends_on': [],
             'status': 'pending'
         }
     ]
@@ -21,6 +21,10 @@ class PlannerTask(BaseModel):
     description: str = Field(
         description='Clear description of the task to be executed.'
     )
+    depends_on: list[int] | None = Field(
+        description='IDs of the tasks that must complete before this one.',
+        default=None,
+    )
     status: (
         Any
         | Literal[
@@ -97,7 +101,7 @@ class TaskList(BaseModel):
     trip_info: TripInfo | None = Field(description='Trip information')
 
     tasks: list[PlannerTask] = Field(
-        description='A list of tasks to be executed sequentially.'
+        description='A list of tasks, in the order they should be executed.'
     )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import uuid
@@ -14,17 +15,53 @@ from a2a.types import (
     AgentCard,
     MessageSendParams,
     SendStreamingMessageRequest,
+    SendStreamingMessageResponse,
     SendStreamingMessageSuccessResponse,
     TaskArtifactUpdateEvent,
     TaskState,
     TaskStatusUpdateEvent,
 )
+from a2a_mcp.common.cache import LRUCache, normalize_text
 from a2a_mcp.common.utils import get_mcp_server_config
 from a2a_mcp.mcp import client
 
 
 logger = logging.getLogger(__name__)
 
+# HTTP client shared by the workflow nodes to call the A2A agents.
+_a2a_http_client: httpx.AsyncClient | None = None
+
+# Agent cards resolved through the MCP server, keyed by the normalized task or
+# the resource uri. Entries expire so that changed agent cards are picked up.
+agent_card_cache = LRUCache(max_entries=256, ttl_seconds=300)
+
+
+def get_a2a_http_client() -> httpx.AsyncClient:
+    """Returns the pooled HTTP client used to call the A2A agents."""
+    global _a2a_http_client  # noqa: PLW0603
+    if _a2a_http_client is None or _a2a_http_client.is_closed:
+        _a2a_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20
+            )
+        )
+    return _a2a_http_client
+
+
+async def close_shared_clients() -> None:
+    """Closes the shared A2A HTTP client and MCP session pools."""
+    global _a2a_http_client  # noqa: PLW0603
+    if _a2a_http_client is not None:
+        await _a2a_http_client.aclose()
+        _a2a_http_client = None
+    await client.close_session_pools()
+
+
+def get_mcp_session_pool() -> client.MCPSessionPool:
+    """Returns the shared session pool for the configured MCP server."""
+    config = get_mcp_server_config()
+    return client.get_session_pool(config.host, config.port, config.transport)
+
 
 class Status(Enum):
     """Represents the status of a workflow and its associated node."""
@@ -57,29 +94,46 @@ class WorkflowNode:
         self.task = task
         self.results = None
         self.state = Status.READY
+        # The task created by the remote agent for this node, so that a
+        # node paused for input resumes its own task.
+        self.task_id = None
+
+    def _agent_card_cache_key(self) -> tuple[str, str]:
+        if self.node_key == 'planner':
+            return ('resource', 'resource://agent_cards/planner_agent')
+        return ('find_agent', normalize_text(self.task))
 
     async def get_planner_resource(self) -> AgentCard | None:
         logger.info(f'Getting resource for node {self.id}')
-        config = get_mcp_server_config()
-        async with client.init_session(
-            config.host, config.port, config.transport
-        ) as session:
-            response = await client.find_resource(
-                session, 'resource://agent_cards/planner_agent'
-            )
-            data = json.loads(response.contents[0].text)
-            return AgentCard(**data['agent_card'][0])
+        cache_key = self._agent_card_cache_key()
+        agent_card = agent_card_cache.get(cache_key)
+        if agent_card:
+            return agent_card
+        response = await get_mcp_session_pool().call(
+            lambda session: client.find_resource(session, cache_key[1])
+        )
+        data = json.loads(response.contents[0].text)
+        agent_card = AgentCard(**data['agent_card'][0])
+        agent_card_cache.put(cache_key, agent_card)
+        return agent_card
 
     async def find_agent_for_task(self) -> AgentCard | None:
         logger.info(f'Find agent for task - {self.task}')
-        config = get_mcp_server_config()
-        async with client.init_session(
-            config.host, config.port, config.transport
-        ) as session:
-            result = await client.find_agent(session, self.task)
-            agent_card_json = json.loads(result.content[0].text)
-            logger.debug(f'Found agent {agent_card_json} for task {self.task}')
-            return AgentCard(**agent_card_json)
+        cache_key = self._agent_card_cache_key()
+        agent_card = agent_card_cache.get(cache_key)
+        if agent_card:
+            logger.debug(f'Agent card cache {agent_card_cache.stats()}')
+            return agent_card
+        result = await get_mcp_session_pool().call(
+            lambda session: client.find_agent(session, self.task)
+        )
+        agent_card_json = json.loads(result.content[0].text)
+        if 'error' in agent_card_json:
+            raise ValueError(agent_card_json['error'])
+        logger.debug(f'Found agent {agent_card_json} for task {self.task}')
+        agent_card = AgentCard(**agent_card_json)
+        agent_card_cache.put(cache_key, agent_card)
+        return agent_card
 
     async def run_node(
         self,
@@ -93,42 +147,66 @@ class WorkflowNode:
             agent_card = await self.get_planner_resource()
         else:
             agent_card = await self.find_agent_for_task()
-        async with httpx.AsyncClient() as httpx_client:
-            client = A2AClient(httpx_client, agent_card)
-
-            payload: dict[str, any] = {
-                'message': {
-                    'role': 'user',
-                    'parts': [{'kind': 'text', 'text': query}],
-                    'messageId': uuid4().hex,
-                    'taskId': task_id,
-                    'contextId': context_id,
-                },
-            }
-            request = SendStreamingMessageRequest(
-                id=str(uuid4()), params=MessageSendParams(**payload)
-            )
-            response_stream = client.send_message_streaming(request)
+        a2a_client = A2AClient(get_a2a_http_client(), agent_card)
+
+        payload: dict[str, any] = {
+            'message': {
+                'role': 'user',
+                'parts': [{'kind': 'text', 'text': query}],
+                'messageId': uuid4().hex,
+                'taskId': task_id,
+                'contextId': context_id,
+            },
+        }
+        request = SendStreamingMessageRequest(
+            id=str(uuid4()), params=MessageSendParams(**payload)
+        )
+        response_stream = a2a_client.send_message_streaming(request)
+        try:
             async for chunk in response_stream:
-                # Save the artifact as a result of the node
-                if isinstance(
-                    chunk.root, SendStreamingMessageSuccessResponse
-                ) and (isinstance(chunk.root.result, TaskArtifactUpdateEvent)):
-                    artifact = chunk.root.result.artifact
-                    self.results = artifact
+                if isinstance(chunk.root, SendStreamingMessageSuccessResponse):
+                    result = chunk.root.result
+                    if isinstance(
+                        result, TaskStatusUpdateEvent | TaskArtifactUpdateEvent
+                    ):
+                        self.task_id = result.task_id
+                    # Save the artifact as a result of the node
+                    if isinstance(result, TaskArtifactUpdateEvent):
+                        self.results = result.artifact
                 yield chunk
+        except Exception:
+            # The agent may have moved or changed, resolve it again next time.
+            agent_card_cache.invalidate(self._agent_card_cache_key())
+            raise
 
 
 class WorkflowGraph:
-    """Represents a graph of workflow nodes."""
+    """Represents a graph of workflow nodes.
+
+    Nodes whose predecessors have all completed run concurrently, at most
+    `max_concurrency` at a time, and their chunks are merged into a single
+    stream in the order they arrive.
 
-    def __init__(self) -> None:
+    Several nodes may pause for input. They are asked one at a time: only
+    the question of `paused_node_id` is streamed, the others are held back
+    and streamed once the nodes before them have been resumed.
+    """
+
+    def __init__(self, max_concurrency: int = 4) -> None:
         self.graph = nx.DiGraph()
         self.nodes = {}
         self.latest_node = None
         self.node_type = None
         self.state = Status.INITIALIZED
-        self.paused_node_id = None
+        self.paused_node_ids: list[str] = []
+        # The input required chunk of each paused node.
+        self._questions: dict[str, SendStreamingMessageResponse] = {}
+        self.max_concurrency = max_concurrency
+
+    @property
+    def paused_node_id(self) -> str | None:
+        """The paused node waiting for the user's next answer."""
+        return self.paused_node_ids[0] if self.paused_node_ids else None
 
     def add_node(self, node) -> None:
         logger.info(f'Adding node {node.id}')
@@ -144,7 +222,12 @@ class WorkflowGraph:
 
     async def run_workflow(
         self, start_node_id: str | None = None
-    ) -> AsyncIterable[dict[str, any]]:
+    ) -> AsyncIterable[tuple[str, SendStreamingMessageResponse]]:
+        """Runs the start node, its descendants and any node not run yet.
+
+        Yields:
+            (node_id, chunk) pairs, one per chunk streamed by a node.
+        """
         logger.info('Executing workflow graph')
         if not start_node_id or start_node_id not in self.nodes:
             start_nodes = [n for n, d in self.graph.in_degree() if d == 0]
@@ -156,44 +239,119 @@ class WorkflowGraph:
         for node_id in start_nodes:
             applicable_graph.add(node_id)
             applicable_graph.update(nx.descendants(self.graph, node_id))
+        # Nodes that have never run, e.g. siblings of the start node.
+        applicable_graph.update(
+            node_id
+            for node_id, node in self.nodes.items()
+            if node.state == Status.READY
+        )
 
         complete_graph = list(nx.topological_sort(self.graph))
-        sub_graph = [n for n in complete_graph if n in applicable_graph]
-        logger.info(f'Sub graph {sub_graph} size {len(sub_graph)}')
+        pending = [n for n in complete_graph if n in applicable_graph]
+        logger.info(f'Sub graph {pending} size {len(pending)}')
         self.state = Status.RUNNING
-        # Alternative is to loop over all nodes, but we only need the connected nodes.
-        for node_id in sub_graph:
-            node = self.nodes[node_id]
-            node.state = Status.RUNNING
-            query = self.graph.nodes[node_id].get('query')
-            task_id = self.graph.nodes[node_id].get('task_id')
-            context_id = self.graph.nodes[node_id].get('context_id')
-            async for chunk in node.run_node(query, task_id, context_id):
+        chunks: asyncio.Queue = asyncio.Queue()
+        running: dict[str, asyncio.Task] = {}
+        paused: list[str] = []
+        # The node whose question was streamed in this run.
+        asked = None
+        try:
+            while True:
+                # Once a node is paused no new nodes are started, the
+                # running ones are left to complete.
+                while (
+                    not paused
+                    and len(running) < self.max_concurrency
+                    and (node_id := self._next_ready(pending, start_nodes))
+                ):
+                    pending.remove(node_id)
+                    self.nodes[node_id].state = Status.RUNNING
+                    running[node_id] = asyncio.create_task(
+                        self._run_node(node_id, chunks)
+                    )
+                if not running:
+                    break
+                node_id, chunk = await chunks.get()
+                node = self.nodes[node_id]
+                if chunk is None:
+                    # Raises the error of the node, if it failed.
+                    await running.pop(node_id)
+                    if node.state == Status.RUNNING:
+                        node.state = Status.COMPLETED
+                    continue
                 # When the workflow node is paused, do not yield any chunks
-                # but, let the loop complete.
-                if node.state != Status.PAUSED:
-                    if isinstance(
-                        chunk.root, SendStreamingMessageSuccessResponse
-                    ) and (
-                        isinstance(chunk.root.result, TaskStatusUpdateEvent)
+                # but, let the node complete.
+                if node_id in paused:
+                    continue
+                if isinstance(
+                    chunk.root, SendStreamingMessageSuccessResponse
+                ) and (isinstance(chunk.root.result, TaskStatusUpdateEvent)):
+                    task_status_event = chunk.root.result
+                    if (
+                        task_status_event.status.state
+                        == TaskState.input_required
+                        and task_status_event.context_id
                     ):
-                        task_status_event = chunk.root.result
-                        context_id = task_status_event.context_id
-                        if (
-                            task_status_event.status.state
-                            == TaskState.input_required
-                            and context_id
-                        ):
-                            node.state = Status.PAUSED
-                            self.state = Status.PAUSED
-                            self.paused_node_id = node.id
-                    yield chunk
-            if self.state == Status.PAUSED:
-                break
-            if node.state == Status.RUNNING:
-                node.state = Status.COMPLETED
-        if self.state == Status.RUNNING:
-            self.state = Status.COMPLETED
+                        node.state = Status.PAUSED
+                        paused.append(node_id)
+                        self._questions[node_id] = chunk
+                        if node_id in self.paused_node_ids:
+                            self.paused_node_ids.remove(node_id)
+                        self.paused_node_ids.append(node_id)
+                        if asked is not None:
+                            # Asked once the earlier question is answered.
+                            continue
+                        asked = node_id
+                yield node_id, chunk
+        finally:
+            for task in running.values():
+                task.cancel()
+        # Nodes paused in an earlier run may still be waiting for input,
+        # the one just asked goes first.
+        self.paused_node_ids = [
+            node_id
+            for node_id in self.paused_node_ids
+            if self.nodes[node_id].state == Status.PAUSED
+        ]
+        if asked in self.paused_node_ids:
+            self.paused_node_ids.remove(asked)
+            self.paused_node_ids.insert(0, asked)
+        for node_id in list(self._questions):
+            if node_id not in self.paused_node_ids:
+                del self._questions[node_id]
+        if not self.paused_node_ids:
+            if self.state == Status.RUNNING:
+                self.state = Status.COMPLETED
+            return
+        self.state = Status.PAUSED
+        if self.paused_node_id != asked:
+            # Ask the next held back question.
+            yield self.paused_node_id, self._questions[self.paused_node_id]
+
+    def _next_ready(
+        self, pending: list[str], start_nodes: list[str]
+    ) -> str | None:
+        """Returns the first pending node whose predecessors all completed."""
+        for node_id in pending:
+            if node_id in start_nodes or all(
+                self.nodes[predecessor].state == Status.COMPLETED
+                for predecessor in self.graph.predecessors(node_id)
+            ):
+                return node_id
+        return None
+
+    async def _run_node(self, node_id: str, chunks: asyncio.Queue):
+        """Runs a node, putting its chunks and then None on the queue."""
+        node = self.nodes[node_id]
+        query = self.graph.nodes[node_id].get('query')
+        context_id = self.graph.nodes[node_id].get('context_id')
+        try:
+            # Each node has its own task, so that the status updates of the
+            # nodes running at the same time are not mixed up.
+            async for chunk in node.run_node(query, node.task_id, context_id):
+                await chunks.put((node_id, chunk))
+        finally:
+            await chunks.put((node_id, None))
 
     def set_node_attribute(self, node_id, attribute, value) -> None:
         nx.set_node_attributes(self.graph, {node_id: value}, attribute)
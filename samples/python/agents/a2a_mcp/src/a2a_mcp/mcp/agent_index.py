@@ -0,0 +1,223 @@
+# type: ignore
+import hashlib
+import json
+import re
+
+from abc import ABC, abstractmethod
+
+import google.generativeai as genai
+import numpy as np
+
+from a2a_mcp.common.cache import LRUCache, normalize_text
+from mcp.server.fastmcp.utilities.logging import get_logger
+
+
+logger = get_logger(__name__)
+MODEL = 'models/embedding-001'
+# Maximum number of texts sent in a single embed_content request.
+EMBED_BATCH_SIZE = 100
+
+
+class EmbeddingProvider(ABC):
+    """Turns texts into embedding vectors."""
+
+    @abstractmethod
+    def embed(self, texts: list[str], task_type: str) -> np.ndarray:
+        """Embeds texts.
+
+        Args:
+            texts: The texts to embed.
+            task_type: 'retrieval_document' for the indexed agent cards or
+                'retrieval_query' for queries.
+
+        Returns:
+            A (len(texts), dim) array with one embedding per text.
+        """
+
+
+class GenAIEmbeddingProvider(EmbeddingProvider):
+    """Embeds texts with Google Generative AI, in batched requests."""
+
+    def __init__(self, model: str = MODEL):
+        self.model = model
+
+    def embed(self, texts: list[str], task_type: str) -> np.ndarray:
+        embeddings = []
+        for start in range(0, len(texts), EMBED_BATCH_SIZE):
+            embeddings.extend(
+                genai.embed_content(
+                    model=self.model,
+                    content=texts[start : start + EMBED_BATCH_SIZE],
+                    task_type=task_type,
+                )['embedding']
+            )
+        return np.asarray(embeddings, dtype=np.float32)
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Deterministic local embedder hashing words into a fixed number of bins.
+
+    It needs no network or API key, which makes it useful for tests and
+    offline runs, but it only captures word overlap.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def embed(self, texts: list[str], task_type: str) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in re.findall(r'\w+', text.lower()):
+                digest = hashlib.blake2b(word.encode('utf-8')).digest()
+                embeddings[
+                    row, int.from_bytes(digest[:4], 'little') % self.dim
+                ] += 1
+        return embeddings
+
+
+class AgentCardIndex:
+    """Cosine similarity index over agent card embeddings.
+
+    The card embeddings are stacked once into a contiguous float32 matrix and
+    normalized when the cards are (re)loaded, so a lookup is a single matrix
+    product followed by a partial sort for the top k matches. Query embeddings
+    are kept in a bounded LRU cache keyed by the normalized query text, so
+    repeated task descriptions are not embedded again.
+    """
+
+    def __init__(
+        self,
+        embedding_provider: EmbeddingProvider,
+        query_cache: LRUCache | None = None,
+    ):
+        self.embedding_provider = embedding_provider
+        self.query_cache = query_cache or LRUCache(max_entries=4096)
+        self.card_uris: list[str] = []
+        self.agent_cards: list[dict] = []
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.agent_cards)
+
+    def load(self, card_uris: list[str], agent_cards: list[dict]):
+        """Embeds the agent cards and replaces the indexed ones.
+
+        Args:
+            card_uris: The resource uri of each agent card.
+            agent_cards: The agent card dictionaries to index.
+        """
+        embeddings = (
+            self.embedding_provider.embed(
+                [json.dumps(card) for card in agent_cards],
+                task_type='retrieval_document',
+            )
+            if agent_cards
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        self._matrix = _normalize(embeddings)
+        self.card_uris = list(card_uris)
+        self.agent_cards = list(agent_cards)
+
+    def get(self, card_uri: str) -> dict | None:
+        """Returns the agent card with the given resource uri, if any."""
+        for uri, card in zip(self.card_uris, self.agent_cards, strict=True):
+            if uri == card_uri:
+                return card
+        return None
+
+    def search(
+        self, query: str, top_k: int = 1, threshold: float | None = None
+    ) -> list[tuple[dict, float]]:
+        """Finds the agent cards most similar to a query.
+
+        Args:
+            query: The natural language query.
+            top_k: The maximum number of agent cards to return.
+            threshold: If set, cards with a lower cosine similarity are left
+                out.
+
+        Returns:
+            (agent_card, score) pairs, best match first.
+        """
+        return self.search_batch([query], top_k, threshold)[0]
+
+    def search_batch(
+        self,
+        queries: list[str],
+        top_k: int = 1,
+        threshold: float | None = None,
+    ) -> list[list[tuple[dict, float]]]:
+        """Finds the agent cards most similar to each of many queries.
+
+        The queries are embedded in one request and scored with a single
+        matrix product.
+
+        Args:
+            queries: The natural language queries.
+            top_k: The maximum number of agent cards to return per query.
+            threshold: If set, cards with a lower cosine similarity are left
+                out.
+
+        Returns:
+            One list of (agent_card, score) pairs per query, best match first.
+        """
+        if not queries:
+            return []
+        k = min(top_k, len(self.agent_cards))
+        if k <= 0:
+            return [[] for _ in queries]
+        query_matrix = self._embed_queries(queries)
+        scores = query_matrix @ self._matrix.T
+        if k < scores.shape[1]:
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+        else:
+            top = np.broadcast_to(np.arange(k), (len(queries), k))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        results = []
+        for indices, row_scores in zip(top, top_scores, strict=True):
+            matches = [
+                (self.agent_cards[index], float(score))
+                for index, score in zip(indices, row_scores, strict=True)
+                if threshold is None or score >= threshold
+            ]
+            logger.debug(f'Found matches {[score for _, score in matches]}')
+            results.append(matches)
+        return results
+
+    def _embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Returns the normalized query embeddings, embedding cache misses."""
+        keys = [normalize_text(query) for query in queries]
+        vectors = {}
+        missing = {}
+        for key, query in zip(keys, queries, strict=True):
+            if key in vectors or key in missing:
+                continue
+            vector = self.query_cache.get(key)
+            if vector is None:
+                missing[key] = query
+            else:
+                vectors[key] = vector
+        if missing:
+            embeddings = _normalize(
+                self.embedding_provider.embed(
+                    list(missing.values()), task_type='retrieval_query'
+                )
+            )
+            for key, vector in zip(missing, embeddings, strict=True):
+                self.query_cache.put(key, vector)
+                vectors[key] = vector
+        logger.debug(f'Query embedding cache {self.query_cache.stats()}')
+        return np.stack([vectors[key] for key in keys])
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Returns the rows scaled to unit length, as a contiguous float32 array."""
+    matrix = np.array(embeddings, dtype=np.float32, order='C', ndmin=2)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    # Leave all zero embeddings as is rather than dividing by zero.
+    norms[norms == 0] = 1
+    matrix /= norms
+    return matrix
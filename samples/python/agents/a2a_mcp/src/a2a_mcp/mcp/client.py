@@ -2,10 +2,15 @@
 import asyncio
 import json
 import os
+import time
 
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from typing import TypeVar
 
+import anyio
 import click
+import httpx
 
 from fastmcp.utilities.logging import get_logger
 from mcp import ClientSession, StdioServerParameters
@@ -20,6 +25,18 @@ env = {
     'GOOGLE_API_KEY': os.getenv('GOOGLE_API_KEY'),
 }
 
+T = TypeVar('T')
+
+# Errors that mean the connection to the MCP server is gone, as opposed to an
+# error returned by the server.
+CONNECTION_ERRORS = (
+    anyio.BrokenResourceError,
+    anyio.ClosedResourceError,
+    anyio.EndOfStream,
+    httpx.TransportError,
+    OSError,
+)
+
 
 @asynccontextmanager
 async def init_session(host, port, transport):
@@ -79,12 +96,184 @@ async def init_session(host, port, transport):
         )
 
 
-async def find_agent(session: ClientSession, query) -> CallToolResult:
+class _PooledSession:
+    """A single long-lived MCP session, reconnected on demand.
+
+    The session is opened by a dedicated task so that the transport's task
+    group is entered and exited by the same task, and closed by that task once
+    it has been idle for longer than the pool's idle timeout.
+    """
+
+    def __init__(self, pool: 'MCPSessionPool'):
+        self._pool = pool
+        self._session: ClientSession | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._in_use = 0
+        self._last_used = 0.0
+        self._last_checked = 0.0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        async with self._lock:
+            if self._session and (
+                time.monotonic() - self._last_checked
+                > self._pool.health_check_interval
+            ):
+                await self._check()
+            if self._session is None:
+                await self._start()
+            session = self._session
+            self._in_use += 1
+        try:
+            yield session
+        finally:
+            self._in_use -= 1
+            self._last_used = time.monotonic()
+
+    async def _check(self):
+        try:
+            await asyncio.wait_for(
+                self._session.send_ping(), self._pool.health_check_timeout
+            )
+            self._last_checked = time.monotonic()
+        except Exception as e:
+            logger.warning(f'MCP session failed health check: {e!r}')
+            await self.close()
+
+    async def _start(self):
+        self._closing = asyncio.Event()
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        await ready
+
+    async def _run(self, ready: asyncio.Future):
+        try:
+            async with init_session(
+                self._pool.host, self._pool.port, self._pool.transport
+            ) as session:
+                self._session = session
+                self._last_used = self._last_checked = time.monotonic()
+                ready.set_result(None)
+                while not self._closing.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            self._closing.wait(), self._pool.idle_timeout / 2
+                        )
+                    except TimeoutError:
+                        idle = time.monotonic() - self._last_used
+                        if not self._in_use and idle > self._pool.idle_timeout:
+                            logger.info('Closing idle MCP session')
+                            break
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f'MCP session closed: {e}')
+        finally:
+            self._session = None
+
+    async def reset(self, session: ClientSession):
+        """Closes `session` if it is still the current one."""
+        async with self._lock:
+            if self._session is session:
+                await self.close()
+
+    async def close(self):
+        if self._task:
+            self._closing.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._session = None
+
+
+class MCPSessionPool:
+    """A pool of long-lived MCP client sessions shared across callers.
+
+    Opening a session costs a connection and an `initialize()` handshake, so
+    the sessions are kept open and reused. MCP sessions multiplex concurrent
+    requests, and calls are spread round-robin over `size` sessions. A session
+    unused for `health_check_interval` seconds is pinged before it is handed
+    out, sessions idle for `idle_timeout` seconds are closed, and a call that
+    fails because the connection dropped is retried once on a new session.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        transport: str,
+        size: int = 2,
+        idle_timeout: float = 300,
+        health_check_interval: float = 30,
+        health_check_timeout: float = 5,
+    ):
+        self.host = host
+        self.port = port
+        self.transport = transport
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._sessions = [_PooledSession(self) for _ in range(size)]
+        self._next = 0
+
+    async def call(self, fn: Callable[[ClientSession], Awaitable[T]]) -> T:
+        """Calls `fn` with a pooled session and returns its result.
+
+        Args:
+            fn: The coroutine function to call, e.g.
+                `lambda session: find_agent(session, query)`.
+
+        Returns:
+            The result of `fn`.
+        """
+        pooled = self._sessions[self._next]
+        self._next = (self._next + 1) % len(self._sessions)
+        async with pooled.acquire() as session:
+            try:
+                return await fn(session)
+            except CONNECTION_ERRORS as e:
+                logger.warning(f'MCP session lost, reconnecting: {e}')
+        await pooled.reset(session)
+        async with pooled.acquire() as session:
+            return await fn(session)
+
+    async def close(self):
+        """Closes all the sessions of the pool."""
+        await asyncio.gather(*(s.close() for s in self._sessions))
+
+
+_session_pools: dict[tuple[str, int, str], MCPSessionPool] = {}
+
+
+def get_session_pool(host, port, transport) -> MCPSessionPool:
+    """Returns the shared session pool for an MCP server, creating it once."""
+    key = (host, port, transport)
+    if key not in _session_pools:
+        _session_pools[key] = MCPSessionPool(host, port, transport)
+    return _session_pools[key]
+
+
+async def close_session_pools():
+    """Closes the sessions of all the shared pools."""
+    await asyncio.gather(*(pool.close() for pool in _session_pools.values()))
+    _session_pools.clear()
+
+
+async def find_agent(
+    session: ClientSession,
+    query,
+    top_k: int = 1,
+    threshold: float | None = None,
+) -> CallToolResult:
     """Calls the 'find_agent' tool on the connected MCP server.
 
     Args:
         session: The active ClientSession.
         query: The natural language query to send to the 'find_agent' tool.
+        top_k: The number of agent cards to return.
+        threshold: If set, the minimum similarity of the returned cards.
 
     Returns:
         The result of the tool call.
@@ -94,6 +283,8 @@ async def find_agent(session: ClientSession, query) -> CallToolResult:
         name='find_agent',
         arguments={
             'query': query,
+            'top_k': top_k,
+            'threshold': threshold,
         },
     )
 
@@ -224,8 +415,11 @@ async def main(host, port, transport, query, resource, tool):
 @click.option('--transport', default='stdio', help='MCP Transport')
 @click.option('--find_agent', help='Query to find an agent')
 @click.option('--resource', help='URI of the resource to locate')
-@click.option('--tool_name', type=click.Choice(['search_flights', 'search_hotels', 'query_db']),
-              help='Tool to execute: search_flights, search_hotels, or query_db')
+@click.option(
+    '--tool_name',
+    type=click.Choice(['search_flights', 'search_hotels', 'query_db']),
+    help='Tool to execute: search_flights, search_hotels, or query_db',
+)
 def cli(host, port, transport, find_agent, resource, tool_name):
     """A command-line client to interact with the Agent Cards MCP server."""
     asyncio.run(main(host, port, transport, find_agent, resource, tool_name))
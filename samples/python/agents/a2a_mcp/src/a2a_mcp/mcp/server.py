@@ -1,4 +1,5 @@
 # type: ignore
+import asyncio
 import json
 import os
 import sqlite3
@@ -6,39 +7,25 @@ import traceback
 
 from pathlib import Path
 
-import google.generativeai as genai
-import numpy as np
-import pandas as pd
 import requests
 
 from a2a_mcp.common.utils import init_api_key
+from a2a_mcp.mcp.agent_index import (
+    AgentCardIndex,
+    GenAIEmbeddingProvider,
+    HashingEmbeddingProvider,
+)
+from a2a_mcp.mcp.travel_db import TravelDatabase
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.utilities.logging import get_logger
 
 
 logger = get_logger(__name__)
 AGENT_CARDS_DIR = 'agent_cards'
-MODEL = 'models/embedding-001'
 SQLLITE_DB = 'travel_agency.db'
 PLACES_API_URL = 'https://places.googleapis.com/v1/places:searchText'
 
 
-def generate_embeddings(text):
-    """Generates embeddings for the given text using Google Generative AI.
-
-    Args:
-        text: The input string for which to generate embeddings.
-
-    Returns:
-        A list of embeddings representing the input text.
-    """
-    return genai.embed_content(
-        model=MODEL,
-        content=text,
-        task_type='retrieval_document',
-    )['embedding']
-
-
 def load_agent_cards():
     """Loads agent card data from JSON files within a specified directory.
 
@@ -54,7 +41,7 @@ def load_agent_cards():
         logger.error(
             f'Agent cards directory not found or is not a directory: {AGENT_CARDS_DIR}'
         )
-        return agent_cards
+        return card_uris, agent_cards
 
     logger.info(f'Loading agent cards from card repo: {AGENT_CARDS_DIR}')
 
@@ -86,28 +73,26 @@ def load_agent_cards():
     return card_uris, agent_cards
 
 
-def build_agent_card_embeddings() -> pd.DataFrame:
-    """Loads agent cards, generates embeddings for them, and returns a DataFrame.
+def build_agent_card_index() -> AgentCardIndex | None:
+    """Loads agent cards and indexes their embeddings.
+
+    The cards are embedded with Google Generative AI, or with a local hashing
+    embedder when A2A_MCP_EMBEDDINGS is set to 'hashing'.
 
     Returns:
-        Optional[pd.DataFrame]: A Pandas DataFrame containing the original
-        'agent_card' data and their corresponding 'Embeddings'. Returns None
-        if no agent cards were loaded initially or if an exception occurred
-        during the embedding generation process.
+        Optional[AgentCardIndex]: The index of the loaded agent cards. Returns
+        None if an exception occurred during the embedding generation process.
     """
+    if os.getenv('A2A_MCP_EMBEDDINGS', 'genai').lower() == 'hashing':
+        index = AgentCardIndex(HashingEmbeddingProvider())
+    else:
+        index = AgentCardIndex(GenAIEmbeddingProvider())
     card_uris, agent_cards = load_agent_cards()
     logger.info('Generating Embeddings for agent cards')
     try:
-        if agent_cards:
-            df = pd.DataFrame(
-                {'card_uri': card_uris, 'agent_card': agent_cards}
-            )
-            df['card_embeddings'] = df.apply(
-                lambda row: generate_embeddings(json.dumps(row['agent_card'])),
-                axis=1,
-            )
-            return df
+        index.load(card_uris, agent_cards)
         logger.info('Done generating embeddings for agent cards')
+        return index
     except Exception as e:
         logger.error(f'An unexpected error occurred : {e}.', exc_info=True)
         return None
@@ -128,40 +113,52 @@ def serve(host, port, transport):  # noqa: PLR0915
     logger.info('Starting Agent Cards MCP Server')
     mcp = FastMCP('agent-cards', host=host, port=port)
 
-    df = build_agent_card_embeddings()
+    index = build_agent_card_index()
+    travel_db = TravelDatabase(SQLLITE_DB)
+    try:
+        travel_db.load()
+    except sqlite3.Error as e:
+        logger.warning(f'Could not load the travel database in memory: {e}')
 
     @mcp.tool(
         name='find_agent',
         description='Finds the most relevant agent card based on a natural language query string.',
     )
-    def find_agent(query: str) -> str:
+    def find_agent(
+        query: str, top_k: int = 1, threshold: float | None = None
+    ) -> dict:
         """Finds the most relevant agent card based on a query string.
 
         This function takes a user query, typically a natural language question or a task generated by an agent,
         generates its embedding, and compares it against the
-        pre-computed embeddings of the loaded agent cards. It uses the dot
-        product to measure similarity and identifies the agent card with the
-        highest similarity score.
+        pre-computed, normalized embeddings of the loaded agent cards. It uses
+        cosine similarity and identifies the agent card with the highest
+        similarity score.
 
         Args:
             query: The natural language query string used to search for a
                    relevant agent.
+            top_k: The number of agent cards to return, best match first.
+            threshold: If set, agent cards with a lower cosine similarity
+                   are not returned.
 
         Returns:
             The json representing the agent card deemed most relevant
-            to the input query based on embedding similarity.
+            to the input query based on embedding similarity. When top_k is
+            more than 1, {'agent_cards': [...], 'scores': [...]} instead.
+            {'error': ...} if no agent card matches.
         """
-        query_embedding = genai.embed_content(
-            model=MODEL, content=query, task_type='retrieval_query'
-        )
-        dot_products = np.dot(
-            np.stack(df['card_embeddings']), query_embedding['embedding']
-        )
-        best_match_index = np.argmax(dot_products)
-        logger.debug(
-            f'Found best match at index {best_match_index} with score {dot_products[best_match_index]}'
-        )
-        return df.iloc[best_match_index]['agent_card']
+        matches = index.search(query, top_k, threshold) if index else []
+        if not matches:
+            logger.info(f'No agent found for query: {query}')
+            return {'error': f'No agent found for query: {query}'}
+        logger.debug(f'Found best match with score {matches[0][1]}')
+        if top_k == 1:
+            return matches[0][0]
+        return {
+            'agent_cards': [card for card, _ in matches],
+            'scores': [score for _, score in matches],
+        }
 
     @mcp.tool()
     def query_places_data(query: str):
@@ -208,16 +205,27 @@ def serve(host, port, transport):  # noqa: PLR0915
         return {'places': []}
 
     @mcp.tool()
-    def query_travel_data(query: str) -> dict:
+    async def query_travel_data(
+        query: str, limit: int = 100, offset: int = 0
+    ) -> dict:
         """ "name": "query_travel_data",
         "description": "Retrieves the most up-to-date, ariline, hotel and car rental availability. Helps with the booking.
-        This tool should be used when a user asks for the airline ticket booking, hotel or accommodation booking, or car rental reservations.",
+        This tool should be used when a user asks for the airline ticket booking, hotel or accommodation booking, or car rental reservations.
+        Results are paginated, when 'next_offset' is returned call again with it as the offset to get more rows.",
         "parameters": {
             "type": "object",
             "properties": {
             "query": {
                 "type": "string",
                 "description": "A SQL to run against the travel database."
+            },
+            "limit": {
+                "type": "integer",
+                "description": "The maximum number of rows to return, at most 100."
+            },
+            "offset": {
+                "type": "integer",
+                "description": "The number of rows to skip."
             }
             },
             "required": ["query"]
@@ -226,25 +234,21 @@ def serve(host, port, transport):  # noqa: PLR0915
         # The above is to influence gemini to pickup the tool.
         logger.info(f'Query sqllite : {query}')
 
-        if not query or not query.strip().upper().startswith('SELECT'):
-            raise ValueError(f'In correct query {query}')
-
         try:
-            with sqlite3.connect(SQLLITE_DB) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                result = {'results': [dict(row) for row in rows]}
-                return json.dumps(result)
+            result = await asyncio.to_thread(
+                travel_db.query, query, limit, offset
+            )
+            return json.dumps(result)
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f'Exception running query {e}')
             logger.error(traceback.format_exc())
-            if 'no such column' in e:
+            if 'no such column' in str(e):
                 return {
                     'error': f'Please check your query, {e}. Use the table schema to regenerate the query'
                 }
-            return {'error': {e}}
+            return {'error': str(e)}
 
     @mcp.resource('resource://agent_cards/list', mime_type='application/json')
     def get_agent_cards() -> dict:
@@ -260,7 +264,7 @@ def serve(host, port, transport):  # noqa: PLR0915
         """
         resources = {}
         logger.info('Starting read resources')
-        resources['agent_cards'] = df['card_uri'].to_list()
+        resources['agent_cards'] = list(index.card_uris)
         return resources
 
     @mcp.resource(
@@ -279,16 +283,15 @@ def serve(host, port, transport):  # noqa: PLR0915
         logger.info(
             f'Starting read resource resource://agent_cards/{card_name}'
         )
-        resources['agent_card'] = (
-            df.loc[
-                df['card_uri'] == f'resource://agent_cards/{card_name}',
-                'agent_card',
-            ]
-        ).to_list()
+        card = index.get(f'resource://agent_cards/{card_name}')
+        resources['agent_card'] = [card] if card else []
 
         return resources
 
     logger.info(
         f'Agent cards MCP Server at {host}:{port} and transport {transport}'
     )
-    mcp.run(transport=transport)
+    try:
+        mcp.run(transport=transport)
+    finally:
+        travel_db.close()
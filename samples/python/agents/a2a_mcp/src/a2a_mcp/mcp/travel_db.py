@@ -0,0 +1,171 @@
+# type: ignore
+import itertools
+import queue
+import re
+import sqlite3
+import threading
+
+from a2a_mcp.common.cache import LRUCache
+from mcp.server.fastmcp.utilities.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Indexes matching the lookups the travel agents are prompted to run.
+RECOMMENDED_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_flights_route '
+    'ON flights (from_airport, to_airport, ticket_class)',
+    'CREATE INDEX IF NOT EXISTS idx_hotels_city '
+    'ON hotels (city, hotel_type, room_type)',
+    'CREATE INDEX IF NOT EXISTS idx_rental_cars_city '
+    'ON rental_cars (city, type_of_car)',
+)
+
+
+class TravelDatabase:
+    """Runs read-only queries against the travel SQLite database.
+
+    Connections are opened read-only and kept in a pool of at most
+    `pool_size`, so they can be used from worker threads and keep their
+    prepared statement cache between calls. Results are paginated, at most
+    `max_rows` rows per page, and pages are cached by normalized SQL.
+
+    After `load`, queries run on an indexed in-memory copy of the database
+    instead of the file, which is never written to.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        pool_size: int = 4,
+        max_rows: int = 100,
+        result_cache: LRUCache | None = None,
+    ):
+        self.path = path
+        self.pool_size = pool_size
+        self.max_rows = max_rows
+        self.result_cache = result_cache or LRUCache(
+            max_entries=256, ttl_seconds=60
+        )
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._uri = f'file:{path}?mode=ro'
+        # Keeps the in-memory copy alive while the pool has no connection.
+        self._memory_copy: sqlite3.Connection | None = None
+
+    def load(self):
+        """Copies the database into memory and indexes the copy.
+
+        Call before the first query. The copy is shared by the pooled
+        connections and dropped by `close`.
+        """
+        uri = f'file:travel_db_{id(self)}?mode=memory&cache=shared'
+        copy = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            source = sqlite3.connect(self._uri, uri=True)
+            try:
+                source.backup(copy)
+            finally:
+                source.close()
+            for statement in RECOMMENDED_INDEXES:
+                try:
+                    copy.execute(statement)
+                except sqlite3.OperationalError as e:
+                    logger.warning(f'Skipping index, {e}: {statement}')
+            copy.commit()
+        except sqlite3.Error:
+            copy.close()
+            raise
+        self._memory_copy = copy
+        self._uri = uri
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=128,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA query_only = ON')
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.pool_size:
+                self._created += 1
+                return self._connect()
+        return self._idle.get()
+
+    def query(
+        self, sql: str, limit: int | None = None, offset: int = 0
+    ) -> dict:
+        """Runs a SELECT statement and returns one page of its rows.
+
+        This blocks on SQLite, call it from a worker thread.
+
+        Args:
+            sql: The SELECT statement to run.
+            limit: The maximum number of rows to return, at most `max_rows`.
+            offset: The number of rows to skip.
+
+        Returns:
+            A dictionary with the 'results' rows, and the 'next_offset' to
+            request the next page with when there are more rows.
+
+        Raises:
+            ValueError: If the statement is not a SELECT.
+            sqlite3.Error: If the statement fails.
+        """
+        if not sql or not sql.strip().upper().startswith('SELECT'):
+            raise ValueError(f'In correct query {sql}')
+        limit = min(limit or self.max_rows, self.max_rows)
+        offset = max(offset, 0)
+        key = (normalize_sql(sql), limit, offset)
+        with self._cache_lock:
+            result = self.result_cache.get(key)
+        if result is not None:
+            return result
+        conn = self._acquire()
+        try:
+            cursor = conn.execute(sql)
+            try:
+                # SQLite steps through the rows lazily, so skipping and
+                # fetching a page does not materialize the whole result.
+                for _ in itertools.islice(cursor, offset):
+                    pass
+                rows = cursor.fetchmany(limit + 1)
+            finally:
+                cursor.close()
+        finally:
+            self._idle.put(conn)
+        result = {'results': [dict(row) for row in rows[:limit]]}
+        if len(rows) > limit:
+            result['next_offset'] = offset + limit
+        with self._cache_lock:
+            self.result_cache.put(key, result)
+        return result
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        if self._memory_copy is not None:
+            self._memory_copy.close()
+            self._memory_copy = None
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapses whitespace outside string literals and drops a trailing ';'."""
+    # Splitting on quoted literals leaves them at the odd indexes.
+    parts = re.split(r"('(?:[^']|'')*')", sql)
+    parts[::2] = [re.sub(r'\s+', ' ', part) for part in parts[::2]]
+    return ''.join(parts).strip().rstrip(';').strip()
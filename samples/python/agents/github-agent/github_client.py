@@ -0,0 +1,223 @@
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://api.github.com'
+
+# Seconds a cached response is served without asking GitHub again, by
+# endpoint type. Once expired it is revalidated with a conditional request.
+DEFAULT_TTLS = {
+    'search': 60,
+    'commits': 120,
+    'repos': 300,
+    'user': 3600,
+}
+
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API returns an error response."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f'{status_code}: {message}')
+        self.status_code = status_code
+
+
+@dataclass
+class CachedResponse:
+    """A GitHub API response kept for conditional requests."""
+
+    data: Any
+    etag: str | None
+    last_modified: str | None
+    next_url: str | None
+    expires_at: float
+
+
+def endpoint_type(path: str) -> str:
+    """Returns the DEFAULT_TTLS key for an API path."""
+    if path.startswith('/search/'):
+        return 'search'
+    if path.endswith('/commits'):
+        return 'commits'
+    if path.endswith('/repos'):
+        return 'repos'
+    return 'user'
+
+
+class GitHubClient:
+    """A small GitHub REST client with a conditional response cache.
+
+    GET responses are cached by URL and query parameters. A cached response
+    is served as is until its TTL expires, then revalidated with its ETag or
+    Last-Modified date: a 304 reply reuses the cached data and does not count
+    against the rate limit. When the rate limit is exhausted the client waits
+    for it to reset, at most `max_backoff` seconds, and serves the cached
+    response instead if there is one.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = 512,
+        max_retries: int = 3,
+        max_backoff: float = 60,
+        http_client: httpx.Client | None = None,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+        }
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        self.http_client = http_client or httpx.Client(timeout=30)
+        self.http_client.headers.update(headers)
+        self._cache: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def get(
+        self, path_or_url: str, params: dict[str, Any] | None = None
+    ) -> tuple[Any, str | None]:
+        """Fetches a GitHub API resource.
+
+        Args:
+            path_or_url: An API path such as '/user/repos', or a full URL
+                such as the next page link of a previous response.
+            params: The query parameters.
+
+        Returns:
+            The decoded JSON body and the URL of the next page, if any.
+
+        Raises:
+            GitHubAPIError: If GitHub returns an error response.
+        """
+        url = (
+            path_or_url
+            if path_or_url.startswith('http')
+            else f'{self.base_url}{path_or_url}'
+        )
+        request = self.http_client.build_request('GET', url, params=params)
+        key = str(request.url)
+        # Tools run concurrently in worker threads, the cache and the
+        # counters are only touched under the lock.
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                if time.monotonic() < cached.expires_at:
+                    self.hits += 1
+                    return cached.data, cached.next_url
+
+        if cached is not None:
+            if cached.etag:
+                request.headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                request.headers['If-Modified-Since'] = cached.last_modified
+
+        response = self._send(request)
+        if response is None:
+            # Rate limited for longer than we are willing to wait.
+            if cached is not None:
+                logger.warning(f'Rate limited, serving cached {key}')
+                return cached.data, cached.next_url
+            raise GitHubAPIError(403, 'API rate limit exceeded')
+
+        ttl = self.ttls[endpoint_type(request.url.path)]
+        if response.status_code == 304 and cached is not None:
+            with self._lock:
+                self.revalidations += 1
+                cached.expires_at = time.monotonic() + ttl
+            return cached.data, cached.next_url
+        if response.status_code >= 400:
+            try:
+                message = response.json().get('message', response.text)
+            except ValueError:
+                message = response.text
+            raise GitHubAPIError(response.status_code, message)
+
+        entry = CachedResponse(
+            data=response.json(),
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            next_url=response.links.get('next', {}).get('url'),
+            expires_at=time.monotonic() + ttl,
+        )
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return entry.data, entry.next_url
+
+    def paginate(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> Iterator[Any]:
+        """Yields the items of a paginated list, one page at a time.
+
+        Pages are only fetched as the items are consumed, so a caller that
+        stops iterating does not request the remaining pages.
+        """
+        data, next_url = self.get(path, params)
+        while True:
+            yield from data
+            if not next_url:
+                return
+            data, next_url = self.get(next_url)
+
+    def _send(self, request: httpx.Request) -> httpx.Response | None:
+        """Sends a request, waiting out rate limits up to `max_backoff`.
+
+        Returns None if the request is still rate limited after the retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            response = self.http_client.send(request)
+            delay = self._rate_limit_delay(response)
+            if delay is None:
+                return response
+            if attempt == self.max_retries or delay > self.max_backoff:
+                return None
+            logger.warning(f'GitHub rate limit hit, retrying in {delay:.1f}s')
+            time.sleep(delay)
+        return None
+
+    @staticmethod
+    def _rate_limit_delay(response: httpx.Response) -> float | None:
+        """Returns how long to wait before retrying, or None if not limited."""
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            return float(retry_after)
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = float(response.headers.get('X-RateLimit-Reset', 0))
+            return max(reset - time.time(), 0) + 1
+        return None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._cache),
+                'hits': self.hits,
+                'revalidations': self.revalidations,
+                'misses': self.misses,
+            }
@@ -1,9 +1,13 @@
 import os
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
+from urllib.parse import quote
 
-from github import Auth, Github
+from github_client import (  # type: ignore[import-untyped]
+    DEFAULT_BASE_URL,
+    GitHubClient,
+)
 from pydantic import BaseModel
 
 
@@ -66,19 +70,19 @@ class GitHubToolset:
     def __init__(self):
         self._github_client = None
 
-    def _get_github_client(self) -> Github:
+    def _get_github_client(self) -> GitHubClient:
         """Get GitHub client with authentication"""
         if self._github_client is None:
             github_token = os.getenv('GITHUB_TOKEN')
-            if github_token:
-                auth = Auth.Token(github_token)
-                self._github_client = Github(auth=auth)
-            else:
+            if not github_token:
                 # Use without authentication (limited rate)
                 print(
                     'Warning: No GITHUB_TOKEN found, using unauthenticated access (limited rate)'
                 )
-                self._github_client = Github()
+            self._github_client = GitHubClient(
+                token=github_token,
+                base_url=os.getenv('GITHUB_API_URL', DEFAULT_BASE_URL),
+            )
         return self._github_client
 
     def get_user_repositories(
@@ -105,42 +109,35 @@ class GitHubToolset:
         try:
             github = self._get_github_client()
 
+            params = {
+                'sort': 'updated',
+                'direction': 'desc',
+                'per_page': min(max(limit, 1), 100),
+            }
             if username:
-                user = github.get_user(username)
+                login = quote(username, safe='')
+                path = f'/users/{login}/repos'
+            elif not os.getenv('GITHUB_TOKEN'):
+                # If no token, we can't get authenticated user, so require username
+                return RepositoryResponse(
+                    status='error',
+                    message='Username is required when not using authentication token',
+                    error_message='Username is required when not using authentication token',
+                )
             else:
-                try:
-                    user = github.get_user()
-                except Exception:
-                    # If no token, we can't get authenticated user, so require username
-                    return RepositoryResponse(
-                        status='error',
-                        message='Username is required when not using authentication token',
-                        error_message='Username is required when not using authentication token',
-                    )
+                path = '/user/repos'
 
             repos = []
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-            for repo in user.get_repos(sort='updated', direction='desc'):
+            for repo in github.paginate(path, params):
                 if len(repos) >= limit:
                     break
-
-                if repo.updated_at >= cutoff_date:
-                    repos.append(
-                        GitHubRepository(
-                            name=repo.name,
-                            full_name=repo.full_name,
-                            description=repo.description,
-                            url=repo.html_url,
-                            updated_at=repo.updated_at.isoformat(),
-                            pushed_at=repo.pushed_at.isoformat()
-                            if repo.pushed_at
-                            else None,
-                            language=repo.language,
-                            stars=repo.stargazers_count,
-                            forks=repo.forks_count,
-                        )
-                    )
+                # Repositories are sorted by update time, so the remaining
+                # ones (and pages) are all older than the cutoff.
+                if _parse_datetime(repo['updated_at']) < cutoff_date:
+                    break
+                repos.append(_to_repository(repo))
 
             return RepositoryResponse(
                 status='success',
@@ -177,23 +174,38 @@ class GitHubToolset:
         try:
             github = self._get_github_client()
 
-            repo = github.get_repo(repo_name)
             commits = []
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            for commit in repo.get_commits(since=cutoff_date):
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+            params = {
+                # Truncated to the hour so that repeated calls share the
+                # cached response, the exact cutoff is applied below.
+                'since': cutoff_date.replace(minute=0, second=0, microsecond=0)
+                .isoformat()
+                .replace('+00:00', 'Z'),
+                'per_page': min(max(limit, 1), 100),
+            }
+
+            for commit in github.paginate(
+                f'/repos/{repo_name}/commits', params
+            ):
                 if len(commits) >= limit:
                     break
+                # `since` filters on the commit date, so does the cutoff.
+                committed = commit['commit']['committer']['date']
+                if _parse_datetime(committed) < cutoff_date:
+                    continue
 
                 commits.append(
                     GitHubCommit(
-                        sha=commit.sha[:8],
-                        message=commit.commit.message.split('\n')[
+                        sha=commit['sha'][:8],
+                        message=commit['commit']['message'].split('\n')[
                             0
                         ],  # Only take the first line
-                        author=commit.commit.author.name,
-                        date=commit.commit.author.date.isoformat(),
-                        url=commit.html_url,
+                        author=commit['commit']['author']['name'],
+                        date=_parse_datetime(
+                            commit['commit']['author']['date']
+                        ).isoformat(),
+                        url=commit['html_url'],
                     )
                 )
 
@@ -233,29 +245,21 @@ class GitHubToolset:
             github = self._get_github_client()
 
             # Add recent activity filter to query
-            search_query = f'{query} pushed:>={datetime.now() - timedelta(days=30):%Y-%m-%d}'
+            search_query = f'{query} pushed:>={datetime.now(timezone.utc) - timedelta(days=30):%Y-%m-%d}'
 
             repos = []
-            results = github.search_repositories(
-                query=search_query, sort=sort, order='desc'
+            results, _ = github.get(
+                '/search/repositories',
+                {
+                    'q': search_query,
+                    'sort': sort,
+                    'order': 'desc',
+                    'per_page': min(max(limit, 1), 100),
+                },
             )
 
-            for repo in results[:limit]:
-                repos.append(
-                    GitHubRepository(
-                        name=repo.name,
-                        full_name=repo.full_name,
-                        description=repo.description,
-                        url=repo.html_url,
-                        updated_at=repo.updated_at.isoformat(),
-                        pushed_at=repo.pushed_at.isoformat()
-                        if repo.pushed_at
-                        else None,
-                        language=repo.language,
-                        stars=repo.stargazers_count,
-                        forks=repo.forks_count,
-                    )
-                )
+            for repo in results['items'][:limit]:
+                repos.append(_to_repository(repo))
 
             return RepositoryResponse(
                 status='success',
@@ -277,3 +281,25 @@ class GitHubToolset:
             'get_recent_commits': self,
             'search_repositories': self,
         }
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse a GitHub API timestamp such as '2024-01-31T12:00:00Z'."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _to_repository(repo: dict[str, Any]) -> GitHubRepository:
+    """Convert a GitHub API repository object to a GitHubRepository."""
+    return GitHubRepository(
+        name=repo['name'],
+        full_name=repo['full_name'],
+        description=repo['description'],
+        url=repo['html_url'],
+        updated_at=_parse_datetime(repo['updated_at']).isoformat(),
+        pushed_at=_parse_datetime(repo['pushed_at']).isoformat()
+        if repo['pushed_at']
+        else None,
+        language=repo['language'],
+        stars=repo['stargazers_count'],
+        forks=repo['forks_count'],
+    )
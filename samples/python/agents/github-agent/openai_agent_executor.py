@@ -1,6 +1,11 @@
+import asyncio
+import functools
+import inspect
 import json
 import logging
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from a2a.server.agent_execution import AgentExecutor
@@ -30,9 +35,16 @@ class OpenAIAgentExecutor(AgentExecutor):
         tools: dict[str, Any],
         api_key: str,
         system_prompt: str,
+        max_tool_workers: int = 8,
     ):
         self._card = card
         self.tools = tools
+        # The GitHub client does blocking HTTP, so sync tools run in this pool.
+        self._tool_executor = ThreadPoolExecutor(
+            max_workers=max_tool_workers, thread_name_prefix='github-tool'
+        )
+        # The tools do not change, convert them to OpenAI format once.
+        self.openai_tools = self._build_openai_tools()
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url='https://openrouter.ai/api/v1',
@@ -55,15 +67,7 @@ class OpenAIAgentExecutor(AgentExecutor):
             {'role': 'user', 'content': message_text},
         ]
 
-        # Convert tools to OpenAI format
-        openai_tools = []
-        for tool_name, tool_instance in self.tools.items():
-            if hasattr(tool_instance, tool_name):
-                func = getattr(tool_instance, tool_name)
-                # Extract function schema from the method
-                schema = self._extract_function_schema(func)
-                openai_tools.append({'type': 'function', 'function': schema})
-
+        openai_tools = self.openai_tools
         max_iterations = 10
         iteration = 0
 
@@ -94,43 +98,19 @@ class OpenAIAgentExecutor(AgentExecutor):
 
                 # Check if there are tool calls to execute
                 if message.tool_calls:
-                    # Execute tool calls
-                    for tool_call in message.tool_calls:
-                        function_name = tool_call.function.name
-                        function_args = json.loads(tool_call.function.arguments)
-
-                        logger.debug(
-                            f'Calling function: {function_name} with args: {function_args}'
-                        )
-
-                        # Execute the function
-                        if function_name in self.tools:
-                            tool_instance = self.tools[function_name]
-                            # Get the method from the instance
-                            if hasattr(tool_instance, function_name):
-                                method = getattr(tool_instance, function_name)
-                                result = method(**function_args)
-                            else:
-                                result = {
-                                    'error': f'Method {function_name} not found on tool instance'
-                                }
-                        else:
-                            result = {
-                                'error': f'Function {function_name} not found'
-                            }
+                    # Execute the tool calls of this turn concurrently
+                    results = await asyncio.gather(
+                        *[
+                            self._call_tool(tool_call)
+                            for tool_call in message.tool_calls
+                        ]
+                    )
 
-                        # Serialize result properly - handle Pydantic models
-                        if hasattr(result, 'model_dump'):
-                            # It's a Pydantic model, use model_dump() to convert to dict
-                            result_json = json.dumps(result.model_dump())
-                        elif isinstance(result, dict):
-                            # It's a regular dict
-                            result_json = json.dumps(result)
-                        else:
-                            # Convert to string as fallback
-                            result_json = str(result)
-
-                        # Add tool result to messages
+                    # Add tool results to messages, in the original order
+                    latencies = []
+                    for tool_call, (result_json, elapsed) in zip(
+                        message.tool_calls, results, strict=True
+                    ):
                         messages.append(
                             {
                                 'role': 'tool',
@@ -138,12 +118,20 @@ class OpenAIAgentExecutor(AgentExecutor):
                                 'content': result_json,
                             }
                         )
+                        latencies.append(
+                            f'{tool_call.function.name} ({elapsed:.2f}s)'
+                        )
 
                     # Send update to show we're processing
                     await task_updater.update_status(
                         TaskState.working,
                         message=task_updater.new_agent_message(
-                            [TextPart(text='Processing tool calls...')]
+                            [
+                                TextPart(
+                                    text='Processing tool calls... '
+                                    + ', '.join(latencies)
+                                )
+                            ]
                         ),
                     )
 
@@ -177,10 +165,67 @@ class OpenAIAgentExecutor(AgentExecutor):
             await task_updater.add_artifact(error_parts)
             await task_updater.complete()
 
+    async def _call_tool(self, tool_call) -> tuple[str, float]:
+        """Execute a tool call, returning its serialized result and latency."""
+        function_name = tool_call.function.name
+        start = time.perf_counter()
+        # A failing call is reported to the model instead of failing the
+        # whole turn, the other tool calls of the turn still get a result.
+        try:
+            function_args = json.loads(tool_call.function.arguments)
+            logger.debug(
+                f'Calling function: {function_name} with args: {function_args}'
+            )
+            result = await self._run_tool(function_name, function_args)
+        except Exception as e:
+            logger.error(f'Error calling function {function_name}: {e}')
+            result = {'error': f'Function {function_name} failed: {e!s}'}
+        elapsed = time.perf_counter() - start
+        logger.debug(f'Function {function_name} took {elapsed:.3f}s')
+
+        # Serialize result properly - handle Pydantic models
+        if hasattr(result, 'model_dump'):
+            # It's a Pydantic model, use model_dump() to convert to dict
+            result_json = json.dumps(result.model_dump())
+        elif isinstance(result, dict):
+            # It's a regular dict
+            result_json = json.dumps(result)
+        else:
+            # Convert to string as fallback
+            result_json = str(result)
+        return result_json, elapsed
+
+    async def _run_tool(self, function_name: str, function_args: dict) -> Any:
+        """Run the tool method `function_name` with the given arguments."""
+        if function_name not in self.tools:
+            return {'error': f'Function {function_name} not found'}
+        tool_instance = self.tools[function_name]
+        # Get the method from the instance
+        if not hasattr(tool_instance, function_name):
+            return {
+                'error': f'Method {function_name} not found on tool instance'
+            }
+        method = getattr(tool_instance, function_name)
+        if inspect.iscoroutinefunction(method):
+            return await method(**function_args)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._tool_executor,
+            functools.partial(method, **function_args),
+        )
+
+    def _build_openai_tools(self) -> list[dict[str, Any]]:
+        """Convert the tools to OpenAI format."""
+        openai_tools = []
+        for tool_name, tool_instance in self.tools.items():
+            if hasattr(tool_instance, tool_name):
+                func = getattr(tool_instance, tool_name)
+                # Extract function schema from the method
+                schema = self._extract_function_schema(func)
+                openai_tools.append({'type': 'function', 'function': schema})
+        return openai_tools
+
     def _extract_function_schema(self, func):
         """Extract OpenAI function schema from a Python function"""
-        import inspect
-
         # Get function signature
         sig = inspect.signature(func)
 
@@ -40,12 +40,13 @@ class MissingAPIKeyError(Exception):
 def main(host, port):
     """Starts the Currency Agent server."""
     try:
-        if os.getenv('model_source', 'google') == 'google':
+        model_source = os.getenv('model_source', 'google')
+        if model_source == 'google':
             if not os.getenv('GOOGLE_API_KEY'):
                 raise MissingAPIKeyError(
                     'GOOGLE_API_KEY environment variable not set.'
                 )
-        else:
+        elif model_source != 'fake':
             if not os.getenv('TOOL_LLM_URL'):
                 raise MissingAPIKeyError(
                     'TOOL_LLM_URL environment variable not set.'
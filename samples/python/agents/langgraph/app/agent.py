@@ -3,22 +3,24 @@ import os
 from collections.abc import AsyncIterable
 from typing import Any, Literal
 
-import httpx
-
 from langchain_core.messages import AIMessage, ToolMessage
 from langchain_core.tools import tool
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel
 
+from app.checkpointer import BoundedMemorySaver
+from app.exchange_rates import ExchangeRateError, get_exchange_rate_service
+from app.fake_model import FakeCurrencyChatModel
+
 
-memory = MemorySaver()
+memory = BoundedMemorySaver.from_env()
 
 
 @tool
-def get_exchange_rate(
+async def get_exchange_rate(
     currency_from: str = 'USD',
     currency_to: str = 'EUR',
     currency_date: str = 'latest',
@@ -36,20 +38,11 @@ def get_exchange_rate(
         the request fails.
     """
     try:
-        response = httpx.get(
-            f'https://api.frankfurter.app/{currency_date}',
-            params={'from': currency_from, 'to': currency_to},
+        return await get_exchange_rate_service().convert(
+            currency_from, currency_to, currency_date
         )
-        response.raise_for_status()
-
-        data = response.json()
-        if 'rates' not in data:
-            return {'error': 'Invalid API response format.'}
-        return data
-    except httpx.HTTPError as e:
-        return {'error': f'API request failed: {e}'}
-    except ValueError:
-        return {'error': 'Invalid JSON response from API.'}
+    except ExchangeRateError as e:
+        return {'error': str(e)}
 
 
 class ResponseFormat(BaseModel):
@@ -76,10 +69,13 @@ class CurrencyAgent:
         'Set response status to completed if the request is complete.'
     )
 
-    def __init__(self):
+    def __init__(self, checkpointer: BaseCheckpointSaver | None = None):
         model_source = os.getenv('model_source', 'google')
         if model_source == 'google':
             self.model = ChatGoogleGenerativeAI(model='gemini-2.0-flash')
+        elif model_source == 'fake':
+            # Answers without an LLM, e.g. to load test the agent.
+            self.model = FakeCurrencyChatModel()
         else:
             self.model = ChatOpenAI(
                 model=os.getenv('TOOL_LLM_NAME'),
@@ -92,7 +88,7 @@ class CurrencyAgent:
         self.graph = create_react_agent(
             self.model,
             tools=self.tools,
-            checkpointer=memory,
+            checkpointer=checkpointer or memory,
             prompt=self.SYSTEM_INSTRUCTION,
             response_format=(self.FORMAT_INSTRUCTION, ResponseFormat),
         )
@@ -101,7 +97,9 @@ class CurrencyAgent:
         inputs = {'messages': [('user', query)]}
         config = {'configurable': {'thread_id': context_id}}
 
-        for item in self.graph.stream(inputs, config, stream_mode='values'):
+        async for item in self.graph.astream(
+            inputs, config, stream_mode='values'
+        ):
             message = item['messages'][-1]
             if (
                 isinstance(message, AIMessage)
@@ -120,10 +118,11 @@ class CurrencyAgent:
                     'content': 'Processing the exchange rates..',
                 }
 
-        yield self.get_agent_response(config)
+        yield await self.get_agent_response(config)
 
-    def get_agent_response(self, config):
-        current_state = self.graph.get_state(config)
+    async def get_agent_response(self, config):
+        # Other streams may have spilled the thread since the run ended.
+        current_state = await self.graph.aget_state(config)
         structured_response = current_state.values.get('structured_response')
         if structured_response and isinstance(
             structured_response, ResponseFormat
@@ -0,0 +1,395 @@
+import asyncio
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+logger = logging.getLogger(__name__)
+
+# (thread id, thread, last used) of the threads to write to the disk.
+SpilledThreads = list[tuple[str, dict[str, Any], float]]
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """An in-memory checkpointer that keeps a bounded number of threads.
+
+    The `max_threads` most recently used threads are kept in memory. Older
+    ones are spilled to SQLite at `spill_path` if set, and loaded back when
+    used again, or deleted otherwise. Threads not used for `ttl_seconds`
+    expire in both places.
+
+    A thread is used whenever one of its checkpoints is read or written, so
+    `max_threads` should be above the number of concurrent conversations.
+
+    The async methods, used by the graph when streaming, read and write the
+    spilled threads in a worker thread so that the event loop is not blocked.
+    Evicted threads are written in the background, `flush` waits for them.
+    """
+
+    def __init__(
+        self,
+        max_threads: int = 1000,
+        ttl_seconds: float | None = 3600,
+        spill_path: str | Path | None = None,
+    ):
+        super().__init__()
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        # thread id -> last used, the least recently used first
+        self._last_used: OrderedDict[str, float] = OrderedDict()
+        self._disk: sqlite3.Connection | None = None
+        # Guards the connection, used from the worker threads.
+        self._disk_lock = threading.Lock()
+        # Orders the async reads and writes of spilled threads, so that a
+        # thread is not read back before it has been written.
+        self._spill_lock: asyncio.Lock | None = None
+        self._spill_tasks: set[asyncio.Task] = set()
+        # thread id -> (thread, last used) evicted but not written yet
+        self._spilling: dict[str, tuple[dict[str, Any], float]] = {}
+        if spill_path:
+            Path(spill_path).parent.mkdir(parents=True, exist_ok=True)
+            self._disk = sqlite3.connect(spill_path, check_same_thread=False)
+            self._disk.execute(
+                'CREATE TABLE IF NOT EXISTS threads ('
+                'thread_id TEXT PRIMARY KEY, '
+                'data BLOB NOT NULL, '
+                'last_used REAL NOT NULL)'
+            )
+            self._disk.commit()
+
+    @classmethod
+    def from_env(cls) -> 'BoundedMemorySaver':
+        """Creates a checkpointer configured by CHECKPOINT_* variables."""
+        ttl = float(os.getenv('CHECKPOINT_THREAD_TTL', '3600'))
+        return cls(
+            max_threads=int(os.getenv('CHECKPOINT_MAX_THREADS', '1000')),
+            ttl_seconds=ttl if ttl > 0 else None,
+            spill_path=os.getenv('CHECKPOINT_SPILL_PATH') or None,
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        self._touch(config['configurable']['thread_id'])
+        return super().get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        if config:
+            self._touch(config['configurable']['thread_id'])
+        return super().list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        self._touch(config['configurable']['thread_id'])
+        return super().put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = '',
+    ) -> None:
+        self._touch(config['configurable']['thread_id'])
+        super().put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        self._last_used.pop(thread_id, None)
+        self._spilling.pop(thread_id, None)
+        self._delete_spilled(thread_id)
+
+    async def aget_tuple(
+        self, config: RunnableConfig
+    ) -> CheckpointTuple | None:
+        await self._atouch(config['configurable']['thread_id'])
+        return super().get_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        if config:
+            await self._atouch(config['configurable']['thread_id'])
+        for item in super().list(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        await self._atouch(config['configurable']['thread_id'])
+        return super().put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = '',
+    ) -> None:
+        await self._atouch(config['configurable']['thread_id'])
+        super().put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        self._last_used.pop(thread_id, None)
+        self._spilling.pop(thread_id, None)
+        if self._disk is not None:
+            await asyncio.shield(
+                self._run_spilled(self._delete_spilled, thread_id)
+            )
+
+    async def flush(self) -> None:
+        """Waits until the threads evicted so far are written to disk."""
+        if self._spill_tasks:
+            await asyncio.gather(*self._spill_tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        disk_threads = 0
+        if self._disk is not None:
+            with self._disk_lock:
+                disk_threads = self._disk.execute(
+                    'SELECT COUNT(*) FROM threads'
+                ).fetchone()[0]
+        return {
+            'memory_threads': len(self._last_used),
+            'disk_threads': disk_threads,
+        }
+
+    def _touch(self, thread_id: str) -> None:
+        if thread_id not in self._last_used and self._disk is not None:
+            self._restore(thread_id, self._take_spilled(thread_id))
+        spill, now = self._use(thread_id)
+        if spill:
+            self._write_spilled(spill, now)
+
+    async def _atouch(self, thread_id: str) -> None:
+        # Other streams may evict the thread again before this one resumes.
+        while thread_id not in self._last_used and self._disk is not None:
+            if thread_id in self._spilling:
+                self._restore(thread_id, self._spilling.pop(thread_id))
+            else:
+                await asyncio.shield(
+                    self._run_spilled(self._arestore, thread_id)
+                )
+        spill, now = self._use(thread_id)
+        if spill:
+            for evicted_id, thread, last_used in spill:
+                self._spilling[evicted_id] = (thread, last_used)
+            # Not awaited: the thread must not be evicted before the caller
+            # reads or writes it.
+            self._run_spilled(
+                self._awrite_spilled, [t for t, _, _ in spill], now
+            )
+
+    async def _arestore(self, thread_id: str) -> None:
+        # Another caller may have loaded the thread while this one waited.
+        if thread_id in self._last_used:
+            return
+        if thread_id in self._spilling:
+            spilled = self._spilling.pop(thread_id)
+        else:
+            spilled = await asyncio.to_thread(self._take_spilled, thread_id)
+        self._restore(thread_id, spilled)
+
+    async def _awrite_spilled(
+        self, thread_ids: Sequence[str], now: float
+    ) -> None:
+        # Threads used again since they were evicted are not written.
+        spill = [
+            (thread_id, *self._spilling.pop(thread_id))
+            for thread_id in thread_ids
+            if thread_id in self._spilling
+        ]
+        await asyncio.to_thread(self._write_spilled, spill, now)
+
+    def _run_spilled(self, func: Any, *args: Any) -> asyncio.Task:
+        """Schedules a read or write of the spilled threads.
+
+        They run one at a time, in the order they are scheduled: coroutine
+        functions on the event loop, other functions in a worker thread.
+        """
+        if self._spill_lock is None:
+            self._spill_lock = asyncio.Lock()
+
+        async def run() -> None:
+            async with self._spill_lock:
+                if asyncio.iscoroutinefunction(func):
+                    await func(*args)
+                else:
+                    await asyncio.to_thread(func, *args)
+
+        task = asyncio.ensure_future(run())
+        self._spill_tasks.add(task)
+        task.add_done_callback(self._spilled)
+        return task
+
+    def _spilled(self, task: asyncio.Task) -> None:
+        self._spill_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                'Could not read or write spilled threads',
+                exc_info=task.exception(),
+            )
+
+    def _use(self, thread_id: str) -> tuple[SpilledThreads, float]:
+        """Marks a thread as used, then evicts the threads over the limit.
+
+        Returns:
+            The evicted threads to spill and the current time.
+        """
+        now = time.time()
+        last_used = self._last_used.pop(thread_id, None)
+        if last_used is not None and self._is_expired(last_used, now):
+            super().delete_thread(thread_id)
+        self._last_used[thread_id] = now
+        return self._evict(keep=thread_id), now
+
+    def _is_expired(self, last_used: float, now: float) -> bool:
+        return self.ttl_seconds is not None and (
+            now - last_used >= self.ttl_seconds
+        )
+
+    def _evict(self, keep: str) -> SpilledThreads:
+        """Drops the expired and least recently used threads from memory.
+
+        Returns:
+            The dropped threads to spill, if spilling is enabled.
+        """
+        now = time.time()
+        spill = []
+        # The least recently used threads come first, and `keep` last.
+        while len(self._last_used) > 1:
+            thread_id, last_used = next(iter(self._last_used.items()))
+            if thread_id == keep:
+                break
+            if self._is_expired(last_used, now):
+                super().delete_thread(thread_id)
+            elif len(self._last_used) > self.max_threads:
+                if self._disk is not None:
+                    spill.append((thread_id, self._dump(thread_id), last_used))
+                super().delete_thread(thread_id)
+            else:
+                break
+            del self._last_used[thread_id]
+        return spill
+
+    def _take_spilled(
+        self, thread_id: str
+    ) -> tuple[dict[str, Any], float] | None:
+        """Removes a thread from the disk, returning it and its last use."""
+        with self._disk_lock:
+            row = self._disk.execute(
+                'SELECT data, last_used FROM threads WHERE thread_id = ?',
+                (thread_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._disk.execute(
+                'DELETE FROM threads WHERE thread_id = ?', (thread_id,)
+            )
+            self._disk.commit()
+        return pickle.loads(row[0]), row[1]  # noqa: S301 - from _dump
+
+    def _write_spilled(self, spill: SpilledThreads, now: float) -> None:
+        """Writes spilled threads to the disk and drops the expired ones."""
+        if self._disk is None:
+            return
+        rows = [
+            (thread_id, pickle.dumps(thread), last_used)
+            for thread_id, thread, last_used in spill
+        ]
+        with self._disk_lock:
+            self._disk.executemany(
+                'INSERT OR REPLACE INTO threads VALUES (?, ?, ?)', rows
+            )
+            if self.ttl_seconds is not None:
+                self._disk.execute(
+                    'DELETE FROM threads WHERE last_used <= ?',
+                    (now - self.ttl_seconds,),
+                )
+            self._disk.commit()
+
+    def _delete_spilled(self, thread_id: str) -> None:
+        if self._disk is None:
+            return
+        with self._disk_lock:
+            self._disk.execute(
+                'DELETE FROM threads WHERE thread_id = ?', (thread_id,)
+            )
+            self._disk.commit()
+
+    def _dump(self, thread_id: str) -> dict[str, Any]:
+        # The checkpoints are already serialized by `self.serde`, copying
+        # the containers is enough for them to be pickled later.
+        return {
+            'storage': {
+                ns: dict(checkpoints)
+                for ns, checkpoints in self.storage[thread_id].items()
+            },
+            'writes': {
+                key: dict(value)
+                for key, value in self.writes.items()
+                if key[0] == thread_id
+            },
+            'blobs': {
+                key: value
+                for key, value in self.blobs.items()
+                if key[0] == thread_id
+            },
+        }
+
+    def _restore(
+        self, thread_id: str, spilled: tuple[dict[str, Any], float] | None
+    ) -> None:
+        """Loads a thread taken off the disk back in memory, unless expired.
+
+        The thread counts as in memory afterwards, even if it was not found.
+        """
+        now = time.time()
+        self._last_used[thread_id] = now
+        if spilled is None or self._is_expired(spilled[1], now):
+            return
+        thread = spilled[0]
+        for ns, checkpoints in thread['storage'].items():
+            self.storage[thread_id][ns].update(checkpoints)
+        for key, value in thread['writes'].items():
+            self.writes[key].update(value)
+        self.blobs.update(thread['blobs'])
@@ -0,0 +1,144 @@
+import asyncio
+import datetime
+import os
+import time
+
+from collections import OrderedDict
+from functools import cache
+from typing import Any
+
+import httpx
+
+
+DEFAULT_BASE_URL = 'https://api.frankfurter.app'
+
+
+class ExchangeRateError(Exception):
+    """Raised when an exchange rate cannot be retrieved."""
+
+
+class UnknownCurrencyError(ExchangeRateError):
+    """Raised when a currency is not in the rate table."""
+
+
+class ExchangeRateService:
+    """Converts currencies with cached Frankfurter rate tables.
+
+    One request fetches the table of all the rates for a date, against EUR,
+    and any currency pair is then computed locally as a cross-rate. Tables
+    of past dates never change and are kept until evicted by newer ones,
+    at most `max_tables`; the 'latest' and today's tables are refetched
+    after `latest_ttl` seconds. Concurrent requests for a table being
+    fetched wait for that fetch instead of making their own.
+
+    Each fetch uses its own HTTP client: fetches are rare, and a pooled
+    client would be bound to the event loop it was first used in.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        latest_ttl: float = 300,
+        max_tables: int = 1024,
+        timeout: float = 10.0,
+    ):
+        self.base_url = (
+            base_url or os.getenv('FRANKFURTER_URL', DEFAULT_BASE_URL)
+        ).rstrip('/')
+        self.latest_ttl = latest_ttl
+        self.max_tables = max_tables
+        self.timeout = timeout
+        # date -> (table date, rates against EUR, expiry or None)
+        self._tables: OrderedDict[
+            str, tuple[str, dict[str, float], float | None]
+        ] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.fetches = 0
+
+    async def get_rates(self, date: str = 'latest') -> tuple[str, dict]:
+        """Returns the date and the EUR rates of the table for `date`.
+
+        Raises:
+            ExchangeRateError: If the table cannot be fetched.
+        """
+        entry = self._tables.get(date)
+        if entry is not None and (
+            entry[2] is None or time.monotonic() < entry[2]
+        ):
+            self._tables.move_to_end(date)
+            return entry[0], entry[1]
+
+        task = self._inflight.get(date)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch(date))
+            self._inflight[date] = task
+            task.add_done_callback(lambda t: self._forget(date, t))
+        # All the callers share the result, or the error, of one fetch, and
+        # a caller that is cancelled does not cancel it for the others.
+        return await asyncio.shield(task)
+
+    def _forget(self, date: str, task: asyncio.Task) -> None:
+        if self._inflight.get(date) is task:
+            del self._inflight[date]
+        if not task.cancelled():
+            # Marks the error as retrieved if every caller was cancelled.
+            task.exception()
+
+    async def _fetch(self, date: str) -> tuple[str, dict[str, float]]:
+        self.fetches += 1
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(f'{self.base_url}/{date}')
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError as e:
+            raise ExchangeRateError(f'API request failed: {e}') from e
+        except ValueError as e:
+            raise ExchangeRateError('Invalid JSON response from API.') from e
+        if 'rates' not in data:
+            raise ExchangeRateError('Invalid API response format.')
+
+        rates = {**data['rates'], data.get('base', 'EUR'): 1.0}
+        table_date = data.get('date', date)
+        expires_at = None
+        if date == 'latest' or date >= datetime.date.today().isoformat():
+            expires_at = time.monotonic() + self.latest_ttl
+        self._tables[date] = (table_date, rates, expires_at)
+        self._tables.move_to_end(date)
+        while len(self._tables) > self.max_tables:
+            self._tables.popitem(last=False)
+        return table_date, rates
+
+    async def convert(
+        self,
+        currency_from: str = 'USD',
+        currency_to: str = 'EUR',
+        date: str = 'latest',
+        amount: float = 1.0,
+    ) -> dict[str, Any]:
+        """Returns the rate of a currency pair, in the Frankfurter format.
+
+        Raises:
+            ExchangeRateError: If the rates cannot be fetched.
+            UnknownCurrencyError: If a currency is not in the rate table.
+        """
+        table_date, rates = await self.get_rates(date)
+        currency_from = currency_from.upper()
+        currency_to = currency_to.upper()
+        for currency in (currency_from, currency_to):
+            if currency not in rates:
+                raise UnknownCurrencyError(f'Unknown currency: {currency}')
+        rate = rates[currency_to] / rates[currency_from]
+        return {
+            'amount': amount,
+            'base': currency_from,
+            'date': table_date,
+            # Frankfurter's own precision.
+            'rates': {currency_to: float(f'{amount * rate:.5g}')},
+        }
+
+
+@cache
+def get_exchange_rate_service() -> ExchangeRateService:
+    """Returns the service shared by all conversions of the agent."""
+    return ExchangeRateService()
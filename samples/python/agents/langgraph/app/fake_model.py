@@ -0,0 +1,82 @@
+import asyncio
+import time
+import uuid
+
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+
+
+class FakeCurrencyChatModel(BaseChatModel):
+    """A chat model that answers without an LLM, for tests and load runs.
+
+    Each user message gets a `get_exchange_rate` tool call, and the tool
+    result is answered as a completed conversion. Every call waits `delay`
+    seconds, like a remote model would, without blocking the event loop.
+    """
+
+    delay: float = 0.1
+    currency_from: str = 'USD'
+    currency_to: str = 'EUR'
+
+    @property
+    def _llm_type(self) -> str:
+        return 'fake-currency'
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> 'FakeCurrencyChatModel':
+        return self
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> Runnable:
+        async def respond(messages: Any) -> Any:
+            await asyncio.sleep(self.delay)
+            return schema(status='completed', message=_last_content(messages))
+
+        def respond_sync(messages: Any) -> Any:
+            time.sleep(self.delay)
+            return schema(status='completed', message=_last_content(messages))
+
+        return RunnableLambda(respond_sync, afunc=respond)
+
+    def _respond(self, messages: list[BaseMessage]) -> ChatResult:
+        if messages and isinstance(messages[-1], ToolMessage):
+            message = AIMessage(content=str(messages[-1].content))
+        else:
+            message = AIMessage(
+                content='',
+                tool_calls=[
+                    {
+                        'name': 'get_exchange_rate',
+                        'args': {
+                            'currency_from': self.currency_from,
+                            'currency_to': self.currency_to,
+                        },
+                        'id': uuid.uuid4().hex,
+                    }
+                ],
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        time.sleep(self.delay)
+        return self._respond(messages)
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        await asyncio.sleep(self.delay)
+        return self._respond(messages)
+
+
+def _last_content(messages: Any) -> str:
+    if isinstance(messages, dict):
+        messages = messages.get('messages', [])
+    for message in reversed(messages):
+        content = getattr(message, 'content', None)
+        if content:
+            return str(content)
+    return ''
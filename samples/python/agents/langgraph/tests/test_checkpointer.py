@@ -0,0 +1,94 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from pathlib import Path
+from unittest import mock
+
+from app.agent import CurrencyAgent
+from app.checkpointer import BoundedMemorySaver
+
+
+def rate(currency_from: str, currency_to: str, date: str) -> dict:
+    return {'amount': 1.0, 'base': currency_from, 'rates': {currency_to: 0.9}}
+
+
+class BoundedMemorySaverTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the BoundedMemorySaver with the fake currency model."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.saver = BoundedMemorySaver(
+            max_threads=5, spill_path=Path(tmp.name) / 'threads.sqlite3'
+        )
+        service = mock.Mock()
+        service.convert = mock.AsyncMock(side_effect=rate)
+        patcher = mock.patch(
+            'app.agent.get_exchange_rate_service', return_value=service
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with mock.patch.dict(os.environ, {'model_source': 'fake'}):
+            self.agent = CurrencyAgent(checkpointer=self.saver)
+        self.agent.model.delay = 0.01
+
+    async def ask(self, context_id: str) -> dict:
+        items = [
+            item
+            async for item in self.agent.stream('1 USD in EUR?', context_id)
+        ]
+        return items[-1]
+
+    async def messages(self, context_id: str) -> list:
+        config = {'configurable': {'thread_id': context_id}}
+        state = await self.agent.graph.aget_state(config)
+        return state.values['messages']
+
+    async def test_concurrent_streams_keep_memory_bounded(self) -> None:
+        """Test concurrent conversations past the limit are spilled."""
+        responses = await asyncio.gather(
+            *(self.ask(f'ctx-{i}') for i in range(20))
+        )
+        self.assertTrue(all(r['is_task_complete'] for r in responses))
+        await self.saver.flush()
+        stats = self.saver.stats()
+        self.assertEqual(stats['memory_threads'], 5)
+        self.assertEqual(stats['disk_threads'], 15)
+
+    async def test_spilled_conversation_resumes(self) -> None:
+        """Test a spilled conversation is loaded back with its history."""
+        for i in range(10):
+            await self.ask(f'ctx-{i}')
+        await self.saver.flush()
+        self.assertEqual(self.saver.stats()['disk_threads'], 5)
+        before = len(await self.messages('ctx-0'))
+        await self.ask('ctx-0')
+        self.assertGreater(len(await self.messages('ctx-0')), before)
+
+    async def test_spilling_runs_in_worker_threads(self) -> None:
+        """Test the async methods do not touch the disk on the event loop."""
+        threads = set()
+        take_spilled = self.saver._take_spilled
+        write_spilled = self.saver._write_spilled
+
+        def record(func):
+            def wrapper(*args):
+                threads.add(threading.current_thread())
+                return func(*args)
+
+            return wrapper
+
+        self.saver._take_spilled = record(take_spilled)
+        self.saver._write_spilled = record(write_spilled)
+        await asyncio.gather(*(self.ask(f'ctx-{i}') for i in range(10)))
+        await self.ask('ctx-0')
+        self.assertTrue(threads)
+        self.assertNotIn(threading.main_thread(), threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
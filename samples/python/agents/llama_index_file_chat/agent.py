@@ -1,9 +1,11 @@
+import asyncio
 import base64
 import os
 
 from typing import Any
 
-from llama_cloud_services.parse import LlamaParse
+from agents.llama_index_file_chat.document import ParsedDocument
+from agents.llama_index_file_chat.parsing import DocumentParser, default_parser
 from llama_index.core.llms import ChatMessage
 from llama_index.core.workflow import (
     Context,
@@ -76,17 +78,28 @@ class ParseAndChat(Workflow):
         self,
         timeout: float | None = None,
         verbose: bool = False,
+        retrieval_top_k: int | None = None,
+        retrieval_window: int = 40,
+        parser: DocumentParser | None = None,
         **workflow_kwargs: Any,
     ):
         super().__init__(timeout=timeout, verbose=verbose, **workflow_kwargs)
+        # When set, only the `retrieval_top_k` windows of `retrieval_window`
+        # lines most relevant to the question are sent to the LLM, instead of
+        # the whole document.
+        if retrieval_top_k is None and os.getenv('FILE_CHAT_RETRIEVAL_TOP_K'):
+            retrieval_top_k = int(os.getenv('FILE_CHAT_RETRIEVAL_TOP_K'))
+        self._retrieval_top_k = retrieval_top_k
+        self._retrieval_window = retrieval_window
         self._sllm = GoogleGenAI(
             model='gemini-2.0-flash', api_key=os.getenv('GOOGLE_API_KEY')
         ).as_structured_llm(ChatResponse)
-        self._parser = LlamaParse(api_key=os.getenv('LLAMA_CLOUD_API_KEY'))
+        # Defaults to LlamaParse, with parsed files cached on disk.
+        self._parser = parser or default_parser()
         self._system_prompt_template = """\
 You are a helpful assistant that can answer questions about a document, provide citations, and engage in a conversation.
 
-Here is the document with line numbers:
+Here is the document with line numbers (for long documents, only the excerpts most relevant to the question):
 <document_text>
 {document_text}
 </document_text>
@@ -111,24 +124,14 @@ When citing content from the document:
     @step
     async def parse(self, ctx: Context, ev: ParseEvent) -> ChatEvent:
         ctx.write_event_to_stream(LogEvent(msg='Parsing document...'))
-        results = await self._parser.aparse(
-            base64.b64decode(ev.attachment),
-            extra_info={'file_name': ev.file_name},
+        text = await self._parser.parse(
+            base64.b64decode(ev.attachment), ev.file_name
         )
         ctx.write_event_to_stream(LogEvent(msg='Document parsed successfully.'))
 
-        documents = await results.aget_markdown_documents(split_by_page=False)
-
-        # since we only have one document and are not splitting by page, we can just use the first one
-        document = documents[0]
-
-        # split the document into lines and add line numbers
-        # this will be used for citations
-        document_text = ''
-        for idx, line in enumerate(document.text.split('\n')):
-            document_text += f"<line idx='{idx}'>{line}</line>\n"
-
-        await ctx.set('document_text', document_text)
+        # index the lines of the document, they are numbered in the prompt
+        # and used for citations
+        await ctx.set('document', ParsedDocument.from_text(text))
         return ChatEvent(msg=ev.msg)
 
     @step
@@ -141,11 +144,26 @@ When citing content from the document:
             )
         )
 
-        document_text = await ctx.get('document_text', default='')
-        if document_text:
+        document: ParsedDocument | None = await ctx.get(
+            'document', default=None
+        )
+        if document:
             ctx.write_event_to_stream(
                 LogEvent(msg='Inserting system prompt...')
             )
+            if (
+                self._retrieval_top_k
+                and document.num_lines
+                > self._retrieval_top_k * self._retrieval_window
+            ):
+                document_text = await asyncio.to_thread(
+                    document.retrieve,
+                    event.msg,
+                    self._retrieval_top_k,
+                    self._retrieval_window,
+                )
+            else:
+                document_text = document.annotated()
             input_messages = [
                 ChatMessage(
                     role='system',
@@ -171,24 +189,11 @@ When citing content from the document:
 
         # parse out the citations from the document text
         citations = {}
-        if document_text:
+        if document:
             for citation in response_obj.citations:
                 line_numbers = citation.line_numbers
                 for line_number in line_numbers:
-                    start_idx = document_text.find(
-                        f"<line idx='{line_number}'>"
-                    )
-                    end_idx = document_text.find(
-                        f"<line idx='{line_number + 1}'>"
-                    )
-                    citation_text = (
-                        document_text[
-                            start_idx
-                            + len(f"<line idx='{line_number}'>") : end_idx
-                        ]
-                        .replace('</line>', '')
-                        .strip()
-                    )
+                    citation_text = document.line(line_number).strip()
 
                     if citation.citation_number not in citations:
                         citations[citation.citation_number] = []
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 
@@ -22,6 +23,8 @@ from agents.llama_index_file_chat.agent import (
     LogEvent,
     ParseAndChat,
 )
+from agents.llama_index_file_chat.session_store import SessionStore
+from llama_index.core.workflow import Context
 
 
 logger = logging.getLogger(__name__)
@@ -43,11 +46,12 @@ class LlamaIndexAgentExecutor(AgentExecutor):
     def __init__(
         self,
         agent: ParseAndChat,
+        ctx_states: SessionStore | None = None,
     ):
         self.agent = agent
-        # Store context state by session ID
-        # Ideally, you would use a database or other kv store the context state
-        self.ctx_states: Dict[str, Dict[str, Any]] = {}
+        # Store context state by session ID, bounded in memory and optionally
+        # spilled to SQLite, see SessionStore.from_env
+        self.ctx_states = ctx_states or SessionStore.from_env()
 
     async def execute(
         self,
@@ -66,8 +70,12 @@ class LlamaIndexAgentExecutor(AgentExecutor):
             handler = None
 
             # Check if we have a saved context state for this session
-            print(f'Len of ctx_states: {len(self.ctx_states)}', flush=True)
-            saved_ctx_state = self.ctx_states.get(context_id, None)
+            if logger.isEnabledFor(logging.DEBUG):
+                stats = await asyncio.to_thread(self.ctx_states.stats)
+                logger.debug(f'Session store stats: {stats}')
+            saved_ctx_state = await asyncio.to_thread(
+                self.ctx_states.get, context_id
+            )
 
             if saved_ctx_state is not None:
                 # Resume with existing context
@@ -109,7 +117,9 @@ class LlamaIndexAgentExecutor(AgentExecutor):
                     metadata = {str(k): v for k, v in metadata.items()}
 
                 # save the context state to resume the current session
-                self.ctx_states[context_id] = handler.ctx.to_dict()
+                await asyncio.to_thread(
+                    self.ctx_states.put, context_id, handler.ctx.to_dict()
+                )
 
                 await updater.add_artifact(
                     [Part(root=TextPart(text=content))],
@@ -125,8 +135,7 @@ class LlamaIndexAgentExecutor(AgentExecutor):
             logger.error(traceback.format_exc())
 
             # Clean up context in case of error
-            if context_id in self.ctx_states:
-                del self.ctx_states[context_id]
+            await asyncio.to_thread(self.ctx_states.delete, context_id)
             raise ServerError(
                 error=InternalError(
                     message=f'An error occurred while streaming the response: {e}'
@@ -0,0 +1,93 @@
+import math
+import re
+
+from collections import Counter
+
+from pydantic import BaseModel
+
+
+_TOKEN_RE = re.compile(r'\w{2,}')
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class ParsedDocument(BaseModel):
+    """A parsed document with the offset of each line, for line citations.
+
+    `line_offsets[i]` is the position in `text` where line `i` starts, so a
+    cited line is sliced out of the text in constant time.
+    """
+
+    text: str
+    line_offsets: list[int]
+
+    @classmethod
+    def from_text(cls, text: str) -> 'ParsedDocument':
+        offsets = [0]
+        offsets.extend(match.end() for match in re.finditer('\n', text))
+        return cls(text=text, line_offsets=offsets)
+
+    @property
+    def num_lines(self) -> int:
+        return len(self.line_offsets)
+
+    def line(self, idx: int) -> str:
+        """Returns line `idx`, or '' if there is no such line."""
+        if not 0 <= idx < self.num_lines:
+            return ''
+        start = self.line_offsets[idx]
+        if idx + 1 < self.num_lines:
+            return self.text[start : self.line_offsets[idx + 1] - 1]
+        return self.text[start:]
+
+    def _span(self, start: int, end: int) -> str:
+        if end >= self.num_lines:
+            return self.text[self.line_offsets[start] :]
+        return self.text[self.line_offsets[start] : self.line_offsets[end]]
+
+    def annotated(self, start: int = 0, end: int | None = None) -> str:
+        """Returns lines [start, end) wrapped in `<line idx='...'>` tags."""
+        end = self.num_lines if end is None else min(end, self.num_lines)
+        return ''.join(
+            f"<line idx='{idx}'>{self.line(idx)}</line>\n"
+            for idx in range(start, end)
+        )
+
+    def retrieve(self, query: str, top_k: int, window: int) -> str:
+        """Returns the `top_k` windows of `window` lines most relevant to the
+        query, annotated and in document order.
+
+        Windows are ranked by the TF-IDF weight of the query terms they
+        contain; ties, e.g. for a query without any matching term, go to the
+        earliest windows. This tokenizes the whole document, so run it off
+        the event loop.
+        """
+        window_terms = [
+            Counter(_tokenize(self._span(start, start + window)))
+            for start in range(0, self.num_lines, window)
+        ]
+
+        query_terms = set(_tokenize(query))
+        idf = {
+            term: math.log(
+                len(window_terms)
+                / (1 + sum(term in terms for terms in window_terms))
+            )
+            + 1
+            for term in query_terms
+        }
+        scores = [
+            sum(
+                (1 + math.log(terms[term])) * weight
+                for term, weight in idf.items()
+                if term in terms
+            )
+            for terms in window_terms
+        ]
+        best = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+        return '...\n'.join(
+            self.annotated(i * window, (i + 1) * window)
+            for i in sorted(best[:top_k])
+        )
@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from llama_cloud_services.parse import LlamaParse
+
+
+class DocumentParser(ABC):
+    """Converts an uploaded file to markdown text."""
+
+    @abstractmethod
+    async def parse(self, data: bytes, file_name: str | None) -> str:
+        """Parses the file content and returns its text as markdown."""
+
+
+class LlamaParseParser(DocumentParser):
+    """Parses documents with LlamaParse."""
+
+    def __init__(self, api_key: str | None = None):
+        self._parser = LlamaParse(
+            api_key=api_key or os.getenv('LLAMA_CLOUD_API_KEY')
+        )
+
+    async def parse(self, data: bytes, file_name: str | None) -> str:
+        results = await self._parser.aparse(
+            data, extra_info={'file_name': file_name}
+        )
+        documents = await results.aget_markdown_documents(split_by_page=False)
+        # since we only have one document and are not splitting by page, we
+        # can just use the first one
+        return documents[0].text
+
+
+class ParseCache:
+    """Parsed documents stored in SQLite, keyed by the SHA-256 of the file.
+
+    The texts are stored compressed. Once they take more than `max_bytes`,
+    the least recently used ones are evicted. The cache is shared by all the
+    sessions, and survives restarts.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 256 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS parses ('
+            'sha256 TEXT PRIMARY KEY, '
+            'text BLOB NOT NULL, '
+            'size INTEGER NOT NULL, '
+            'last_access REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_parses_last_access '
+            'ON parses (last_access)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT text FROM parses WHERE sha256 = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                'UPDATE parses SET last_access = ? WHERE sha256 = ?',
+                (time.time(), key),
+            )
+            self._conn.commit()
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def put(self, key: str, text: str) -> None:
+        blob = zlib.compress(text.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO parses VALUES (?, ?, ?, ?)',
+                (key, blob, len(blob), time.time()),
+            )
+            total = self._conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM parses'
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._conn.execute(
+                    'SELECT sha256, size FROM parses ORDER BY last_access'
+                ).fetchall()
+                evicted = []
+                for sha256, size in rows:
+                    if total <= self.max_bytes or sha256 == key:
+                        break
+                    evicted.append((sha256,))
+                    total -= size
+                self._conn.executemany(
+                    'DELETE FROM parses WHERE sha256 = ?', evicted
+                )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingParser(DocumentParser):
+    """Wraps a parser so that a file already parsed is not parsed again."""
+
+    def __init__(self, parser: DocumentParser, cache: ParseCache):
+        self.parser = parser
+        self.cache = cache
+
+    async def parse(self, data: bytes, file_name: str | None) -> str:
+        key = ParseCache.key(data)
+        text = await asyncio.to_thread(self.cache.get, key)
+        if text is None:
+            text = await self.parser.parse(data, file_name)
+            await asyncio.to_thread(self.cache.put, key, text)
+        return text
+
+
+def default_parser() -> DocumentParser:
+    """Returns LlamaParse behind the parse cache, unless it is disabled.
+
+    The cache is stored at FILE_CHAT_PARSE_CACHE (default
+    ~/.cache/a2a-file-chat/parses.sqlite3), set it to an empty string to
+    disable it. FILE_CHAT_PARSE_CACHE_MAX_MB bounds its size (default 256).
+    """
+    parser = LlamaParseParser()
+    path = os.getenv(
+        'FILE_CHAT_PARSE_CACHE',
+        str(Path.home() / '.cache' / 'a2a-file-chat' / 'parses.sqlite3'),
+    )
+    if not path:
+        return parser
+    max_mb = int(os.getenv('FILE_CHAT_PARSE_CACHE_MAX_MB', '256'))
+    return CachingParser(parser, ParseCache(path, max_mb * 1024 * 1024))
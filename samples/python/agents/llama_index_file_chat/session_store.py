@@ -0,0 +1,178 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+class SessionStore:
+    """Stores the serialized workflow context of each chat session.
+
+    Contexts are kept as compressed JSON. The `max_sessions` most recently
+    used ones stay in memory; older ones are spilled to SQLite at
+    `spill_path` if set, dropped otherwise. Sessions not used for
+    `ttl_seconds` expire.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 128,
+        ttl_seconds: float | None = 3600,
+        spill_path: str | Path | None = None,
+        compress_level: int = 6,
+    ):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        # context id -> (compressed state, last used)
+        self._memory: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.spilled = 0
+        self.dropped = 0
+        self._disk: sqlite3.Connection | None = None
+        if spill_path:
+            Path(spill_path).parent.mkdir(parents=True, exist_ok=True)
+            self._disk = sqlite3.connect(spill_path, check_same_thread=False)
+            self._disk.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                'context_id TEXT PRIMARY KEY, '
+                'state BLOB NOT NULL, '
+                'last_used REAL NOT NULL)'
+            )
+            self._disk.commit()
+
+    @classmethod
+    def from_env(cls) -> 'SessionStore':
+        """Creates a store configured by the FILE_CHAT_SESSION_* variables."""
+        ttl = float(os.getenv('FILE_CHAT_SESSION_TTL', '3600'))
+        return cls(
+            max_sessions=int(os.getenv('FILE_CHAT_SESSION_MAX', '128')),
+            ttl_seconds=ttl if ttl > 0 else None,
+            spill_path=os.getenv('FILE_CHAT_SESSION_SPILL_PATH') or None,
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory) + self._disk_count()
+
+    def _is_expired(self, last_used: float, now: float) -> bool:
+        return self.ttl_seconds is not None and (
+            now - last_used >= self.ttl_seconds
+        )
+
+    def get(self, context_id: str) -> dict[str, Any] | None:
+        """Returns the saved context of a session, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.pop(context_id, None)
+            if entry is not None:
+                self._memory_bytes -= len(entry[0])
+            elif self._disk is not None:
+                entry = self._disk.execute(
+                    'SELECT state, last_used FROM sessions '
+                    'WHERE context_id = ?',
+                    (context_id,),
+                ).fetchone()
+                if entry is not None:
+                    self._disk.execute(
+                        'DELETE FROM sessions WHERE context_id = ?',
+                        (context_id,),
+                    )
+                    self._disk.commit()
+            if entry is None or self._is_expired(entry[1], now):
+                self.expired += entry is not None
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Back to the memory tier as the most recently used session.
+            self._insert(context_id, entry[0], now)
+        return json.loads(zlib.decompress(entry[0]))
+
+    def put(self, context_id: str, state: dict[str, Any]) -> None:
+        """Saves the context of a session."""
+        blob = zlib.compress(
+            json.dumps(state).encode('utf-8'), self.compress_level
+        )
+        now = time.time()
+        with self._lock:
+            entry = self._memory.pop(context_id, None)
+            if entry is not None:
+                self._memory_bytes -= len(entry[0])
+            self._insert(context_id, blob, now)
+            self._purge_expired(now)
+
+    def delete(self, context_id: str) -> None:
+        with self._lock:
+            entry = self._memory.pop(context_id, None)
+            if entry is not None:
+                self._memory_bytes -= len(entry[0])
+            if self._disk is not None:
+                self._disk.execute(
+                    'DELETE FROM sessions WHERE context_id = ?', (context_id,)
+                )
+                self._disk.commit()
+
+    def _insert(self, context_id: str, blob: bytes, now: float) -> None:
+        self._memory[context_id] = (blob, now)
+        self._memory_bytes += len(blob)
+        spill = []
+        while len(self._memory) > self.max_sessions:
+            cold_id, (cold_blob, last_used) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(cold_blob)
+            if self._disk is not None:
+                spill.append((cold_id, cold_blob, last_used))
+            else:
+                self.dropped += 1
+        if spill:
+            self._disk.executemany(
+                'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)', spill
+            )
+            self._disk.commit()
+            self.spilled += len(spill)
+
+    def _purge_expired(self, now: float) -> None:
+        if self.ttl_seconds is None:
+            return
+        # The memory tier is ordered by last use, the oldest first.
+        while self._memory:
+            context_id, (blob, last_used) = next(iter(self._memory.items()))
+            if not self._is_expired(last_used, now):
+                break
+            del self._memory[context_id]
+            self._memory_bytes -= len(blob)
+            self.expired += 1
+        if self._disk is not None:
+            cursor = self._disk.execute(
+                'DELETE FROM sessions WHERE last_used <= ?',
+                (now - self.ttl_seconds,),
+            )
+            self.expired += cursor.rowcount
+            self._disk.commit()
+
+    def _disk_count(self) -> int:
+        if self._disk is None:
+            return 0
+        row = self._disk.execute('SELECT COUNT(*) FROM sessions').fetchone()
+        return row[0]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'memory_sessions': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_sessions': self._disk_count(),
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'spilled': self.spilled,
+                'dropped': self.dropped,
+            }
@@ -6,29 +6,267 @@ business logic.
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
 import uuid
 
-from a2a.client import ClientConfig, ClientFactory, minimal_agent_card
+from collections import OrderedDict
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
+
+from a2a.client import Client, ClientConfig, ClientFactory, minimal_agent_card
 from a2a.client.client_task_manager import ClientTaskManager
-from a2a.types import Message, Role, Task, TaskIdParams, TextPart
+from a2a.types import (
+    Message,
+    Role,
+    Task,
+    TaskIdParams,
+    TaskState,
+    TextPart,
+)
 from a2a.utils.message import get_message_text
 
 
 __all__ = [
+    'A2ASession',
     'cancel_task',
     'extract_text',
+    'get_session',
     'send_followup',
     'send_text',
     'send_text_async',
 ]
 
+T = TypeVar('T')
+
 
 # ---------------------------------------------------------------------------
 # Client helpers (Bob et al.)
 # ---------------------------------------------------------------------------
 
 
-_client_factory = ClientFactory(ClientConfig())
+_TERMINAL_STATES = {
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+}
+
+
+class A2ASession:
+    """Long-lived client state shared by every call to the peer agents.
+
+    A single event loop runs in a background thread for the lifetime of the
+    session, with one pooled HTTP client and one A2A client per peer port, so
+    consecutive messages reuse the same TCP connection instead of creating a
+    new loop, client and connection each time. The ``ClientTaskManager`` of a
+    task is kept until the task reaches a terminal state and reused by its
+    follow-up messages; at most ``max_tasks`` are kept, tasks left waiting for
+    input the longest are forgotten first.
+
+    The sync methods block the calling thread until the call completes; the
+    ``*_async`` methods can be awaited from any event loop.
+    """
+
+    def __init__(self, host: str = 'localhost', max_tasks: int = 1024) -> None:
+        self.host = host
+        self.max_tasks = max_tasks
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._httpx_client: httpx.AsyncClient | None = None
+        self._clients: dict[int, Client] = {}
+        # task id -> task manager, least recently used first
+        self._task_managers: OrderedDict[str, ClientTaskManager] = OrderedDict()
+
+    # -- event loop ------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='a2a-session',
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                'Sync A2ASession calls cannot be made from the session loop; '
+                'await the *_async variant instead.'
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, loop)
+        )
+
+    # -- clients ---------------------------------------------------------
+
+    def _client(self, port: int) -> Client:
+        """Return the A2A client for *port*, created on first use."""
+        client = self._clients.get(port)
+        if client is None:
+            if self._httpx_client is None:
+                self._httpx_client = httpx.AsyncClient()
+            factory = ClientFactory(
+                ClientConfig(httpx_client=self._httpx_client)
+            )
+            client = factory.create(
+                minimal_agent_card(f'http://{self.host}:{port}/a2a/v1')
+            )
+            self._clients[port] = client
+        return client
+
+    async def _send_text(
+        self,
+        port: int,
+        text: str,
+        *,
+        context_id: str | None = None,
+        reference_task_ids: list[str] | None = None,
+        task_id: str | None = None,
+    ) -> Task | Message:
+        msg = Message(
+            kind='message',
+            role=Role.user,
+            message_id=uuid.uuid4().hex,
+            context_id=context_id,
+            reference_task_ids=reference_task_ids or [],
+            parts=[TextPart(text=text)],
+            task_id=task_id,
+        )
+
+        task_manager = self._task_managers.get(task_id) if task_id else None
+        last_message: Message | None = None
+
+        async for event in self._client(port).send_message(msg):  # type: ignore[attr-defined]
+            # Unwrap tuple from transport implementations
+            if isinstance(event, tuple):
+                event = event[0]
+            if isinstance(event, Message):
+                last_message = event
+                continue
+            # A full Task snapshot replaces whatever was aggregated so far.
+            if task_manager is None or (
+                isinstance(event, Task) and task_manager.get_task()
+            ):
+                task_manager = ClientTaskManager()
+            # Let the SDK task manager handle state aggregation
+            await task_manager.process(event)
+
+        task = task_manager.get_task() if task_manager else None
+        if task:
+            if task.status.state in _TERMINAL_STATES:
+                self._task_managers.pop(task.id, None)
+            else:
+                self._task_managers[task.id] = task_manager
+                self._task_managers.move_to_end(task.id)
+                while len(self._task_managers) > self.max_tasks:
+                    self._task_managers.popitem(last=False)
+            return task
+        if last_message is not None:
+            return last_message
+        raise RuntimeError('No response from agent')
+
+    async def _cancel_task(self, port: int, task_id: str) -> None:
+        self._task_managers.pop(task_id, None)
+        await self._client(port).cancel_task(TaskIdParams(id=task_id))
+
+    async def _aclose(self) -> None:
+        self._clients.clear()
+        self._task_managers.clear()
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
+
+    # -- public API ------------------------------------------------------
+
+    async def send_text_async(
+        self,
+        port: int,
+        text: str,
+        *,
+        context_id: str | None = None,
+        reference_task_ids: list[str] | None = None,
+        task_id: str | None = None,
+    ) -> Task | Message:
+        """Send *text* to the agent on *port*; see :func:`send_text_async`."""
+        return await self._run_async(
+            self._send_text(
+                port,
+                text,
+                context_id=context_id,
+                reference_task_ids=reference_task_ids,
+                task_id=task_id,
+            )
+        )
+
+    def send_text(
+        self,
+        port: int,
+        text: str,
+        *,
+        context_id: str | None = None,
+        reference_task_ids: list[str] | None = None,
+        task_id: str | None = None,
+    ) -> Task | Message:
+        """Blocking variant of :meth:`send_text_async`."""
+        return self._run(
+            self._send_text(
+                port,
+                text,
+                context_id=context_id,
+                reference_task_ids=reference_task_ids,
+                task_id=task_id,
+            )
+        )
+
+    async def cancel_task_async(self, port: int, task_id: str) -> None:
+        """Request cancellation of *task_id* on the agent on *port*."""
+        await self._run_async(self._cancel_task(port, task_id))
+
+    def cancel_task(self, port: int, task_id: str) -> None:
+        """Blocking variant of :meth:`cancel_task_async`."""
+        self._run(self._cancel_task(port, task_id))
+
+    def close(self) -> None:
+        """Close the pooled connections and stop the session loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_session: A2ASession | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> A2ASession:
+    """Return the process-wide :class:`A2ASession`, creating it on first use."""
+    global _session  # noqa: PLW0603
+    with _session_lock:
+        if _session is None:
+            _session = A2ASession()
+            atexit.register(_session.close)
+        return _session
 
 
 async def send_text_async(
@@ -52,38 +290,14 @@ async def send_text_async(
         Union[Task, Message]: The final object produced by the agent—normally a
         ``Task`` but may be a plain ``Message`` for very small interactions.
     """
-    client = _client_factory.create(
-        minimal_agent_card(f'http://localhost:{port}/a2a/v1')
-    )
-    msg = Message(
-        kind='message',
-        role=Role.user,
-        message_id=uuid.uuid4().hex,
+    return await get_session().send_text_async(
+        port,
+        text,
         context_id=context_id,
-        reference_task_ids=reference_task_ids or [],
-        parts=[TextPart(text=text)],
+        reference_task_ids=reference_task_ids,
         task_id=task_id,
     )
 
-    task_manager = ClientTaskManager()
-    last_message: Message | None = None
-
-    async for event in client.send_message(msg):  # type: ignore[attr-defined]
-        # Unwrap tuple from transport implementations
-        if isinstance(event, tuple):
-            event = event[0]
-        # Let the SDK task manager handle state aggregation
-        await task_manager.process(event)
-        if isinstance(event, Message):
-            last_message = event
-
-    task = task_manager.get_task()
-    if task:
-        return task
-    if last_message is not None:
-        return last_message
-    raise RuntimeError('No response from agent')
-
 
 def send_text(
     port: int,
@@ -93,11 +307,11 @@ def send_text(
     reference_task_ids: list[str] | None = None,
     task_id: str | None = None,
 ):
-    """Synchronous helper that delegates to :func:`send_text_async`.
+    """Synchronous helper that delegates to the shared :class:`A2ASession`.
 
-    The helper transparently detects whether the caller is already running
-    inside an event loop (e.g. inside a Jupyter notebook or another async
-    framework) and chooses the appropriate execution strategy.
+    The call runs on the session's own event loop, so it also works when the
+    caller is already running inside an event loop (e.g. inside a Jupyter
+    notebook or another async framework).
 
     Args:
         port: TCP port where the target agent is listening.
@@ -109,30 +323,13 @@ def send_text(
     Returns:
         Union[Task, Message]: See :func:`send_text_async`.
     """
-    try:
-        return asyncio.run(
-            send_text_async(
-                port,
-                text,
-                context_id=context_id,
-                reference_task_ids=reference_task_ids,
-                task_id=task_id,
-            )
-        )
-    except RuntimeError:
-        # Fallback when called from within an existing running loop (e.g. Jupyter)
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            return loop.run_until_complete(
-                send_text_async(
-                    port,
-                    text,
-                    context_id=context_id,
-                    reference_task_ids=reference_task_ids,
-                    task_id=task_id,
-                )
-            )
-        raise
+    return get_session().send_text(
+        port,
+        text,
+        context_id=context_id,
+        reference_task_ids=reference_task_ids,
+        task_id=task_id,
+    )
 
 
 def send_followup(
@@ -171,31 +368,17 @@ def send_followup(
 # ---------------------------------------------------------------------------
 
 
-async def _cancel_task_async(port: int, task_id: str) -> None:
-    client = _client_factory.create(
-        minimal_agent_card(f'http://localhost:{port}/a2a/v1')
-    )
-    await client.cancel_task(TaskIdParams(id=task_id))
-
-
 def cancel_task(port: int, task_id: str) -> None:
     """Synchronously request cancellation of *task_id* on the remote agent.
 
-    The wrapper executes :func:`_cancel_task_async` while handling the common
-    case where the caller might already sit inside an event loop.
+    The request runs on the shared :class:`A2ASession` loop, so the caller may
+    already sit inside an event loop.
 
     Args:
         port: TCP port where the target agent is reachable.
         task_id: Identifier of the task to cancel.
     """
-    try:
-        asyncio.run(_cancel_task_async(port, task_id))
-    except RuntimeError:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            loop.run_until_complete(_cancel_task_async(port, task_id))
-        else:
-            raise
+    get_session().cancel_task(port, task_id)
 
 
 # ---------------------------------------------------------------------------
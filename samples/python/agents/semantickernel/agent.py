@@ -6,9 +6,8 @@ from collections.abc import AsyncIterable
 from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-import httpx
-
 from dotenv import load_dotenv
+from exchange_rates import UnknownCurrencyError, get_exchange_rate_service
 from pydantic import BaseModel
 from semantic_kernel.agents import ChatCompletionAgent, ChatHistoryAgentThread
 from semantic_kernel.connectors.ai.open_ai import (
@@ -105,7 +104,7 @@ class CurrencyPlugin:
     @kernel_function(
         description='Retrieves exchange rate between currency_from and currency_to using Frankfurter API'
     )
-    def get_exchange_rate(
+    async def get_exchange_rate(
         self,
         currency_from: Annotated[
             str, 'Currency code to convert from, e.g. USD'
@@ -116,19 +115,17 @@ class CurrencyPlugin:
         date: Annotated[str, "Date or 'latest'"] = 'latest',
     ) -> str:
         try:
-            response = httpx.get(
-                f'https://api.frankfurter.app/{date}',
-                params={'from': currency_from, 'to': currency_to},
-                timeout=10.0,
+            data = await get_exchange_rate_service().convert(
+                currency_from, currency_to, date
+            )
+        except UnknownCurrencyError:
+            return (
+                f'Could not retrieve rate for {currency_from} to {currency_to}'
             )
-            response.raise_for_status()
-            data = response.json()
-            if 'rates' not in data or currency_to not in data['rates']:
-                return f'Could not retrieve rate for {currency_from} to {currency_to}'
-            rate = data['rates'][currency_to]
-            return f'1 {currency_from} = {rate} {currency_to}'
         except Exception as e:
             return f'Currency API call failed: {e!s}'
+        rate = data['rates'][currency_to.upper()]
+        return f'1 {currency_from} = {rate} {currency_to}'
 
 
 # endregion
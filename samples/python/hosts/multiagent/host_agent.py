@@ -58,7 +58,9 @@ class HostAgent:
         self.client_factory = client_factory
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
-        self.agents: str = ''
+        # agent name -> JSON line describing it in the root instruction
+        self._agent_lines: dict[str, str] = {}
+        self._agents: str | None = ''
         loop = asyncio.get_running_loop()
         loop.create_task(
             self.init_remote_agent_addresses(remote_agent_addresses)
@@ -83,10 +85,30 @@ class HostAgent:
         remote_connection = RemoteAgentConnections(self.client_factory, card)
         self.remote_agent_connections[card.name] = remote_connection
         self.cards[card.name] = card
-        agent_info = []
-        for ra in self.list_remote_agents():
-            agent_info.append(json.dumps(ra))
-        self.agents = '\n'.join(agent_info)
+        # Only this agent's entry is serialised; the full list is joined
+        # lazily the next time the instruction is rendered.
+        self._agent_lines[card.name] = json.dumps(
+            {'name': card.name, 'description': card.description}
+        )
+        self._agents = None
+
+    def unregister_agent_card(self, name: str):
+        self.remote_agent_connections.pop(name, None)
+        self.cards.pop(name, None)
+        self._agent_lines.pop(name, None)
+        self._agents = None
+
+    @property
+    def agents(self) -> str:
+        """The remote agents, one JSON object per line, for the instruction.
+
+        The root instruction is rendered on every model call, so the
+        ADK `Agent` built by `create_agent` always sees the current list and
+        does not need to be rebuilt when agents are registered.
+        """
+        if self._agents is None:
+            self._agents = '\n'.join(self._agent_lines.values())
+        return self._agents
 
     def create_agent(self) -> Agent:
         LITELLM_MODEL = os.getenv(